@@ -39,6 +39,11 @@ class GerenciadorAnimacoes:
             self.jogo.indice_exploracao += 1
             
             if self.jogo.indice_exploracao >= len(self.jogo.caminhos_explorados):
+                if self.jogo.busca_em_andamento is not None:
+                    # A animação alcançou a busca: aguarda o próximo lote de expansões
+                    self.jogo.indice_exploracao = len(self.jogo.caminhos_explorados)
+                    return False
+                
                 self.jogo.mostrar_exploracao = False
                 
                 if self.jogo.caminho_encontrado:
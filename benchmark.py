@@ -0,0 +1,413 @@
+"""
+Benchmark dos algoritmos de pathfinding: BFS em labirintos de corredor longo
+e A* nos labirintos incluídos e em salas abertas, além de uma suíte com
+todos os algoritmos do GerenciadorPathfinding (incluindo labirintos gerados
+por gerador_labirinto com semente fixa) e saída em JSON
+Uso: python benchmark.py [tamanho ...]
+     python benchmark.py --suite [tamanho ...] [--json saida.json] [--base anterior.json]
+"""
+import os
+import sys
+import glob
+import json
+import math
+import time
+import heapq
+import platform
+import argparse
+import statistics
+import tracemalloc
+from datetime import datetime
+from collections import deque
+
+from labirinto import GerenciadorLabirinto, GradeLabirinto
+from gerador_labirinto import GeradorLabirinto
+from pathfinding import AlgoritmoAStar, AlgoritmoBFSPredecessores, GerenciadorPathfinding, HeapBinario, HeapRadix
+
+TAMANHOS_PADRAO = [41, 81, 121, 161]
+TAMANHOS_SUITE = [64, 128, 256, 512]  # 1024, 2048 e 4096 podem ser passados na linha de comando
+LIMIAR_REGRESSAO = 0.10               # Variação relativa considerada regressão
+TEMPO_MINIMO_REGRESSAO = 0.0005       # Diferenças de tempo abaixo disso (s) são ruído
+SEMENTE_SUITE = 2024                  # Semente dos labirintos procedurais da suíte
+
+def gerar_labirinto_corredor(tamanho):
+    """
+    Gera um labirinto em serpentina: um único corredor que percorre todas as
+    linhas, o pior caso para o comprimento do caminho (~tamanho²/2 passos).
+    """
+    labirinto = [[1] * tamanho for _ in range(tamanho)]
+    
+    for y in range(1, tamanho - 1, 2):
+        for x in range(1, tamanho - 1):
+            labirinto[y][x] = 0
+        
+        # Abertura para a próxima linha, alternando entre direita e esquerda
+        if y + 2 < tamanho - 1:
+            x_abertura = tamanho - 2 if (y // 2) % 2 == 0 else 1
+            labirinto[y + 1][x_abertura] = 0
+    
+    ultima_linha = (tamanho - 2) if (tamanho - 2) % 2 == 1 else (tamanho - 3)
+    x_saida = tamanho - 2 if (ultima_linha // 2) % 2 == 0 else 1
+    labirinto[1][1] = 'm'
+    labirinto[ultima_linha][x_saida] = 'e'
+    return labirinto
+
+def gerar_labirinto_sala(tamanho):
+    """
+    Gera uma sala aberta cortada por uma parede central com uma única
+    passagem na borda: grandes platôs de f igual para o A*.
+    """
+    labirinto = [[0] * tamanho for _ in range(tamanho)]
+    for y in range(1, tamanho):
+        labirinto[y][tamanho // 2] = 1
+    labirinto[tamanho // 2][0] = 'm'
+    labirinto[tamanho // 2][tamanho - 1] = 'e'
+    return labirinto
+
+def bfs_copiando_caminho(labirinto, inicio, fim):
+    """
+    Referência: BFS anterior, que enfileira uma cópia do caminho para cada nó.
+    Mantida aqui apenas para comparação.
+    """
+    queue = deque([(inicio, [inicio])])
+    visitados = set()
+    caminhos_explorados = []
+    
+    while queue:
+        (x, y), caminho = queue.popleft()
+        
+        if (x, y) in visitados:
+            continue
+        
+        visitados.add((x, y))
+        caminhos_explorados.append((x, y))
+        
+        if (x, y) == fim:
+            return caminho, caminhos_explorados, {'caminho_encontrado': True}
+        
+        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) not in visitados and GerenciadorLabirinto.eh_posicao_valida(nx, ny, labirinto):
+                queue.append(((nx, ny), caminho + [(nx, ny)]))
+    
+    return [], caminhos_explorados, {'caminho_encontrado': False}
+
+def a_star_referencia(labirinto, inicio, fim):
+    """
+    Referência: A* anterior, com nós (x, y), dicionários g_score/f_score e
+    desempate pela tupla de coordenadas. Mantido aqui apenas para comparação.
+    """
+    open_set = [(AlgoritmoAStar.heuristica_manhattan(inicio, fim), inicio)]
+    came_from = {}
+    g_score = {inicio: 0}
+    f_score = {inicio: AlgoritmoAStar.heuristica_manhattan(inicio, fim)}
+    visitados = set()
+    caminhos_explorados = []
+    
+    while open_set:
+        _, atual = heapq.heappop(open_set)
+        if atual in visitados:
+            continue
+        
+        visitados.add(atual)
+        caminhos_explorados.append(atual)
+        
+        if atual == fim:
+            return AlgoritmoAStar.reconstruir_caminho(came_from, atual), caminhos_explorados, {}
+        
+        for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+            vizinho = (atual[0] + dx, atual[1] + dy)
+            if not GerenciadorLabirinto.eh_posicao_valida(vizinho[0], vizinho[1], labirinto):
+                continue
+            
+            tentative_g_score = g_score[atual] + 1
+            if vizinho not in g_score or tentative_g_score < g_score[vizinho]:
+                came_from[vizinho] = atual
+                g_score[vizinho] = tentative_g_score
+                f_score[vizinho] = tentative_g_score + AlgoritmoAStar.heuristica_manhattan(vizinho, fim)
+                if vizinho not in visitados:
+                    heapq.heappush(open_set, (f_score[vizinho], vizinho))
+    
+    return [], caminhos_explorados, {}
+
+def medir(funcao, labirinto, inicio, fim):
+    """Mede tempo (sem tracemalloc) e pico de memória (com tracemalloc) de uma busca"""
+    inicio_tempo = time.perf_counter()
+    caminho, _, _ = funcao(labirinto, inicio, fim)
+    tempo = time.perf_counter() - inicio_tempo
+    
+    tracemalloc.start()
+    funcao(labirinto, inicio, fim)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {'tempo': tempo, 'memoria_pico': pico, 'tamanho_caminho': len(caminho)}
+
+def executar(tamanhos):
+    """Compara a BFS com cópia de caminho e a BFS com predecessores"""
+    algoritmos = [
+        ("BFS (cópia de caminho)", bfs_copiando_caminho),
+        ("BFS (predecessores)", AlgoritmoBFSPredecessores.busca),
+    ]
+    
+    print(f"{'Tamanho':>9} | {'Algoritmo':<24} | {'Caminho':>8} | {'Tempo (s)':>10} | {'Pico (KiB)':>11}")
+    print("-" * 75)
+    
+    for tamanho in tamanhos:
+        labirinto = gerar_labirinto_corredor(tamanho)
+        inicio = GerenciadorLabirinto.encontrar_posicao_inicial(labirinto)
+        fim = GerenciadorLabirinto.encontrar_posicao_saida(labirinto)
+        
+        for nome, funcao in algoritmos:
+            resultado = medir(funcao, labirinto, inicio, fim)
+            print(f"{tamanho:>4}x{tamanho:<4} | {nome:<24} | {resultado['tamanho_caminho']:>8} | "
+                  f"{resultado['tempo']:>10.4f} | {resultado['memoria_pico'] / 1024:>11.1f}")
+
+def carregar_labirintos_incluidos():
+    """Lista de (nome do arquivo, labirinto) da pasta labirintos/"""
+    labirintos = []
+    pasta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "labirintos")
+    for arquivo in sorted(glob.glob(os.path.join(pasta, "*.txt"))):
+        labirintos.append((os.path.basename(arquivo), GerenciadorLabirinto.criar_labirinto(arquivo)))
+    return labirintos
+
+def executar_a_star(tamanhos):
+    """Compara o A* anterior com o A* por índices (heap binário e radix heap)"""
+    algoritmos = [
+        ("A* (referência)", a_star_referencia),
+        ("A* (heap binário)", lambda lab, i, f: AlgoritmoAStar.a_star_busca(lab, i, f, fila=HeapBinario)),
+        ("A* (radix heap)", lambda lab, i, f: AlgoritmoAStar.a_star_busca(lab, i, f, fila=HeapRadix)),
+    ]
+    
+    labirintos = carregar_labirintos_incluidos()
+    for tamanho in tamanhos:
+        labirintos.append((f"sala {tamanho}x{tamanho}", gerar_labirinto_sala(tamanho)))
+    
+    print()
+    print(f"{'Labirinto':<18} | {'Algoritmo':<18} | {'Caminho':>8} | {'Expansões':>9} | "
+          f"{'Tempo (s)':>10} | {'µs/expansão':>11}")
+    print("-" * 90)
+    
+    for nome_labirinto, labirinto in labirintos:
+        inicio = GerenciadorLabirinto.encontrar_posicao_inicial(labirinto)
+        fim = GerenciadorLabirinto.encontrar_posicao_saida(labirinto)
+        
+        for nome, funcao in algoritmos:
+            inicio_tempo = time.perf_counter()
+            caminho, explorados, _ = funcao(labirinto, inicio, fim)
+            tempo = time.perf_counter() - inicio_tempo
+            por_expansao = tempo / len(explorados) * 1e6 if explorados else 0.0
+            print(f"{nome_labirinto:<18} | {nome:<18} | {len(caminho):>8} | {len(explorados):>9} | "
+                  f"{tempo:>10.4f} | {por_expansao:>11.2f}")
+
+def percentil(amostras, p):
+    """Percentil p (0-100) pelo método do posto mais próximo"""
+    ordenadas = sorted(amostras)
+    posto = max(1, math.ceil(p / 100 * len(ordenadas)))
+    return ordenadas[posto - 1]
+
+def _novo_gerenciador():
+    """
+    Gerenciador isolado para uma medição: sem cache de resultados, sem traço
+    de exploração e sem a busca extra que mede a economia do ALT. Estruturas
+    pré-computadas (campo de distâncias, HPA*, marcos, grafo de junções)
+    entram no tempo de cada execução.
+    """
+    pathfinder = GerenciadorPathfinding()
+    pathfinder.configurar_cache(max_entradas=0)
+    pathfinder.registrar_exploracao = False
+    pathfinder.alt_medir_economia = False
+    return pathfinder
+
+def _executar_uma_vez(grade, inicio, fim, algoritmo):
+    """Executa a busca uma vez; retorna (segundos, caminho, estatisticas)"""
+    pathfinder = _novo_gerenciador()
+    inicio_tempo = time.perf_counter_ns()
+    caminho, _, estatisticas = pathfinder.encontrar_caminho(grade, inicio, fim, algoritmo)
+    return (time.perf_counter_ns() - inicio_tempo) / 1e9, caminho, estatisticas
+
+def medir_algoritmo(grade, inicio, fim, algoritmo, repeticoes, aquecimento, tempo_maximo):
+    """
+    Mede um algoritmo em um labirinto: aquecimento, repetições cronometradas
+    e, separadamente, uma execução sob tracemalloc para o pico de memória.
+    
+    Se uma execução de aquecimento passar de tempo_maximo segundos, só uma
+    repetição é medida e o resultado é marcado como 'lento'.
+    """
+    lento = False
+    for _ in range(aquecimento):
+        tempo, _, _ = _executar_uma_vez(grade, inicio, fim, algoritmo)
+        if tempo > tempo_maximo:
+            lento = True
+            break
+    
+    amostras = []
+    for _ in range(1 if lento else repeticoes):
+        tempo, caminho, estatisticas = _executar_uma_vez(grade, inicio, fim, algoritmo)
+        amostras.append(tempo)
+    
+    tracemalloc.start()
+    _executar_uma_vez(grade, inicio, fim, algoritmo)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        'mediana_s': statistics.median(amostras),
+        'p95_s': percentil(amostras, 95),
+        'amostras': len(amostras),
+        'nos_expandidos': estatisticas.get('nos_visitados', 0),
+        'tamanho_caminho': len(caminho),
+        'caminho_encontrado': bool(caminho),
+        'memoria_pico': pico,
+        'lento': lento
+    }
+
+def labirintos_suite(tamanhos):
+    """Gera (nome, família, labirinto): os arquivos incluídos e, por família, os gerados em ordem de tamanho"""
+    for nome, labirinto in carregar_labirintos_incluidos():
+        yield nome, None, labirinto
+    for familia, gerar in [("corredor", gerar_labirinto_corredor), ("sala", gerar_labirinto_sala)]:
+        for tamanho in sorted(tamanhos):
+            yield f"{familia} {tamanho}x{tamanho}", familia, gerar(tamanho)
+    for familia in ["backtracker", "salas"]:
+        for tamanho in sorted(tamanhos):
+            yield (f"{familia} {tamanho}x{tamanho}", familia,
+                   GeradorLabirinto.gerar(tamanho, tamanho, familia, SEMENTE_SUITE))
+
+def executar_suite(tamanhos, algoritmos=None, repeticoes=5, aquecimento=1, tempo_maximo=5.0):
+    """
+    Roda cada algoritmo em cada labirinto da suíte, imprimindo uma tabela.
+    
+    Um algoritmo marcado como lento em um labirinto gerado é omitido nos
+    tamanhos maiores da mesma família.
+    
+    Returns:
+        dict: relatório serializável em JSON
+    """
+    algoritmos = algoritmos or GerenciadorPathfinding.ALGORITMOS
+    resultados = []
+    lentos = set()
+    
+    print(f"{'Labirinto':<22} | {'Algoritmo':<20} | {'Mediana (s)':>11} | {'p95 (s)':>9} | "
+          f"{'Expansões':>9} | {'Caminho':>8} | {'Pico (KiB)':>10}")
+    print("-" * 107)
+    
+    for nome, familia, labirinto in labirintos_suite(tamanhos):
+        inicio = GerenciadorLabirinto.encontrar_posicao_inicial(labirinto)
+        fim = GerenciadorLabirinto.encontrar_posicao_saida(labirinto)
+        grade = GradeLabirinto.de(labirinto)
+        del labirinto  # Nos maiores tamanhos a matriz ocupa bem mais que a grade
+        
+        for algoritmo in algoritmos:
+            entrada = {'labirinto': nome, 'celulas': grade.largura * grade.altura, 'algoritmo': algoritmo}
+            if (familia, algoritmo) in lentos:
+                entrada['omitido'] = True
+                resultados.append(entrada)
+                continue
+            
+            entrada.update(medir_algoritmo(grade, inicio, fim, algoritmo, repeticoes, aquecimento, tempo_maximo))
+            resultados.append(entrada)
+            if entrada['lento'] and familia is not None:
+                lentos.add((familia, algoritmo))
+            
+            print(f"{nome:<22} | {algoritmo:<20} | {entrada['mediana_s']:>11.5f} | {entrada['p95_s']:>9.5f} | "
+                  f"{entrada['nos_expandidos']:>9} | {entrada['tamanho_caminho']:>8} | "
+                  f"{entrada['memoria_pico'] / 1024:>10.1f}")
+    
+    return {
+        'versao': 1,
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'parametros': {
+            'tamanhos': sorted(tamanhos),
+            'repeticoes': repeticoes,
+            'aquecimento': aquecimento,
+            'tempo_maximo': tempo_maximo,
+            'semente': SEMENTE_SUITE
+        },
+        'resultados': resultados
+    }
+
+def comparar_com_base(relatorio, base, limiar=LIMIAR_REGRESSAO):
+    """
+    Compara um relatório com um anterior (mesmo labirinto e algoritmo).
+    
+    Tempo (mediana), expansões e pico de memória que crescerem mais que
+    limiar (relativo) são regressões; no tempo, diferenças abaixo de
+    TEMPO_MINIMO_REGRESSAO são ignoradas como ruído.
+    
+    Returns:
+        list: Regressões, como dicts com labirinto, algoritmo, métrica, base e atual
+    """
+    anteriores = {(r['labirinto'], r['algoritmo']): r for r in base.get('resultados', [])
+                  if not r.get('omitido')}
+    regressoes = []
+    
+    for atual in relatorio['resultados']:
+        anterior = anteriores.get((atual['labirinto'], atual['algoritmo']))
+        if anterior is None or atual.get('omitido'):
+            continue
+        
+        for metrica in ['mediana_s', 'nos_expandidos', 'memoria_pico']:
+            valor_base, valor_atual = anterior[metrica], atual[metrica]
+            if valor_atual <= valor_base * (1 + limiar):
+                continue
+            if metrica == 'mediana_s' and valor_atual - valor_base < TEMPO_MINIMO_REGRESSAO:
+                continue
+            regressoes.append({
+                'labirinto': atual['labirinto'],
+                'algoritmo': atual['algoritmo'],
+                'metrica': metrica,
+                'base': valor_base,
+                'atual': valor_atual,
+                'variacao': valor_atual / valor_base - 1 if valor_base else float('inf')
+            })
+    
+    return regressoes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos algoritmos de pathfinding")
+    parser.add_argument("tamanhos", nargs="*", type=int, help="Lados dos labirintos gerados")
+    parser.add_argument("--suite", action="store_true",
+                        help="Roda todos os algoritmos do GerenciadorPathfinding (sem janela)")
+    parser.add_argument("--algoritmos", nargs="+", help="Restringe a suíte a estes algoritmos")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--aquecimento", type=int, default=1)
+    parser.add_argument("--tempo-maximo", type=float, default=5.0,
+                        help="Segundos por execução a partir dos quais o algoritmo é considerado lento")
+    parser.add_argument("--json", help="Arquivo onde gravar o relatório da suíte")
+    parser.add_argument("--base", help="Relatório anterior para detectar regressões")
+    parser.add_argument("--limiar", type=float, default=LIMIAR_REGRESSAO,
+                        help="Variação relativa considerada regressão (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+    
+    if not args.suite:
+        tamanhos = args.tamanhos or TAMANHOS_PADRAO
+        executar(tamanhos)
+        executar_a_star(tamanhos)
+        return 0
+    
+    relatorio = executar_suite(args.tamanhos or TAMANHOS_SUITE, args.algoritmos,
+                               args.repeticoes, args.aquecimento, args.tempo_maximo)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nRelatório gravado em {args.json}")
+    
+    if args.base:
+        with open(args.base, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar_com_base(relatorio, base, args.limiar)
+        if regressoes:
+            print(f"\n{len(regressoes)} regressão(ões) acima de {args.limiar:.0%}:")
+            for r in regressoes:
+                print(f"  {r['labirinto']:<22} {r['algoritmo']:<20} {r['metrica']:<15} "
+                      f"{r['base']:.6g} -> {r['atual']:.6g} (+{r['variacao']:.0%})")
+            return 1
+        print(f"\nSem regressões acima de {args.limiar:.0%} em relação a {args.base}")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
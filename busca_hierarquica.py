@@ -0,0 +1,255 @@
+"""
+Pathfinding hierárquico (HPA*) para labirintos muito grandes
+"""
+import time
+import heapq
+from array import array
+from collections import deque
+from labirinto import GradeLabirinto, TracoExploracao
+
+class AbstracaoHierarquica:
+    """
+    Grafo abstrato do labirinto no estilo HPA*.
+    
+    A grade é dividida em clusters quadrados. Nas fronteiras entre clusters
+    vizinhos são criadas entradas (pares de células livres, uma de cada lado),
+    e dentro de cada cluster as entradas são ligadas pelas distâncias BFS
+    restritas ao cluster. A construção acontece uma vez por labirinto; cada
+    consulta busca primeiro no grafo abstrato e só então refina, célula a
+    célula, os trechos escolhidos.
+    
+    Com `otimo=True` toda travessia de fronteira vira entrada, e o caminho
+    refinado é exatamente ótimo. Com `otimo=False` (padrão) cada trecho
+    contínuo de fronteira gera no máximo duas entradas, o que deixa o grafo
+    bem menor em troca de caminhos quase ótimos.
+    """
+    
+    LIMITE_TRECHO = 6  # Trechos maiores que isso ganham duas entradas (modo quase ótimo)
+    
+    def __init__(self, grade, tamanho_cluster=16, otimo=False):
+        inicio_tempo = time.perf_counter()
+        self.grade = grade
+        self.tamanho_cluster = tamanho_cluster
+        self.otimo = otimo
+        self.impressao = grade.impressao_digital()
+        
+        self.clusters_x = (grade.largura + tamanho_cluster - 1) // tamanho_cluster
+        self.clusters_y = (grade.altura + tamanho_cluster - 1) // tamanho_cluster
+        
+        # Cluster de cada célula (-1 na borda de paredes)
+        self.cluster_de = array('i', [-1]) * len(grade.celulas)
+        for y in range(grade.altura):
+            base = grade.indice(0, y)
+            linha_clusters = (y // tamanho_cluster) * self.clusters_x
+            for x in range(grade.largura):
+                self.cluster_de[base + x] = linha_clusters + x // tamanho_cluster
+        
+        # Grafo abstrato: índice da célula -> [(vizinho, custo)]
+        self.grafo = {}
+        self.nos_por_cluster = {}
+        self._criar_entradas()
+        for cluster, nos in self.nos_por_cluster.items():
+            self._ligar_nos_do_cluster(cluster, nos)
+        
+        self.tempo_construcao = time.perf_counter() - inicio_tempo
+    
+    @property
+    def total_nos(self):
+        return len(self.grafo)
+    
+    @property
+    def total_arestas(self):
+        return sum(len(arestas) for arestas in self.grafo.values()) // 2
+    
+    def _adicionar_no(self, indice):
+        """Registra uma célula como nó abstrato"""
+        if indice not in self.grafo:
+            self.grafo[indice] = []
+            self.nos_por_cluster.setdefault(self.cluster_de[indice], []).append(indice)
+    
+    def _adicionar_aresta(self, a, b, custo):
+        self.grafo[a].append((b, custo))
+        self.grafo[b].append((a, custo))
+    
+    def _criar_entradas(self):
+        """Cria as entradas em todas as fronteiras verticais e horizontais entre clusters"""
+        grade = self.grade
+        c = self.tamanho_cluster
+        
+        # Fronteiras verticais: células (x, y) | (x + 1, y)
+        for x in range(c - 1, grade.largura - 1, c):
+            for y0 in range(0, grade.altura, c):
+                celulas = [grade.indice(x, y) for y in range(y0, min(y0 + c, grade.altura))]
+                self._entradas_do_trecho(celulas, 1)
+        
+        # Fronteiras horizontais: células (x, y) / (x, y + 1)
+        for y in range(c - 1, grade.altura - 1, c):
+            for x0 in range(0, grade.largura, c):
+                celulas = [grade.indice(x, y) for x in range(x0, min(x0 + c, grade.largura))]
+                self._entradas_do_trecho(celulas, grade.largura_total)
+    
+    def _entradas_do_trecho(self, lado_a, deslocamento):
+        """Agrupa as travessias livres de uma fronteira em trechos contínuos e cria as entradas"""
+        celulas = self.grade.celulas
+        trecho = []
+        
+        for indice in lado_a + [None]:
+            if indice is not None and celulas[indice] and celulas[indice + deslocamento]:
+                trecho.append(indice)
+                continue
+            
+            if trecho:
+                if self.otimo:
+                    escolhidas = trecho
+                elif len(trecho) > self.LIMITE_TRECHO:
+                    escolhidas = [trecho[0], trecho[-1]]
+                else:
+                    escolhidas = [trecho[len(trecho) // 2]]
+                
+                for a in escolhidas:
+                    self._adicionar_no(a)
+                    self._adicionar_no(a + deslocamento)
+                    self._adicionar_aresta(a, a + deslocamento, 1)
+                trecho = []
+    
+    def _bfs_no_cluster(self, origem, cluster, destino=None):
+        """
+        BFS restrito a um cluster. Retorna (distancias, predecessores) como
+        dicionários; para cedo se destino for alcançado.
+        """
+        celulas = self.grade.celulas
+        cluster_de = self.cluster_de
+        deslocamentos = self.grade.deslocamentos
+        distancias = {origem: 0}
+        predecessores = {origem: origem}
+        queue = deque([origem])
+        
+        while queue:
+            atual = queue.popleft()
+            if atual == destino:
+                break
+            proxima = distancias[atual] + 1
+            for d in deslocamentos:
+                vizinho = atual + d
+                if (vizinho not in distancias and celulas[vizinho]
+                        and cluster_de[vizinho] == cluster):
+                    distancias[vizinho] = proxima
+                    predecessores[vizinho] = atual
+                    queue.append(vizinho)
+        
+        return distancias, predecessores
+    
+    def _ligar_nos_do_cluster(self, cluster, nos):
+        """Liga os nós de um cluster pelas distâncias internas ao cluster"""
+        for i, origem in enumerate(nos):
+            distancias, _ = self._bfs_no_cluster(origem, cluster)
+            for destino in nos[i + 1:]:
+                if destino in distancias:
+                    self._adicionar_aresta(origem, destino, distancias[destino])
+    
+    def _conexoes_temporarias(self, indice):
+        """Arestas de uma célula qualquer até os nós abstratos do seu cluster"""
+        if indice in self.grafo:
+            return []
+        
+        cluster = self.cluster_de[indice]
+        distancias, _ = self._bfs_no_cluster(indice, cluster)
+        return [(no, distancias[no]) for no in self.nos_por_cluster.get(cluster, [])
+                if no in distancias]
+    
+    def _refinar(self, nos_abstratos):
+        """Expande a sequência de nós abstratos em um caminho célula a célula"""
+        grade = self.grade
+        caminho = [grade.coordenada(nos_abstratos[0])]
+        
+        for a, b in zip(nos_abstratos, nos_abstratos[1:]):
+            if b - a in grade.deslocamentos:
+                caminho.append(grade.coordenada(b))
+                continue
+            
+            _, predecessores = self._bfs_no_cluster(a, self.cluster_de[a], destino=b)
+            trecho = []
+            atual = b
+            while atual != a:
+                trecho.append(grade.coordenada(atual))
+                atual = predecessores[atual]
+            caminho.extend(reversed(trecho))
+        
+        return caminho
+    
+    def buscar(self, inicio, fim, registrar_exploracao=True):
+        """
+        Busca hierárquica entre duas posições.
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), onde
+            caminhos_explorados contém os nós abstratos expandidos
+        """
+        inicio_tempo = time.perf_counter()
+        grade = self.grade
+        largura_total = grade.largura_total
+        indice_inicio = grade.indice(*inicio)
+        indice_fim = grade.indice(*fim)
+        fx, fy = fim
+        
+        # Início e fim entram temporariamente no grafo abstrato
+        extras = {indice_inicio: self._conexoes_temporarias(indice_inicio)}
+        for no, custo in self._conexoes_temporarias(indice_fim):
+            extras.setdefault(no, []).append((indice_fim, custo))
+        
+        mesmo_cluster = self.cluster_de[indice_inicio] == self.cluster_de[indice_fim]
+        if mesmo_cluster and indice_inicio != indice_fim:
+            distancias, _ = self._bfs_no_cluster(
+                indice_inicio, self.cluster_de[indice_inicio], destino=indice_fim
+            )
+            if indice_fim in distancias:
+                extras[indice_inicio].append((indice_fim, distancias[indice_fim]))
+        
+        open_set = [(0, indice_inicio)]
+        came_from = {indice_inicio: -1}
+        g_score = {indice_inicio: 0}
+        fechados = set()
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+        nos_visitados = 0
+        encontrado = False
+        
+        while open_set:
+            _, atual = heapq.heappop(open_set)
+            if atual in fechados:
+                continue
+            fechados.add(atual)
+            nos_visitados += 1
+            caminhos_explorados.registrar(atual)
+            
+            if atual == indice_fim:
+                encontrado = True
+                break
+            
+            for vizinho, custo in self.grafo.get(atual, []) + extras.get(atual, []):
+                g_vizinho = g_score[atual] + custo
+                if vizinho not in g_score or g_vizinho < g_score[vizinho]:
+                    g_score[vizinho] = g_vizinho
+                    came_from[vizinho] = atual
+                    vy, vx = divmod(vizinho, largura_total)
+                    heapq.heappush(open_set, (g_vizinho + abs(vx - 1 - fx) + abs(vy - 1 - fy), vizinho))
+        
+        caminho = []
+        if encontrado:
+            nos_abstratos = []
+            atual = indice_fim
+            while atual != -1:
+                nos_abstratos.append(atual)
+                atual = came_from[atual]
+            nos_abstratos.reverse()
+            caminho = self._refinar(nos_abstratos)
+        
+        return caminho, caminhos_explorados, {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': nos_visitados,
+            'algoritmo': f"HPA* ({'ótimo' if self.otimo else 'quase ótimo'})",
+            'caminho_encontrado': encontrado,
+            'nos_abstratos': self.total_nos,
+            'arestas_abstratas': self.total_arestas,
+            'tamanho_cluster': self.tamanho_cluster,
+            'tempo_construcao': self.tempo_construcao
+        }
@@ -0,0 +1,178 @@
+"""
+Replanejamento incremental (LPA*) para labirintos que mudam ao longo do tempo
+"""
+import time
+import heapq
+from array import array
+from labirinto import GradeLabirinto, TracoExploracao
+
+class PlanejadorIncremental:
+    """
+    Lifelong Planning A* entre uma posição inicial e uma saída fixas.
+    
+    O estado da busca (g, rhs e a fila de prioridades) é mantido entre as
+    chamadas. Quando paredes são adicionadas ou removidas, só as células
+    alteradas e suas vizinhas têm o rhs recalculado, e a fila repara apenas a
+    parte afetada dos valores g em vez de refazer a busca inteira.
+    
+    As alterações devem ser feitas por `alterar_celulas`, que também atualiza
+    a grade (e, com ela, a impressão digital usada pelos caches). Com
+    `registrar_exploracao=False` os traços devolvidos ficam vazios.
+    """
+    
+    INFINITO = 2 ** 31 - 1
+    
+    def __init__(self, labirinto, inicio, fim, registrar_exploracao=True):
+        self.grade = GradeLabirinto.de(labirinto)
+        self.inicio = inicio
+        self.fim = fim
+        self.registrar_exploracao = registrar_exploracao
+        self.indice_inicio = self.grade.indice(*inicio)
+        self.indice_fim = self.grade.indice(*fim)
+        
+        total = len(self.grade.celulas)
+        self.g = array('i', [self.INFINITO]) * total
+        self.rhs = array('i', [self.INFINITO]) * total
+        self.fila = []
+        self.chaves = {}  # Chave atual de cada célula na fila (entradas antigas são ignoradas)
+        self.total_expansoes = 0
+        
+        self.rhs[self.indice_inicio] = 0
+        self._enfileirar(self.indice_inicio)
+    
+    def _heuristica(self, indice):
+        y, x = divmod(indice, self.grade.largura_total)
+        return abs(x - 1 - self.fim[0]) + abs(y - 1 - self.fim[1])
+    
+    def _calcular_chave(self, indice):
+        menor = min(self.g[indice], self.rhs[indice])
+        if menor == self.INFINITO:
+            return (self.INFINITO, self.INFINITO)
+        return (menor + self._heuristica(indice), menor)
+    
+    def _enfileirar(self, indice):
+        chave = self._calcular_chave(indice)
+        self.chaves[indice] = chave
+        heapq.heappush(self.fila, (chave, indice))
+    
+    def _atualizar_vertice(self, indice):
+        """Recalcula o rhs de uma célula e a (re)coloca na fila se ficou inconsistente"""
+        if indice != self.indice_inicio:
+            melhor = self.INFINITO
+            celulas = self.grade.celulas
+            if celulas[indice]:
+                g = self.g
+                for d in self.grade.deslocamentos:
+                    vizinho = indice + d
+                    # Paredes recém-criadas podem manter um g antigo até serem expandidas
+                    if celulas[vizinho] and g[vizinho] + 1 < melhor:
+                        melhor = g[vizinho] + 1
+            self.rhs[indice] = melhor
+        
+        self.chaves.pop(indice, None)
+        if self.g[indice] != self.rhs[indice]:
+            self._enfileirar(indice)
+    
+    def _topo(self):
+        """Chave válida do topo da fila (descarta entradas desatualizadas)"""
+        while self.fila:
+            chave, indice = self.fila[0]
+            if self.chaves.get(indice) == chave:
+                return chave
+            heapq.heappop(self.fila)
+        return (self.INFINITO, self.INFINITO)
+    
+    def _calcular_caminho_minimo(self, caminhos_explorados):
+        """Laço principal do LPA*; retorna quantos nós foram expandidos"""
+        g, rhs = self.g, self.rhs
+        celulas = self.grade.celulas
+        deslocamentos = self.grade.deslocamentos
+        fim = self.indice_fim
+        expansoes = 0
+        
+        while (self._topo() < self._calcular_chave(fim) or rhs[fim] != g[fim]) and self.fila:
+            _, atual = heapq.heappop(self.fila)
+            del self.chaves[atual]
+            expansoes += 1
+            caminhos_explorados.registrar(atual)
+            
+            if g[atual] > rhs[atual]:
+                g[atual] = rhs[atual]
+            else:
+                g[atual] = self.INFINITO
+                self._atualizar_vertice(atual)
+            
+            for d in deslocamentos:
+                if celulas[atual + d]:
+                    self._atualizar_vertice(atual + d)
+        
+        self.total_expansoes += expansoes
+        return expansoes
+    
+    def _extrair_caminho(self):
+        """Segue os menores g da saída de volta ao início"""
+        g = self.g
+        celulas = self.grade.celulas
+        atual = self.indice_fim
+        if g[atual] == self.INFINITO or not celulas[atual]:
+            return []
+        
+        caminho = [self.grade.coordenada(atual)]
+        while atual != self.indice_inicio:
+            vizinhos = [atual + d for d in self.grade.deslocamentos if celulas[atual + d]]
+            atual = min(vizinhos, key=g.__getitem__)
+            caminho.append(self.grade.coordenada(atual))
+        
+        caminho.reverse()
+        return caminho
+    
+    def planejar(self, celulas_alteradas=0):
+        """
+        (Re)calcula o caminho reaproveitando o estado atual.
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), com os nós
+            expandidos nesta chamada em estatisticas['nos_reexpandidos']
+        """
+        inicio_tempo = time.perf_counter()
+        caminhos_explorados = TracoExploracao.para(self.grade, self.registrar_exploracao)
+        expansoes = self._calcular_caminho_minimo(caminhos_explorados)
+        caminho = self._extrair_caminho()
+        
+        return caminho, caminhos_explorados, {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': expansoes,
+            'nos_reexpandidos': expansoes,
+            'celulas_alteradas': celulas_alteradas,
+            'expansoes_acumuladas': self.total_expansoes,
+            'algoritmo': 'LPA*',
+            'caminho_encontrado': len(caminho) > 0
+        }
+    
+    @classmethod
+    def buscar(cls, labirinto, inicio, fim, registrar_exploracao=True):
+        """Planejamento único, sem guardar o planejador para replanejar depois"""
+        return cls(labirinto, inicio, fim, registrar_exploracao).planejar()
+    
+    def alterar_celulas(self, alteracoes):
+        """
+        Aplica alterações no labirinto e repara o caminho.
+        
+        Args:
+            alteracoes: Lista de ((x, y), valor), com valor 1 para parede e
+                        0 para caminho livre
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas)
+        """
+        afetadas = set()
+        for (x, y), valor in alteracoes:
+            self.grade.definir_celula(x, y, valor)
+            indice = self.grade.indice(x, y)
+            afetadas.add(indice)
+            afetadas.update(indice + d for d in self.grade.deslocamentos)
+        
+        for indice in afetadas:
+            self._atualizar_vertice(indice)
+        
+        return self.planejar(celulas_alteradas=len(alteracoes))
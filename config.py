@@ -7,9 +7,24 @@ class ConfiguracaoJogo:
         self.VELOCIDADE_CAMINHO = 8
         self.VELOCIDADE_PLAYER = 15
         
+        # Execução da busca:
+        #   "segundo_plano" - thread de trabalho cancelável; o resultado é
+        #                     aplicado de uma vez quando a busca termina
+        #   "passos"        - avança a busca a cada frame dentro de
+        #                     ORCAMENTO_BUSCA_MS, animando a exploração
+        #                     enquanto ela acontece
+        #   "sincrono"      - a busca inteira roda antes do próximo frame
+        self.MODO_BUSCA = "segundo_plano"
+        self.ORCAMENTO_BUSCA_MS = 4
+        
+        # Instrumentação das buscas (contadores na interface; alterna com [I])
+        self.INSTRUMENTACAO = False
+        self.INSTRUMENTACAO_MEMORIA = False  # Pico via tracemalloc (deixa a busca mais lenta)
+        
         # Cores
         self.COR_EXPLORACAO = (255, 120, 120)
         self.COR_CAMINHO_FINAL = (120, 255, 120)
+        self.COR_TERRENO = (110, 75, 35)  # Células de custo 2-9 (mais opaca com o custo)
         self.COR_FUNDO = (40, 40, 40)
         self.COR_TEXTO = (255, 255, 255)
         self.COR_DESTAQUE = (255, 255, 100)
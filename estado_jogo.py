@@ -8,6 +8,13 @@ class GerenciadorEstadoJogo:
     
     def __init__(self, jogo):
         self.jogo = jogo
+        self.jogo.busca_em_andamento = None
+        self.jogo.busca_em_segundo_plano = None
+        self.jogo.caminho_final = []
+        self.jogo.caminhos_explorados = []
+        self.jogo.estatisticas = {}
+        self.jogo.caminho_encontrado = False
+        self.algoritmo_busca = None
         self.resetar_estado_animacao()
     
     def resetar_estado_animacao(self):
@@ -23,6 +30,35 @@ class GerenciadorEstadoJogo:
     def executar_busca(self, algoritmo="a_star"):
         """Executa uma busca com o algoritmo especificado"""
         print(f"🔍 Executando busca com algoritmo: {algoritmo.upper()}...")
+        self.cancelar_busca()
+        self.algoritmo_busca = algoritmo
+        
+        if self.jogo.config.MODO_BUSCA == "segundo_plano":
+            # O estado atual continua na tela até o resultado ser aplicado
+            self.jogo.busca_em_segundo_plano = self.jogo.pathfinder.iniciar_busca_em_segundo_plano(
+                self.jogo.labirinto, 
+                self.jogo.posicao_inicial, 
+                self.jogo.posicao_saida, 
+                algoritmo
+            )
+            return
+        
+        if self.jogo.config.MODO_BUSCA == "passos":
+            # A exploração é animada enquanto a busca avança em atualizar_busca
+            busca = self.jogo.pathfinder.iniciar_busca_em_passos(
+                self.jogo.labirinto, 
+                self.jogo.posicao_inicial, 
+                self.jogo.posicao_saida, 
+                algoritmo
+            )
+            self.jogo.busca_em_andamento = busca
+            self.jogo.caminho_final, self.jogo.caminhos_explorados, self.jogo.estatisticas = busca.resultado
+            self.jogo.caminho_encontrado = False
+            
+            self.resetar_estado_animacao()
+            self.jogo.player_manager.resetar()
+            self.atualizar_busca()
+            return
         
         resultado = self.jogo.pathfinder.encontrar_caminho(
             self.jogo.labirinto, 
@@ -31,13 +67,55 @@ class GerenciadorEstadoJogo:
             algoritmo
         )
         
-        self.jogo.caminho_final, self.jogo.caminhos_explorados, self.jogo.estatisticas = resultado
-        self.jogo.caminho_encontrado = len(self.jogo.caminho_final) > 0
+        self._aplicar_resultado(resultado)
         
         self.resetar_estado_animacao()
         self.jogo.player_manager.resetar()
+    
+    def atualizar_busca(self):
+        """
+        Avança a busca em passos dentro do orçamento de tempo do frame ou
+        aplica o resultado da busca em segundo plano, se ela terminou
+        """
+        trabalho = self.jogo.busca_em_segundo_plano
+        if trabalho is not None and trabalho.terminada:
+            self.jogo.busca_em_segundo_plano = None
+            if trabalho.erro is not None:
+                print(f"❌ Erro na busca: {trabalho.erro}")
+                return
+            
+            self._aplicar_resultado(trabalho.resultado)
+            self.resetar_estado_animacao()
+            self.jogo.player_manager.resetar()
+        
+        busca = self.jogo.busca_em_andamento
+        if busca is None:
+            return
+        
+        if busca.avancar(self.jogo.config.ORCAMENTO_BUSCA_MS / 1000):
+            self.jogo.busca_em_andamento = None
+            self._aplicar_resultado(busca.resultado)
+    
+    def cancelar_busca(self):
+        """Descarta a busca em andamento, se houver"""
+        if self.jogo.busca_em_segundo_plano is not None:
+            self.jogo.busca_em_segundo_plano.cancelar()
+            self.jogo.busca_em_segundo_plano = None
+        self.jogo.busca_em_andamento = None
+    
+    def obter_progresso_busca(self):
+        """Nós expandidos pela busca em andamento, ou None se não há busca"""
+        for busca in (self.jogo.busca_em_segundo_plano, self.jogo.busca_em_andamento):
+            if busca is not None:
+                return busca.nos_visitados
+        return None
+    
+    def _aplicar_resultado(self, resultado):
+        """Publica o resultado de uma busca concluída no estado do jogo"""
+        self.jogo.caminho_final, self.jogo.caminhos_explorados, self.jogo.estatisticas = resultado
+        self.jogo.caminho_encontrado = len(self.jogo.caminho_final) > 0
         
-        self._imprimir_estatisticas(algoritmo)
+        self._imprimir_estatisticas(self.algoritmo_busca)
     
     def _imprimir_estatisticas(self, algoritmo):
         """Imprime estatísticas da busca"""
@@ -48,9 +126,32 @@ class GerenciadorEstadoJogo:
         print(f"✅ Busca concluída em {self.jogo.estatisticas['tempo_execucao']:.4f}s")
         print(f"🧠 Algoritmo: {self.jogo.estatisticas.get('algoritmo', algoritmo)}")
         print(f"🎯 Nós visitados: {self.jogo.estatisticas['nos_visitados']}")
+        if self.jogo.estatisticas.get('servido_do_cache'):
+            print("♻️ Resultado reaproveitado do cache")
+        if self.jogo.estatisticas.get('sem_caminho_por_componentes'):
+            print("🧩 Rato e saída em regiões desconectadas: busca dispensada")
+        if 'expansoes_economizadas' in self.jogo.estatisticas:
+            print(f"📍 Marcos pouparam {self.jogo.estatisticas['expansoes_economizadas']} expansões "
+                  f"(A* Manhattan: {self.jogo.estatisticas['expansoes_manhattan']})")
+        medicao = self.jogo.estatisticas.get('instrumentacao')
+        if medicao:
+            print(f"📈 {medicao['tempo_ns'] / 1_000_000:.3f} ms | {medicao['nos_por_segundo']:.0f} nós/s")
+            if 'insercoes_fila' in medicao:
+                print(f"   Fila: {medicao['insercoes_fila']} inserções, {medicao['remocoes_fila']} remoções "
+                      f"({medicao['remocoes_descartadas']} descartadas) | "
+                      f"Fronteira máxima: {medicao.get('fronteira_maxima', 0)} | "
+                      f"Vizinhos verificados: {medicao['vizinhos_verificados']}")
+            if 'memoria_pico' in medicao:
+                print(f"   Memória de pico: {medicao['memoria_pico'] / 1024:.1f} KiB")
+        if 'iteracoes' in self.jogo.estatisticas:
+            print(f"🔁 Iterações: {self.jogo.estatisticas['iteracoes']} | "
+                  f"Memória de pico: {self.jogo.estatisticas['memoria_pico'] / 1024:.1f} KiB")
         
         if self.jogo.caminho_encontrado:
             print(f"🎉 Caminho encontrado! Tamanho: {len(self.jogo.caminho_final)} passos")
+            custo = self.jogo.estatisticas.get('custo_caminho')
+            if custo is not None and custo != len(self.jogo.caminho_final) - 1:
+                print(f"⚖️ Custo do caminho (terreno): {custo}")
         else:
             print("❌ Nenhum caminho encontrado para o labirinto atual")
     
@@ -62,6 +163,7 @@ class GerenciadorEstadoJogo:
             'mostrar_caminho_final': self.jogo.mostrar_caminho_final,
             'mover_player': self.jogo.mover_player,
             'pausado': self.jogo.pausado,
+            'progresso_busca': self.obter_progresso_busca(),
             
             # Progresso
             'indice_exploracao': self.jogo.indice_exploracao,
@@ -128,5 +230,10 @@ class GerenciadorEstadoJogo:
         print(f"✅ {algoritmo.upper()}:")
         print(f"   ⏱️  Tempo: {stats['tempo_execucao']:.4f}s")
         print(f"   🎯 Nós visitados: {stats['nos_visitados']}")
+        if 'nos_visitados_inicio' in stats:
+            print(f"   ↔️  Por lado: {stats['nos_visitados_inicio']} (início) + "
+                  f"{stats['nos_visitados_fim']} (saída)")
+        if 'operacoes_heap' in stats:
+            print(f"   🗂️  Operações de heap: {stats['operacoes_heap']}")
         print(f"   📏 Tamanho do caminho: {len(caminho) if caminho else 'N/A'}")
         print(f"   🎉 Sucesso: {'Sim' if stats.get('caminho_encontrado', False) else 'Não'}")
@@ -12,7 +12,8 @@ class GerenciadorEventos:
             pygame.K_1: "bfs",
             pygame.K_2: "bfs_otimizado", 
             pygame.K_3: "a_star",
-            pygame.K_4: "a_star_euclidiano"
+            pygame.K_4: "a_star_euclidiano",
+            pygame.K_5: "dijkstra"
         }
     
     def processar_eventos(self):
@@ -48,6 +49,8 @@ class GerenciadorEventos:
             self.jogo.reiniciar_busca()
         elif event.key == pygame.K_c:
             self.jogo.comparar_algoritmos()
+        elif event.key == pygame.K_i:
+            self._alternar_instrumentacao()
         elif event.key == pygame.K_ESCAPE:
             return False
         elif event.key == pygame.K_F11:
@@ -73,13 +76,22 @@ class GerenciadorEventos:
             self.jogo.pausado = True
             print("⏸️ Pausando animação")
     
+    def _alternar_instrumentacao(self):
+        """Liga/desliga a instrumentação e refaz a busca atual para exibir os contadores"""
+        config = self.jogo.config
+        config.INSTRUMENTACAO = not config.INSTRUMENTACAO
+        self.jogo.pathfinder.configurar_instrumentacao(config.INSTRUMENTACAO)
+        print(f"📈 Instrumentação {'ligada' if config.INSTRUMENTACAO else 'desligada'}")
+        self.jogo.reiniciar_busca(self.jogo.gerenciador_estado.algoritmo_busca or "a_star")
+    
     def _obter_nome_algoritmo(self, algoritmo):
         """Retorna nome amigável do algoritmo"""
         nomes = {
             "bfs": "BFS básico",
             "bfs_otimizado": "BFS otimizado", 
             "a_star": "A* Manhattan",
-            "a_star_euclidiano": "A* Euclidiano"
+            "a_star_euclidiano": "A* Euclidiano",
+            "dijkstra": "Dijkstra (Dial)"
         }
         return nomes.get(algoritmo, algoritmo)
     
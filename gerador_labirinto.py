@@ -0,0 +1,325 @@
+"""
+Geração procedural de labirintos - backtracker recursivo, Prim, Kruskal e salas
+Uso: python gerador_labirinto.py largura altura saida.txt [--algoritmo prim] [--semente 42]
+"""
+import sys
+import time
+import random
+import argparse
+from array import array
+
+from labirinto import GradeLabirinto
+
+# Bytes da grade (0 = parede, 1 = livre, 2-9 = terreno) para os caracteres do arquivo texto
+_TABELA_TEXTO = bytes.maketrans(bytes(range(10)), b'1023456789')
+
+class GeradorLabirinto:
+    """
+    Gera labirintos grandes direto na grade compilada (GradeLabirinto).
+    
+    Os labirintos perfeitos (backtracker, prim, kruskal) usam uma malha de
+    células nas coordenadas ímpares, cercada de paredes; cavar uma passagem é
+    liberar a célula vizinha e a parede entre as duas, sem nunca montar a
+    matriz em lista de listas. "salas" espalha salas retangulares ligadas por
+    corredores em L, com alguns ciclos.
+    
+    A mesma semente gera sempre o mesmo labirinto. O início fica na primeira
+    célula da malha (ou no centro da primeira sala) e a saída na última (ou
+    na sala mais distante).
+    """
+    
+    ALGORITMOS = ("backtracker", "prim", "kruskal", "salas")
+    
+    # Lados mínimo e máximo das salas e tentativas de posicionamento por célula
+    TAMANHO_SALA = (3, 12)
+    CELULAS_POR_TENTATIVA = 150
+    
+    @staticmethod
+    def gerar(largura, altura, algoritmo="backtracker", semente=None):
+        """
+        Gera um labirinto.
+        
+        Args:
+            largura, altura: Dimensões em células (mínimo 5x5)
+            algoritmo: Um de GeradorLabirinto.ALGORITMOS
+            semente: Semente do gerador (None = aleatória)
+        
+        Returns:
+            GradeLabirinto: Grade com início e saída definidos
+        
+        Raises:
+            ValueError: Algoritmo desconhecido ou dimensões pequenas demais
+        """
+        geradores = {
+            "backtracker": GeradorLabirinto._backtracker,
+            "prim": GeradorLabirinto._prim,
+            "kruskal": GeradorLabirinto._kruskal,
+            "salas": GeradorLabirinto._salas
+        }
+        if algoritmo not in geradores:
+            raise ValueError(f"Gerador desconhecido: {algoritmo} (disponíveis: {', '.join(GeradorLabirinto.ALGORITMOS)})")
+        if largura < 5 or altura < 5:
+            raise ValueError(f"Labirinto pequeno demais: {largura}x{altura} (mínimo 5x5)")
+        
+        largura_total = largura + 2
+        celulas = bytearray(largura_total * (altura + 2))
+        rng = random.Random(semente)
+        
+        inicio, saida = geradores[algoritmo](celulas, largura, altura, rng)
+        return GradeLabirinto.de_celulas(largura, altura, celulas, inicio, saida)
+    
+    @staticmethod
+    def salvar(grade, arquivo):
+        """
+        Grava a grade no formato texto lido por GerenciadorLabirinto.criar_labirinto.
+        
+        Cada linha sai de uma fatia do bytearray traduzida de uma vez
+        (bytes.translate), sem percorrer célula por célula.
+        """
+        grade = GradeLabirinto.de(grade)
+        largura_total = grade.largura_total
+        linhas = [f"{grade.altura} x {grade.largura}".encode()]
+        
+        for y in range(grade.altura):
+            base = (y + 1) * largura_total + 1
+            linhas.append(grade.celulas[base:base + grade.largura].translate(_TABELA_TEXTO))
+        
+        for posicao, marca in [(grade.inicio, b'm'), (grade.saida, b'e')]:
+            if posicao is not None:
+                x, y = posicao
+                linha = bytearray(linhas[y + 1])
+                linha[x:x + 1] = marca
+                linhas[y + 1] = linha
+        
+        with open(arquivo, 'wb') as f:
+            f.write(b'\n'.join(linhas))
+            f.write(b'\n')
+    
+    @staticmethod
+    def _bytes_aleatorios(rng, quantidade):
+        """Sorteia `quantidade` bytes de uma vez (determinístico para a semente)"""
+        return rng.getrandbits(8 * quantidade).to_bytes(quantidade, 'little') if quantidade else b''
+    
+    @staticmethod
+    def _malha(celulas, largura, altura):
+        """
+        Marca as células da malha (coordenadas ímpares) ainda não visitadas.
+        
+        Returns:
+            tuple: (disponivel, passos, primeira, ultima, total), com os passos
+            de uma célula da malha à vizinha e os índices da primeira e da
+            última célula
+        """
+        largura_total = largura + 2
+        colunas = (largura - 1) // 2
+        linhas = (altura - 1) // 2
+        
+        disponivel = bytearray(len(celulas))
+        for y in range(1, 2 * linhas, 2):
+            base = (y + 1) * largura_total + 2
+            disponivel[base:base + 2 * colunas:2] = b'\x01' * colunas
+        
+        passos = (-2 * largura_total, 2 * largura_total, -2, 2)
+        primeira = 2 * largura_total + 2
+        ultima = (2 * linhas) * largura_total + 2 * colunas
+        return disponivel, passos, primeira, ultima, colunas * linhas
+    
+    @staticmethod
+    def _coordenadas(indice, largura):
+        y, x = divmod(indice, largura + 2)
+        return (x - 1, y - 1)
+    
+    @staticmethod
+    def _backtracker(celulas, largura, altura, rng):
+        """Backtracker recursivo (DFS com pilha explícita): corredores longos e sinuosos"""
+        disponivel, passos, primeira, ultima, total = GeradorLabirinto._malha(celulas, largura, altura)
+        sorteios = GeradorLabirinto._bytes_aleatorios(rng, total)
+        
+        disponivel[primeira] = 0
+        celulas[primeira] = 1
+        pilha = [primeira]
+        k = 0
+        
+        while pilha:
+            atual = pilha[-1]
+            opcoes = [p for p in passos if disponivel[atual + p]]
+            if not opcoes:
+                pilha.pop()
+                continue
+            
+            passo = opcoes[sorteios[k] % len(opcoes)] if len(opcoes) > 1 else opcoes[0]
+            k += 1
+            proxima = atual + passo
+            disponivel[proxima] = 0
+            celulas[atual + passo // 2] = 1
+            celulas[proxima] = 1
+            pilha.append(proxima)
+        
+        return (GeradorLabirinto._coordenadas(primeira, largura),
+                GeradorLabirinto._coordenadas(ultima, largura))
+    
+    @staticmethod
+    def _prim(celulas, largura, altura, rng):
+        """Prim aleatório: sorteia a célula da fronteira a ligar; muitos becos curtos"""
+        disponivel, passos, primeira, ultima, total = GeradorLabirinto._malha(celulas, largura, altura)
+        aleatorio = rng.random
+        
+        # disponivel: 1 = fora do labirinto, 2 = na fronteira, 0 = no labirinto
+        disponivel[primeira] = 0
+        celulas[primeira] = 1
+        fronteira = []
+        for p in passos:
+            if disponivel[primeira + p]:
+                disponivel[primeira + p] = 2
+                fronteira.append(primeira + p)
+        
+        while fronteira:
+            # Remoção por troca com o último: O(1)
+            i = int(aleatorio() * len(fronteira))
+            atual = fronteira[i]
+            fronteira[i] = fronteira[-1]
+            fronteira.pop()
+            
+            ligacoes = [p for p in passos if celulas[atual + p]]
+            passo = ligacoes[int(aleatorio() * len(ligacoes))]
+            disponivel[atual] = 0
+            celulas[atual + passo // 2] = 1
+            celulas[atual] = 1
+            
+            for p in passos:
+                if disponivel[atual + p] == 1:
+                    disponivel[atual + p] = 2
+                    fronteira.append(atual + p)
+        
+        return (GeradorLabirinto._coordenadas(primeira, largura),
+                GeradorLabirinto._coordenadas(ultima, largura))
+    
+    @staticmethod
+    def _kruskal(celulas, largura, altura, rng):
+        """
+        Kruskal aleatório: derruba as paredes em ordem aleatória sempre que
+        separam dois conjuntos diferentes (união-busca).
+        
+        É o mais lento dos geradores em grades grandes: embaralha todas as
+        paredes antes de começar.
+        """
+        disponivel, passos, primeira, ultima, total = GeradorLabirinto._malha(celulas, largura, altura)
+        largura_total = largura + 2
+        
+        # Paredes internas entre duas células da malha: coluna par (entre
+        # vizinhas na horizontal) ou linha par (entre vizinhas na vertical)
+        paredes = array('I')
+        colunas = (largura - 1) // 2
+        for y in range(1, 2 * ((altura - 1) // 2)):
+            base = (y + 1) * largura_total
+            if y % 2:
+                paredes.extend(range(base + 3, base + 2 * colunas, 2))
+            else:
+                paredes.extend(range(base + 2, base + 2 * colunas + 1, 2))
+        rng.shuffle(paredes)
+        
+        # Cada célula da malha aponta para o representante do seu conjunto;
+        # união por posto e busca com meio caminho, embutidas no laço
+        pai = array('i', range(len(celulas)))
+        posto = bytearray(len(celulas))
+        
+        for parede in paredes:
+            # Coluna par na grade (ímpar no índice com borda): parede horizontal
+            d = 1 if parede % largura_total & 1 else largura_total
+            a = parede - d
+            while pai[a] != a:
+                pai[a] = a = pai[pai[a]]
+            b = parede + d
+            while pai[b] != b:
+                pai[b] = b = pai[pai[b]]
+            if a == b:
+                continue
+            
+            if posto[a] < posto[b]:
+                pai[a] = b
+            else:
+                pai[b] = a
+                if posto[a] == posto[b]:
+                    posto[a] += 1
+            celulas[parede - d] = 1
+            celulas[parede] = 1
+            celulas[parede + d] = 1
+        
+        return (GeradorLabirinto._coordenadas(primeira, largura),
+                GeradorLabirinto._coordenadas(ultima, largura))
+    
+    @staticmethod
+    def _salas(celulas, largura, altura, rng):
+        """
+        Salas retangulares que não se tocam, ligadas em serpentina por
+        corredores em L, mais alguns corredores extras que formam ciclos.
+        """
+        largura_total = largura + 2
+        minimo, maximo = GeradorLabirinto.TAMANHO_SALA
+        minimo = min(minimo, largura - 2, altura - 2)
+        tentativas = max(1, largura * altura // GeradorLabirinto.CELULAS_POR_TENTATIVA)
+        
+        salas = []
+        for _ in range(tentativas):
+            w = rng.randint(minimo, max(minimo, min(maximo, largura - 2)))
+            h = rng.randint(minimo, max(minimo, min(maximo, altura - 2)))
+            x = rng.randint(1, largura - 1 - w)
+            y = rng.randint(1, altura - 1 - h)
+            
+            # Uma célula de parede entre salas: verifica a sala com a moldura
+            base = (y + 1) * largura_total + x
+            if any(celulas.find(1, base + i * largura_total, base + i * largura_total + w + 2) != -1
+                   for i in range(-1, h + 1)):
+                continue
+            
+            for i in range(h):
+                inicio_linha = base + i * largura_total + 1
+                celulas[inicio_linha:inicio_linha + w] = b'\x01' * w
+            salas.append((x + w // 2, y + h // 2))
+        
+        # Serpentina por faixas horizontais: salas consecutivas ficam próximas
+        faixa = 2 * maximo
+        salas.sort(key=lambda c: (c[1] // faixa, c[0] if (c[1] // faixa) % 2 == 0 else -c[0]))
+        
+        def cavar(a, b):
+            (xa, ya), (xb, yb) = a, b
+            base = (ya + 1) * largura_total + 1
+            x0, x1 = min(xa, xb), max(xa, xb)
+            celulas[base + x0:base + x1 + 1] = b'\x01' * (x1 - x0 + 1)
+            
+            y0, y1 = min(ya, yb), max(ya, yb)
+            topo = (y0 + 1) * largura_total + xb + 1
+            celulas[topo:topo + (y1 - y0) * largura_total + 1:largura_total] = b'\x01' * (y1 - y0 + 1)
+        
+        for a, b in zip(salas, salas[1:]):
+            cavar(a, b)
+        for a, b in zip(salas, salas[2:]):
+            if rng.random() < 0.125:
+                cavar(a, b)
+        
+        inicio = salas[0]
+        saida = max(salas, key=lambda c: abs(c[0] - inicio[0]) + abs(c[1] - inicio[1]))
+        if saida == inicio:
+            # Uma única sala: saída no canto oposto
+            ultima = celulas.rfind(1)
+            saida = GeradorLabirinto._coordenadas(ultima, largura)
+        return inicio, saida
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um labirinto no formato texto do jogo")
+    parser.add_argument("largura", type=int)
+    parser.add_argument("altura", type=int)
+    parser.add_argument("arquivo", help="Arquivo de saída")
+    parser.add_argument("--algoritmo", choices=GeradorLabirinto.ALGORITMOS, default="backtracker")
+    parser.add_argument("--semente", type=int, help="Semente do gerador (omitida = aleatória)")
+    args = parser.parse_args(argv)
+    
+    inicio = time.perf_counter()
+    grade = GeradorLabirinto.gerar(args.largura, args.altura, args.algoritmo, args.semente)
+    GeradorLabirinto.salvar(grade, args.arquivo)
+    print(f"Labirinto {args.largura}x{args.altura} ({args.algoritmo}) gravado em {args.arquivo} "
+          f"em {time.perf_counter() - inicio:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Contração de corredores: grafo de junções e becos sem saída
+"""
+import time
+import heapq
+from labirinto import GradeLabirinto, TracoExploracao
+
+class GrafoJuncoes:
+    """
+    Grafo ponderado obtido contraindo os corredores do labirinto.
+    
+    Células livres com exatamente dois vizinhos livres são corredor; todas as
+    outras (junções, becos sem saída, células isoladas) viram nós. Cada
+    corredor entre dois nós vira uma aresta com peso igual ao seu comprimento,
+    guardando apenas o primeiro passo: o trecho é refeito andando pelo
+    corredor, sem armazenar as células intermediárias.
+    """
+    
+    def __init__(self, grade):
+        inicio_tempo = time.perf_counter()
+        self.grade = grade
+        self.impressao = grade.impressao_digital()
+        celulas = grade.celulas
+        deslocamentos = grade.deslocamentos
+        
+        self.celulas_livres = 0
+        self.eh_no = bytearray(len(celulas))
+        for indice in range(len(celulas)):
+            if celulas[indice]:
+                self.celulas_livres += 1
+                # Bytes de terreno valem mais que 1: conta só se a vizinha é livre
+                grau = ((celulas[indice - deslocamentos[1]] != 0) + (celulas[indice + deslocamentos[1]] != 0) +
+                        (celulas[indice - 1] != 0) + (celulas[indice + 1] != 0))
+                if grau != 2:
+                    self.eh_no[indice] = 1
+        
+        # nó -> [(vizinho, custo, primeiro_passo)]
+        self.adjacencias = {}
+        percorridas = bytearray(len(celulas))
+        for indice in range(len(celulas)):
+            if self.eh_no[indice]:
+                self._contrair_a_partir(indice, percorridas)
+        
+        # Ciclos formados só por corredor não têm junção: um nó arbitrário os representa
+        for indice in range(len(celulas)):
+            if celulas[indice] and not self.eh_no[indice] and not percorridas[indice]:
+                self.eh_no[indice] = 1
+                self._contrair_a_partir(indice, percorridas)
+        
+        self.tempo_construcao = time.perf_counter() - inicio_tempo
+    
+    @property
+    def total_nos(self):
+        return len(self.adjacencias)
+    
+    @property
+    def total_arestas(self):
+        return sum(len(arestas) for arestas in self.adjacencias.values()) // 2
+    
+    def _andar(self, origem, passo, limite=None, alvo=None):
+        """
+        Anda pelo corredor a partir de origem, começando por passo, até
+        chegar a um nó (ou ao alvo, ou após limite passos).
+        
+        Returns:
+            tuple: (celula_final, custo, celulas_percorridas)
+        """
+        celulas = self.grade.celulas
+        deslocamentos = self.grade.deslocamentos
+        anterior, atual, custo = origem, origem + passo, 1
+        percorridas = [atual]
+        
+        while not self.eh_no[atual] and atual != alvo and custo != limite:
+            for d in deslocamentos:
+                proxima = atual + d
+                if proxima != anterior and celulas[proxima]:
+                    break
+            anterior, atual = atual, proxima
+            custo += 1
+            percorridas.append(atual)
+        
+        return atual, custo, percorridas
+    
+    def _contrair_a_partir(self, no, percorridas):
+        """Cria as arestas de um nó seguindo cada corredor que sai dele"""
+        celulas = self.grade.celulas
+        arestas = self.adjacencias.setdefault(no, [])
+        percorridas[no] = 1
+        
+        for passo in self.grade.deslocamentos:
+            if not celulas[no + passo]:
+                continue
+            destino, custo, caminho = self._andar(no, passo)
+            for indice in caminho:
+                percorridas[indice] = 1
+            arestas.append((destino, custo, passo))
+    
+    def _conexoes_no_corredor(self, indice, alvo=None):
+        """
+        Arestas temporárias de uma célula de corredor até os nós nas duas
+        pontas do corredor (e direto ao alvo, se estiver no mesmo corredor).
+        """
+        if self.eh_no[indice]:
+            return []
+        
+        conexoes = []
+        celulas = self.grade.celulas
+        for passo in self.grade.deslocamentos:
+            if celulas[indice + passo]:
+                destino, custo, _ = self._andar(indice, passo, alvo=alvo)
+                conexoes.append((destino, custo, passo))
+        return conexoes
+    
+    def _expandir_aresta(self, origem, custo, passo):
+        """Células de uma aresta, refeitas andando custo passos pelo corredor"""
+        _, _, percorridas = self._andar(origem, passo, limite=custo, alvo=-1)
+        return percorridas
+    
+    def buscar(self, inicio, fim, registrar_exploracao=True):
+        """
+        A* no grafo de junções, expandido de volta para um caminho célula a célula.
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), onde
+            caminhos_explorados contém os nós do grafo expandidos
+        """
+        inicio_tempo = time.perf_counter()
+        grade = self.grade
+        largura_total = grade.largura_total
+        indice_inicio = grade.indice(*inicio)
+        indice_fim = grade.indice(*fim)
+        fx, fy = fim
+        
+        # Início e fim no meio de corredores entram como nós temporários
+        extras = {indice_inicio: self._conexoes_no_corredor(indice_inicio, alvo=indice_fim)}
+        for no, custo, passo in self._conexoes_no_corredor(indice_fim):
+            # Aresta reversa: a partir do nó da ponta, o primeiro passo é a
+            # célula anterior a ele no trecho percorrido a partir do fim
+            _, _, percorridas = self._andar(indice_fim, passo, limite=custo, alvo=-1)
+            anterior = percorridas[-2] if len(percorridas) > 1 else indice_fim
+            extras.setdefault(no, []).append((indice_fim, custo, anterior - no))
+        
+        open_set = [(0, indice_inicio)]
+        came_from = {indice_inicio: None}
+        g_score = {indice_inicio: 0}
+        fechados = set()
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+        nos_visitados = 0
+        encontrado = False
+        
+        while open_set:
+            _, atual = heapq.heappop(open_set)
+            if atual in fechados:
+                continue
+            fechados.add(atual)
+            nos_visitados += 1
+            caminhos_explorados.registrar(atual)
+            
+            if atual == indice_fim:
+                encontrado = True
+                break
+            
+            for vizinho, custo, passo in self.adjacencias.get(atual, []) + extras.get(atual, []):
+                g_vizinho = g_score[atual] + custo
+                if vizinho not in g_score or g_vizinho < g_score[vizinho]:
+                    g_score[vizinho] = g_vizinho
+                    came_from[vizinho] = (atual, custo, passo)
+                    vy, vx = divmod(vizinho, largura_total)
+                    heapq.heappush(open_set, (g_vizinho + abs(vx - 1 - fx) + abs(vy - 1 - fy), vizinho))
+        
+        caminho = []
+        if encontrado:
+            trechos = []
+            atual = indice_fim
+            while came_from[atual] is not None:
+                origem, custo, passo = came_from[atual]
+                trechos.append(self._expandir_aresta(origem, custo, passo))
+                atual = origem
+            
+            caminho = [inicio]
+            for trecho in reversed(trechos):
+                caminho.extend(grade.coordenada(indice) for indice in trecho)
+        
+        return caminho, caminhos_explorados, {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': nos_visitados,
+            'algoritmo': 'Grafo de Junções (A*)',
+            'caminho_encontrado': encontrado,
+            'nos_grafo': self.total_nos,
+            'arestas_grafo': self.total_arestas,
+            'celulas_livres': self.celulas_livres,
+            'tempo_construcao': self.tempo_construcao
+        }
@@ -0,0 +1,105 @@
+"""
+Instrumentação das buscas: cronômetro de alta resolução e contadores
+"""
+import time
+import tracemalloc
+
+class Instrumentacao:
+    """
+    Chave global da instrumentação das buscas.
+    
+    Desligada (padrão), cada busca paga só a consulta a `iniciar()`. Ligada,
+    os motores anexam a estatisticas['instrumentacao'] o tempo medido com
+    perf_counter_ns, nós por segundo, os contadores que já mantêm (inserções
+    e remoções da fila, remoções descartadas, vizinhos verificados) e o
+    tamanho máximo da fronteira. Com medir_memoria, o pico de memória da
+    busca também é medido pelo tracemalloc, o que deixa a busca bem mais lenta.
+    """
+    
+    ativa = False
+    medir_memoria = False
+    
+    @classmethod
+    def configurar(cls, ativa=None, medir_memoria=None):
+        """Liga/desliga a instrumentação e a medição de memória"""
+        if ativa is not None:
+            cls.ativa = ativa
+        if medir_memoria is not None:
+            cls.medir_memoria = medir_memoria
+    
+    @classmethod
+    def estado(cls):
+        """(ativa, medir_memoria), para chaves de cache e processos de trabalho"""
+        return (cls.ativa, cls.medir_memoria)
+    
+    @classmethod
+    def iniciar(cls):
+        """Medicao de uma busca, ou None com a instrumentação desligada"""
+        if not cls.ativa:
+            return None
+        return Medicao(cls.medir_memoria)
+
+class Medicao:
+    """Medição de uma única busca (criada por Instrumentacao.iniciar)"""
+    
+    def __init__(self, medir_memoria=False):
+        self.fronteira_maxima = 0
+        self._parar_tracemalloc = False
+        self._memoria_base = None
+        if medir_memoria:
+            # Já rastreando (ex.: benchmark): mede a partir do uso atual. Sem
+            # reset_peak (Python < 3.9) o pico pode vir de antes da busca
+            if tracemalloc.is_tracing():
+                if hasattr(tracemalloc, 'reset_peak'):
+                    tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._parar_tracemalloc = True
+            self._memoria_base = tracemalloc.get_traced_memory()[0]
+        self.inicio_ns = time.perf_counter_ns()
+    
+    def amostrar_fronteira(self, registrar, fronteira):
+        """
+        Envolve o registrar do traço para medir a fronteira a cada expansão.
+        
+        A amostra é tirada logo após a remoção do nó expandido; somando-o de
+        volta, o máximo coincide com o maior tamanho atingido pela fronteira.
+        """
+        def registrar_medindo(indice):
+            registrar(indice)
+            tamanho = len(fronteira) + 1
+            if tamanho > self.fronteira_maxima:
+                self.fronteira_maxima = tamanho
+        return registrar_medindo
+    
+    def concluir(self, estatisticas, tempo_ns=None, **contadores):
+        """
+        Anexa a medição a estatisticas['instrumentacao'].
+        
+        Args:
+            estatisticas: Estatísticas da busca (precisam de 'nos_visitados')
+            tempo_ns: Tempo a reportar (None usa o tempo desde a criação)
+            **contadores: Contadores específicos do motor
+        """
+        if tempo_ns is None:
+            tempo_ns = time.perf_counter_ns() - self.inicio_ns
+        
+        medicao = dict(contadores)
+        medicao['tempo_ns'] = tempo_ns
+        medicao['nos_por_segundo'] = (estatisticas.get('nos_visitados', 0) * 1_000_000_000 / tempo_ns
+                                      if tempo_ns else 0.0)
+        if self.fronteira_maxima:
+            medicao['fronteira_maxima'] = self.fronteira_maxima
+        if self._memoria_base is not None:
+            medicao['memoria_pico'] = max(0, tracemalloc.get_traced_memory()[1] - self._memoria_base)
+        self.encerrar()
+        
+        estatisticas['instrumentacao'] = medicao
+        return estatisticas
+    
+    def encerrar(self):
+        """Para o tracemalloc, se foi esta medição que o iniciou"""
+        if self._parar_tracemalloc:
+            tracemalloc.stop()
+            self._parar_tracemalloc = False
+        self._memoria_base = None
@@ -42,7 +42,9 @@ class GerenciadorInterface:
     
     def _obter_status_e_cor(self, estado_jogo):
         """Determina o status atual e sua cor"""
-        if not estado_jogo['caminho_encontrado']:
+        if estado_jogo['progresso_busca'] is not None:
+            return f"⏳ Buscando caminho... {estado_jogo['progresso_busca']} nós expandidos", (255, 150, 100)
+        elif not estado_jogo['caminho_encontrado']:
             return "❌ Nenhum caminho encontrado", (255, 100, 100)
         elif estado_jogo['pausado']:
             return "⏸️ PAUSADO - Pressione ESPAÇO para continuar", (255, 255, 100)
@@ -66,7 +68,7 @@ class GerenciadorInterface:
             ]
             stats_col2 = [
                 f"Nós visitados: {estado_jogo['estatisticas'].get('nos_visitados', 0)}",
-                f"Caminho: {len(estado_jogo['caminho_final'])} passos"
+                self._formatar_caminho(estado_jogo)
             ]
         else:
             stats_col1 = [
@@ -78,6 +80,11 @@ class GerenciadorInterface:
                 f"Tempo: {estado_jogo['estatisticas'].get('tempo_execucao', 0):.4f}s"
             ]
         
+        medicao = estado_jogo['estatisticas'].get('instrumentacao')
+        if medicao:
+            stats_col1.append(self._formatar_instrumentacao_fila(medicao))
+            stats_col2.append(self._formatar_instrumentacao_desempenho(medicao))
+        
         # Coluna 1
         for i, stat in enumerate(stats_col1):
             texto = font.render(stat, True, (200, 200, 200))
@@ -89,11 +96,37 @@ class GerenciadorInterface:
             texto = font.render(stat, True, (200, 200, 200))
             tela.blit(texto, (col2_x, y_offset + 30 + (i * 18)))
     
+    def _formatar_caminho(self, estado_jogo):
+        """Tamanho do caminho, com o custo total quando o terreno pesa"""
+        passos = len(estado_jogo['caminho_final'])
+        custo = estado_jogo['estatisticas'].get('custo_caminho')
+        if custo is not None and custo != passos - 1:
+            return f"Caminho: {passos} passos (custo {custo})"
+        return f"Caminho: {passos} passos"
+    
+    def _formatar_instrumentacao_fila(self, medicao):
+        """Linha com os contadores da fila (ou o pico de memória, se só ele existir)"""
+        if 'insercoes_fila' in medicao:
+            return (f"Fila: {medicao['insercoes_fila']} ins. / {medicao['remocoes_fila']} rem. "
+                    f"({medicao['remocoes_descartadas']} desc.) | Fronteira máx.: {medicao.get('fronteira_maxima', 0)}")
+        if 'memoria_pico' in medicao:
+            return f"Memória de pico: {medicao['memoria_pico'] / 1024:.1f} KiB"
+        return f"Tempo: {medicao['tempo_ns'] / 1_000_000:.3f} ms"
+    
+    def _formatar_instrumentacao_desempenho(self, medicao):
+        """Linha com a vazão da busca, vizinhos verificados e memória"""
+        partes = [f"{medicao['nos_por_segundo']:,.0f} nós/s".replace(',', '.')]
+        if 'vizinhos_verificados' in medicao:
+            partes.append(f"{medicao['vizinhos_verificados']} vizinhos")
+        if 'memoria_pico' in medicao and 'insercoes_fila' in medicao:
+            partes.append(f"{medicao['memoria_pico'] / 1024:.1f} KiB")
+        return " | ".join(partes)
+    
     def _desenhar_controles(self, tela, font, estado_jogo, altura_tela):
         """Desenha os controles na parte inferior"""
         if not estado_jogo['caminho_encontrado']:
             controles = [
-                "CONTROLES: [R] Reiniciar | [1-4] Algoritmos | [C] Comparar | [ESC] Sair"
+                "CONTROLES: [R] Reiniciar | [1-5] Algoritmos | [C] Comparar | [ESC] Sair"
             ]
         else:
             controles = [
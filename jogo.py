@@ -51,8 +51,10 @@ class JogoLabirinto:
             # Calcular estatísticas do labirinto
             total_celulas = validacao['altura'] * validacao['largura']
             paredes = sum(linha.count(1) for linha in self.labirinto)
-            caminhos_livres = sum(linha.count(0) for linha in self.labirinto)
+            caminhos_livres = total_celulas - paredes  # Chão, terreno (2-9), rato e saída
             print(f"Paredes: {paredes}, Caminhos livres: {caminhos_livres}")
+            if not validacao['saida_alcancavel']:
+                print("⚠️ A saída não é alcançável a partir do rato")
             
         except Exception as e:
             print(f"Erro ao carregar labirinto: {e}")
@@ -71,6 +73,9 @@ class JogoLabirinto:
         # Gerenciadores principais
         self.interface = GerenciadorInterface(self.config)
         self.pathfinder = GerenciadorPathfinding()
+        self.pathfinder.configurar_instrumentacao(
+            self.config.INSTRUMENTACAO, self.config.INSTRUMENTACAO_MEMORIA
+        )
         
         # Gerenciadores organizados
         self.gerenciador_eventos = GerenciadorEventos(self)
@@ -118,7 +123,9 @@ class JogoLabirinto:
         print("2: Usar BFS otimizado") 
         print("3: Usar A* Manhattan")
         print("4: Usar A* Euclidiano")
+        print("5: Usar Dijkstra (terreno com custo)")
         print("C: Comparar todos os algoritmos")
+        print("I: Ligar/desligar instrumentação da busca")
         print("F11: Alternar Fullscreen")
         print("ESC: Sair do jogo")
         print("+/-: Ajustar velocidade")
@@ -132,7 +139,8 @@ class JogoLabirinto:
             if not running:
                 break
             
-            # Atualizar animações
+            # Avançar a busca em andamento e atualizar animações
+            self.gerenciador_estado.atualizar_busca()
             self.gerenciador_animacoes.atualizar()
             
             # Renderizar frame completo
@@ -141,5 +149,6 @@ class JogoLabirinto:
             pygame.display.flip()
             self.clock.tick(self.config.FPS)
         
+        self.gerenciador_estado.cancelar_busca()
         pygame.quit()
         sys.exit()
@@ -2,6 +2,426 @@
 Gerenciamento de labirintos - carregamento, validação e utilitários
 """
 import os
+import time
+import hashlib
+from array import array
+
+class GradeLabirinto:
+    """
+    Grade compilada do labirinto para os laços de busca.
+    
+    As células ficam em um bytearray plano cercado por uma borda de paredes,
+    de modo que os vizinhos de qualquer célula interna são obtidos somando
+    deslocamentos fixos ao índice, sem checagem de limites. Cada byte é o
+    custo de entrar na célula: 0 = parede, 1 = livre e 2 a 9 = terreno (lama,
+    água...) com esse custo. Buscas que ignoram o custo só testam se o byte é
+    diferente de zero. Largura, altura, início e saída são calculados uma
+    única vez.
+    
+    A visão em lista de listas (com 'm' e 'e') continua disponível em
+    `matriz` e por indexação direta (grade[y][x]), usada pela renderização.
+    Ao serializar (pickle) só o bytearray segue; a matriz é refeita sob demanda.
+    """
+    
+    CUSTO_MAXIMO = 9
+    
+    # Valor na matriz -> byte da célula, e o caminho de volta (byte -> valor)
+    _BYTES = {0: 1, 1: 0, 'm': 1, 'e': 1, **{custo: custo for custo in range(2, CUSTO_MAXIMO + 1)}}
+    _VALORES = (1, 0) + tuple(range(2, CUSTO_MAXIMO + 1))
+    
+    def __init__(self, matriz):
+        self._matriz = matriz
+        self.altura = len(matriz)
+        self.largura = len(matriz[0]) if self.altura > 0 else 0
+        
+        # Largura com a borda: índice = (y + 1) * largura_total + (x + 1)
+        self.largura_total = self.largura + 2
+        self.celulas = bytearray(self.largura_total * (self.altura + 2))
+        
+        # Deslocamentos na ordem cima, baixo, esquerda, direita
+        self.deslocamentos = (-self.largura_total, self.largura_total, -1, 1)
+        
+        self.inicio = None
+        self.saida = None
+        
+        # Incrementada a cada alteração de célula (invalida caches derivados)
+        self.versao = 0
+        self._impressao = None
+        self._custos = None
+        self._componentes = None
+        
+        codigos = self._BYTES
+        for y, linha in enumerate(matriz):
+            base = self.indice(0, y)
+            self.celulas[base:base + self.largura] = bytes(codigos.get(celula, 1) for celula in linha[:self.largura])
+            
+            if 'm' in linha and self.inicio is None:
+                self.inicio = (linha.index('m'), y)
+            if 'e' in linha:
+                self.saida = (len(linha) - 1 - linha[::-1].index('e'), y)
+    
+    @property
+    def matriz(self):
+        """Visão em lista de listas (reconstruída a partir das células se necessário)"""
+        if self._matriz is None:
+            valores = self._VALORES
+            self._matriz = [
+                [valores[celula] for celula in self.celulas[self.indice(0, y):self.indice(self.largura, y)]]
+                for y in range(self.altura)
+            ]
+            if self.inicio is not None:
+                self._matriz[self.inicio[1]][self.inicio[0]] = 'm'
+            if self.saida is not None:
+                self._matriz[self.saida[1]][self.saida[0]] = 'e'
+        return self._matriz
+    
+    def __getstate__(self):
+        # A matriz ocupa dezenas de bytes por célula; o bytearray, um
+        estado = self.__dict__.copy()
+        estado['_matriz'] = None
+        estado['_componentes'] = None
+        return estado
+    
+    @classmethod
+    def de(cls, labirinto):
+        """Retorna a grade compilada de um labirinto (reaproveita se já for uma grade)"""
+        if isinstance(labirinto, cls):
+            return labirinto
+        return cls(labirinto)
+    
+    @classmethod
+    def de_celulas(cls, largura, altura, celulas, inicio=None, saida=None):
+        """
+        Monta a grade direto de um bytearray já no formato compilado (com a
+        borda de paredes), sem passar pela matriz, que só é refeita se pedida.
+        Usado pelo gerador de labirintos, onde a matriz custaria mais que a busca.
+        """
+        if len(celulas) != (largura + 2) * (altura + 2):
+            raise ValueError(f"Células não correspondem a uma grade {largura}x{altura} com borda")
+        
+        grade = cls([])
+        grade._matriz = None
+        grade.largura = largura
+        grade.altura = altura
+        grade.largura_total = largura + 2
+        grade.celulas = celulas
+        grade.deslocamentos = (-grade.largura_total, grade.largura_total, -1, 1)
+        grade.inicio = inicio
+        grade.saida = saida
+        return grade
+    
+    def indice(self, x, y):
+        """Converte coordenadas (x, y) no índice linear da grade"""
+        return (y + 1) * self.largura_total + x + 1
+    
+    def coordenada(self, indice):
+        """Converte um índice linear de volta em coordenadas (x, y)"""
+        y, x = divmod(indice, self.largura_total)
+        return (x - 1, y - 1)
+    
+    def livre(self, indice):
+        """Verifica se a célula do índice é transitável"""
+        return self.celulas[indice] != 0
+    
+    def livre_xy(self, x, y):
+        """Verifica se (x, y) está dentro dos limites e é transitável"""
+        if x < 0 or x >= self.largura or y < 0 or y >= self.altura:
+            return False
+        return self.celulas[self.indice(x, y)] != 0
+    
+    def definir_celula(self, x, y, valor):
+        """
+        Altera uma célula mantendo a matriz e a grade compilada em sincronia.
+        
+        Alterações no labirinto devem passar por aqui para que os caches
+        baseados em `versao` e `impressao_digital()` sejam invalidados e o
+        índice de componentes conexas acompanhe a mudança.
+        """
+        indice = self.indice(x, y)
+        livre_antes = self.celulas[indice] != 0
+        self.matriz[y][x] = valor
+        self.celulas[indice] = self._BYTES.get(valor, 1)
+        self.versao += 1
+        
+        componentes = self._componentes
+        if componentes is not None and componentes.versao == self.versao - 1:
+            if componentes.celula_alterada(indice, livre_antes):
+                componentes.versao = self.versao
+            else:
+                self._componentes = None
+    
+    def impressao_digital(self):
+        """Hash do conteúdo da grade (dimensões + células), recalculado só após alterações"""
+        if self._impressao is None or self._impressao[0] != self.versao:
+            resumo = hashlib.blake2b(digest_size=16)
+            resumo.update(f"{self.largura}x{self.altura}".encode())
+            resumo.update(self.celulas)
+            self._impressao = (self.versao, resumo.hexdigest())
+        return self._impressao[1]
+    
+    def faixa_custos(self):
+        """(menor, maior) custo entre as células livres, recalculado só após alterações"""
+        if self._custos is None or self._custos[0] != self.versao:
+            presentes = [custo for custo in range(1, self.CUSTO_MAXIMO + 1) if custo in self.celulas]
+            self._custos = (self.versao, presentes[0] if presentes else 1, presentes[-1] if presentes else 1)
+        return self._custos[1:]
+    
+    def ponderada(self):
+        """Verifica se alguma célula tem custo de terreno maior que 1"""
+        return self.faixa_custos()[1] > 1
+    
+    def componentes(self):
+        """Índice de componentes conexas (ComponentesConexas), refeito só quando desatualizado"""
+        if self._componentes is None or self._componentes.versao != self.versao:
+            self._componentes = ComponentesConexas(self)
+        return self._componentes
+    
+    def conectadas(self, a, b):
+        """Verifica em O(1) se existe caminho entre as posições livres a e b"""
+        return self.componentes().conectadas(a, b)
+    
+    def deslocamentos_para(self, direcoes):
+        """Converte uma lista de direções (dx, dy) em deslocamentos de índice"""
+        return tuple(dy * self.largura_total + dx for dx, dy in direcoes)
+    
+    def vizinhos(self, indice):
+        """Retorna os índices dos vizinhos transitáveis de uma célula"""
+        celulas = self.celulas
+        return [indice + d for d in self.deslocamentos if celulas[indice + d]]
+    
+    # Visão em lista de listas, compatível com o formato antigo
+    def __getitem__(self, y):
+        return self.matriz[y]
+    
+    def __len__(self):
+        return self.altura
+    
+    def __iter__(self):
+        return iter(self.matriz)
+
+class ComponentesConexas:
+    """
+    Rótulo da componente conexa de cada célula livre da grade.
+    
+    Responde em O(1) se duas células estão ligadas, o que permite recusar
+    consultas sem caminho antes de qualquer busca. A rotulação percorre a
+    grade por trechos horizontais de células livres (localizados com find,
+    sem visitar célula por célula) e une cada trecho aos rótulos da linha de
+    cima por união-busca; no fim, todo rótulo aponta direto para a raiz.
+    
+    GradeLabirinto.definir_celula mantém o índice em dia: abrir uma parede
+    une as componentes vizinhas; fechar uma célula com uma vizinha livre ou
+    menos não separa nada. Só fechar uma célula com duas ou mais vizinhas
+    livres, que pode partir a componente, descarta o índice, refeito na
+    próxima consulta.
+    """
+    
+    # Byte da célula -> 1 se transitável (terreno de qualquer custo) ou 0
+    _LIVRE = bytes([0]) + bytes([1]) * 255
+    
+    def __init__(self, grade):
+        inicio_tempo = time.perf_counter()
+        self.grade = grade
+        self.versao = grade.versao
+        self.rotulos = array('i', [0]) * len(grade.celulas)  # 0 = parede
+        self.pai = [0]
+        self._rotular()
+        self.tempo_construcao = time.perf_counter() - inicio_tempo
+    
+    def _rotular(self):
+        grade = self.grade
+        largura_total = grade.largura_total
+        procurar = grade.celulas.translate(self._LIVRE).find
+        rotulos = self.rotulos
+        pai = self.pai
+        
+        # União-busca embutida no laço (compressão por meio caminho)
+        for y in range(1, grade.altura + 1):
+            base = y * largura_total
+            fim_linha = base + largura_total  # A borda direita (parede) encerra o último trecho
+            x = procurar(1, base, fim_linha)
+            while x != -1:
+                fim = procurar(0, x, fim_linha)
+                if fim - x == 1:
+                    # Célula isolada na linha (comum em labirintos perfeitos)
+                    rotulo = rotulos[x - largura_total]
+                    if rotulo:
+                        while pai[rotulo] != rotulo:
+                            pai[rotulo] = rotulo = pai[pai[rotulo]]
+                    else:
+                        rotulo = len(pai)
+                        pai.append(rotulo)
+                    rotulos[x] = rotulo
+                else:
+                    acima = set(rotulos[x - largura_total:fim - largura_total])
+                    acima.discard(0)
+                    if acima:
+                        rotulo = acima.pop()
+                        while pai[rotulo] != rotulo:
+                            pai[rotulo] = rotulo = pai[pai[rotulo]]
+                        for outro in acima:
+                            while pai[outro] != outro:
+                                pai[outro] = outro = pai[pai[outro]]
+                            if outro != rotulo:
+                                pai[outro] = rotulo
+                    else:
+                        rotulo = len(pai)
+                        pai.append(rotulo)
+                    rotulos[x:fim] = array('i', [rotulo]) * (fim - x)
+                x = procurar(1, fim, fim_linha)
+        
+        self.pai = pai = [self._raiz(rotulo) for rotulo in range(len(pai))]
+        self.quantidade = sum(1 for rotulo in range(1, len(pai)) if pai[rotulo] == rotulo)
+    
+    def _raiz(self, rotulo):
+        pai = self.pai
+        while pai[rotulo] != rotulo:
+            pai[rotulo] = pai[pai[rotulo]]
+            rotulo = pai[rotulo]
+        return rotulo
+    
+    def componente(self, indice):
+        """Componente da célula do índice (0 para parede)"""
+        return self._raiz(self.rotulos[indice])
+    
+    def conectadas(self, a, b):
+        """Verifica se as posições (x, y) a e b são livres e estão na mesma componente"""
+        if not self.grade.livre_xy(*a) or not self.grade.livre_xy(*b):
+            return False
+        return self.componente(self.grade.indice(*a)) == self.componente(self.grade.indice(*b))
+    
+    def celula_alterada(self, indice, livre_antes):
+        """
+        Atualiza os rótulos após a célula do índice mudar.
+        
+        Returns:
+            bool: False se o índice precisa ser refeito (possível separação)
+        """
+        celulas = self.grade.celulas
+        livre = celulas[indice] != 0
+        if livre == livre_antes:
+            return True
+        
+        abertas = [indice + d for d in self.grade.deslocamentos if celulas[indice + d]]
+        if not livre:
+            # Sem vizinhas a componente some; com uma, só encolhe
+            self.rotulos[indice] = 0
+            if not abertas:
+                self.quantidade -= 1
+            return len(abertas) <= 1
+        
+        vizinhas = {self.componente(vizinha) for vizinha in abertas}
+        if not vizinhas:
+            rotulo = len(self.pai)
+            self.pai.append(rotulo)
+            self.quantidade += 1
+        else:
+            rotulo = vizinhas.pop()
+            for outro in vizinhas:
+                self.pai[outro] = rotulo
+                self.quantidade -= 1
+        self.rotulos[indice] = rotulo
+        return True
+
+class TracoExploracao:
+    """
+    Sequência das células exploradas por uma busca, em ordem de expansão.
+    
+    Guarda índices lineares da grade em um array('I') (4 bytes por célula, em
+    vez de uma tupla (x, y) por célula) e decodifica para (x, y) só quando
+    lida: indexação, fatias, len e iteração funcionam como na lista antiga.
+    Os motores de busca gravam com `registrar(indice)`; com `ativo=False` o
+    registro é descartado, para quem só precisa do caminho.
+    
+    O traço completo ainda cresce 4 bytes por expansão. Para memória
+    constante, `ativo` pode ser um inteiro N: só as N primeiras células são
+    guardadas e as demais apenas contadas em `descartadas`.
+    """
+    
+    def __init__(self, largura_total, ativo=True, indices=None):
+        self.largura_total = largura_total
+        self.ativo = ativo
+        self.indices = array('I') if indices is None else indices
+        self.limite = None if isinstance(ativo, bool) else int(ativo)
+        self.descartadas = 0
+        if not ativo:
+            self.registrar = self._descartar
+        elif self.limite is None:
+            self.registrar = self.indices.append
+        else:
+            self.registrar = self._registrar_limitado
+    
+    @classmethod
+    def para(cls, grade, ativo=True):
+        """Traço vazio para as buscas em uma grade"""
+        return cls(grade.largura_total, ativo)
+    
+    @staticmethod
+    def _descartar(indice):
+        pass
+    
+    def _registrar_limitado(self, indice):
+        if len(self.indices) < self.limite:
+            self.indices.append(indice)
+        else:
+            self.descartadas += 1
+    
+    def registrar_lote(self, dados):
+        """Registra de uma vez índices uint32 em bytes (motores vetorizados), respeitando o limite"""
+        if not self.ativo:
+            return
+        if self.limite is not None:
+            espaco = max(0, self.limite - len(self.indices)) * self.indices.itemsize
+            self.descartadas += max(0, len(dados) - espaco) // self.indices.itemsize
+            dados = dados[:espaco]
+        self.indices.frombytes(dados)
+    
+    def _decodificar(self, indice):
+        y, x = divmod(indice, self.largura_total)
+        return (x - 1, y - 1)
+    
+    def append(self, posicao):
+        """Registra uma posição (x, y), por compatibilidade com a lista antiga"""
+        x, y = posicao
+        self.registrar((y + 1) * self.largura_total + x + 1)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return TracoExploracao(self.largura_total, self.ativo, self.indices[i])
+        return self._decodificar(self.indices[i])
+    
+    def __len__(self):
+        return len(self.indices)
+    
+    def __iter__(self):
+        largura_total = self.largura_total
+        for indice in self.indices:
+            y, x = divmod(indice, largura_total)
+            yield (x - 1, y - 1)
+    
+    def __eq__(self, outro):
+        if isinstance(outro, TracoExploracao):
+            return self.largura_total == outro.largura_total and self.indices == outro.indices
+        return list(self) == list(outro)
+    
+    # Mutável e comparado por conteúdo, como a lista que substitui: não é hashable
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"TracoExploracao({len(self)} células)"
+    
+    @property
+    def nbytes(self):
+        return self.indices.itemsize * len(self.indices)
+    
+    def __getstate__(self):
+        # O método ligado em `registrar` é refeito na volta
+        return {'largura_total': self.largura_total, 'ativo': self.ativo, 'indices': self.indices,
+                'descartadas': self.descartadas}
+    
+    def __setstate__(self, estado):
+        self.__init__(estado['largura_total'], estado['ativo'], estado['indices'])
+        self.descartadas = estado.get('descartadas', 0)
 
 class GerenciadorLabirinto:
     """Gerencia o carregamento e validação de labirintos"""
@@ -15,7 +435,8 @@ class GerenciadorLabirinto:
             arquivo (str): Caminho para o arquivo do labirinto
             
         Returns:
-            list: Matriz representando o labirinto
+            GradeLabirinto: Grade compilada (também indexável como matriz),
+            com o índice de componentes conexas já calculado
             
         Raises:
             FileNotFoundError: Se o arquivo não existir
@@ -52,12 +473,13 @@ class GerenciadorLabirinto:
                 
                 labirinto.append(linha_labirinto)
             
-            # Validar labirinto
-            validacao = GerenciadorLabirinto.validar_labirinto(labirinto)
+            # Validar labirinto (a grade guarda as componentes calculadas na validação)
+            grade = GradeLabirinto(labirinto)
+            validacao = GerenciadorLabirinto.validar_labirinto(grade)
             if not validacao['valido']:
                 raise ValueError(f"Labirinto inválido: {validacao['erro']}")
             
-            return labirinto
+            return grade
                 
         except (ValueError, IOError) as e:
             raise ValueError(f"Erro ao carregar labirinto: {e}")
@@ -95,6 +517,8 @@ class GerenciadorLabirinto:
                 linha_labirinto.append(0)  # Caminho livre
             elif c == '1' or c == '#':
                 linha_labirinto.append(1)  # Parede
+            elif '2' <= c <= '9':
+                linha_labirinto.append(int(c))  # Terreno com custo de passo c
             elif c.lower() == 'm':
                 linha_labirinto.append('m')  # Posição do rato
                 if posicao_rato_atual is not None:
@@ -114,6 +538,9 @@ class GerenciadorLabirinto:
     @staticmethod
     def encontrar_posicao_inicial(labirinto):
         """Encontra a posição inicial do rato no labirinto"""
+        if isinstance(labirinto, GradeLabirinto):
+            return labirinto.inicio
+        
         for i in range(len(labirinto)):
             for j in range(len(labirinto[i])):
                 if labirinto[i][j] == 'm':
@@ -123,6 +550,9 @@ class GerenciadorLabirinto:
     @staticmethod
     def encontrar_posicao_saida(labirinto):
         """Encontra a posição da saída no labirinto"""
+        if isinstance(labirinto, GradeLabirinto):
+            return labirinto.saida
+        
         for i in range(len(labirinto) - 1, -1, -1):
             for j in range(len(labirinto[i]) - 1, -1, -1):
                 if labirinto[i][j] == 'e':
@@ -135,7 +565,8 @@ class GerenciadorLabirinto:
         Valida se o labirinto tem uma estrutura válida.
         
         Returns:
-            dict: Informações sobre a validação
+            dict: Informações sobre a validação; se válido, 'saida_alcancavel'
+            diz se existe caminho do rato até a saída
         """
         if not labirinto:
             return {'valido': False, 'erro': 'Labirinto vazio'}
@@ -164,13 +595,17 @@ class GerenciadorLabirinto:
             return {'valido': False, 'erro': f'Deve haver exatamente 1 rato, encontrados: {ratos}'}
         if saidas != 1:
             return {'valido': False, 'erro': f'Deve haver exatamente 1 saída, encontradas: {saidas}'}
-
+        
+        # Um labirinto sem caminho até a saída é válido, mas é informado
+        grade = GradeLabirinto.de(labirinto)
+        
         return {
             'valido': True,
             'altura': altura,
             'largura': largura,
             'ratos': ratos,
-            'saidas': saidas
+            'saidas': saidas,
+            'saida_alcancavel': grade.conectadas(grade.inicio, grade.saida)
         }
     
     @staticmethod
@@ -188,6 +623,9 @@ class GerenciadorLabirinto:
         if not labirinto:
             return False
         
+        if isinstance(labirinto, GradeLabirinto):
+            return labirinto.livre_xy(x, y)
+        
         altura = len(labirinto)
         largura = len(labirinto[0]) if altura > 0 else 0
         
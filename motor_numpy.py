@@ -0,0 +1,133 @@
+"""
+BFS vetorizado com NumPy, carregado só quando o algoritmo "bfs_numpy" é usado
+"""
+import time
+from labirinto import GradeLabirinto, TracoExploracao
+from pathfinding import AlgoritmoBFSPredecessores
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o BFS vetorizado usa o motor em Python
+    np = None
+
+class AlgoritmoBFSNumpy:
+    """
+    BFS vetorizado com NumPy (frente de onda).
+    
+    Expande a fronteira inteira a cada passo: os vizinhos de todas as células
+    da camada atual são gerados de uma vez somando os deslocamentos da grade ao
+    vetor de índices, e filtrados pela máscara booleana de células livres ainda
+    não alcançadas. O custo por camada é proporcional ao tamanho da fronteira,
+    e não à área do labirinto. Além do caminho, retorna o campo de distâncias.
+    """
+    
+    @staticmethod
+    def disponivel():
+        """Indica se o NumPy está instalado"""
+        return np is not None
+    
+    @staticmethod
+    def bfs_vetorizado(labirinto, inicio, fim, registrar_exploracao=True):
+        """
+        BFS por camadas com operações vetorizadas.
+        
+        Sem NumPy, cai de forma transparente para o motor BFS em Python.
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), com o campo
+            de distâncias (altura x largura, -1 = inalcançável) em
+            estatisticas['campo_distancias']
+        """
+        if np is None:
+            caminho, caminhos_explorados, estatisticas = AlgoritmoBFSPredecessores.busca(
+                labirinto, inicio, fim, nome='BFS Vetorizado (fallback Python)',
+                registrar_exploracao=registrar_exploracao
+            )
+            estatisticas['backend'] = 'python'
+            return caminho, caminhos_explorados, estatisticas
+        
+        if not labirinto or not inicio or not fim:
+            return [], [], {'erro': 'Parâmetros inválidos'}
+        
+        inicio_tempo = time.perf_counter()
+        grade = GradeLabirinto.de(labirinto)
+        largura_total = grade.largura_total
+        deslocamentos = np.array(grade.deslocamentos, dtype=np.int64)
+        indice_inicio = grade.indice(*inicio)
+        indice_fim = grade.indice(*fim)
+        
+        nao_alcancados = np.frombuffer(grade.celulas, dtype=np.uint8).astype(bool)
+        distancias = np.full(len(grade.celulas), -1, dtype=np.int32)
+        # Rascunho para deduplicar candidatos sem ordenar (última escrita vence)
+        dono = np.zeros(len(grade.celulas), dtype=np.int64)
+        
+        fronteira = np.array([indice_inicio], dtype=np.int64)
+        distancias[indice_inicio] = 0
+        nao_alcancados[indice_inicio] = False
+        camadas = [fronteira]
+        nivel = 0
+        encontrado = indice_inicio == indice_fim
+        
+        while not encontrado:
+            # Todos os vizinhos da camada de uma vez, filtrados pela máscara
+            candidatos = (fronteira[:, None] + deslocamentos).ravel()
+            candidatos = candidatos[nao_alcancados[candidatos]]
+            if candidatos.size == 0:
+                break
+            
+            posicoes = np.arange(candidatos.size)
+            dono[candidatos] = posicoes
+            candidatos = candidatos[dono[candidatos] == posicoes]
+            
+            nivel += 1
+            distancias[candidatos] = nivel
+            nao_alcancados[candidatos] = False
+            fronteira = candidatos
+            
+            if distancias[indice_fim] == nivel:
+                # Camada final termina no destino, como no BFS tradicional
+                posicao = int(np.flatnonzero(candidatos == indice_fim)[0])
+                camadas.append(candidatos[:posicao + 1])
+                encontrado = True
+            else:
+                camadas.append(candidatos)
+        
+        # As camadas já são índices da grade: o traço é cópia direta dos bytes
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+        if registrar_exploracao:
+            caminhos_explorados.registrar_lote(np.concatenate(camadas).astype(np.uint32).tobytes())
+        nos_visitados = sum(camada.size for camada in camadas)
+        
+        caminho = []
+        if encontrado:
+            caminho = AlgoritmoBFSNumpy._descer_campo(distancias, indice_fim, grade)
+        
+        campo = distancias.reshape(grade.altura + 2, largura_total)[1:-1, 1:-1]
+        fim_tempo = time.perf_counter()
+        return caminho, caminhos_explorados, {
+            'tempo_execucao': fim_tempo - inicio_tempo,
+            'nos_visitados': nos_visitados,
+            'algoritmo': 'BFS Vetorizado (NumPy)',
+            'caminho_encontrado': encontrado,
+            'backend': 'numpy',
+            'camadas': nivel,
+            'campo_distancias': campo
+        }
+    
+    @staticmethod
+    def _descer_campo(distancias, indice_fim, grade):
+        """Reconstrói o caminho descendo o campo de distâncias a partir do destino"""
+        atual = indice_fim
+        distancia = int(distancias[atual])
+        caminho = [grade.coordenada(atual)]
+        
+        while distancia > 0:
+            for d in grade.deslocamentos:
+                if distancias[atual + d] == distancia - 1:
+                    atual += d
+                    break
+            distancia -= 1
+            caminho.append(grade.coordenada(atual))
+        
+        caminho.reverse()
+        return caminho
@@ -0,0 +1,267 @@
+"""
+Motor SciPy: distâncias em massa com scipy.sparse.csgraph sobre a grade em CSR
+"""
+import sys
+import time
+import argparse
+from labirinto import GerenciadorLabirinto, GradeLabirinto, TracoExploracao
+
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+except ImportError:  # SciPy é opcional: sem ele o algoritmo "csgraph" usa o Dijkstra em Python
+    np = None
+
+class GrafoCSR:
+    """
+    Labirinto como matriz de adjacência esparsa (CSR) para o scipy.sparse.csgraph.
+    
+    Cada célula livre vira um nó, numerado na ordem da grade, e cada passo
+    entre vizinhas livres vira uma aresta dirigida com o custo da célula de
+    destino, como no A* e no Dijkstra (Dial). A matriz é montada uma vez com
+    operações vetorizadas; as consultas em massa rodam no código compilado
+    do csgraph, sem laços em Python por célula. Distâncias voltam como
+    arrays NumPy int32, com -1 para inalcançável.
+    """
+    
+    # Teto da matriz intermediária (origens x nós, float64) de cada chamada ao csgraph
+    BYTES_POR_BLOCO = 64 * 1024 * 1024
+    
+    @staticmethod
+    def disponivel():
+        """Indica se NumPy e SciPy estão instalados"""
+        return np is not None
+    
+    def __init__(self, labirinto):
+        if np is None:
+            raise ImportError("GrafoCSR requer NumPy e SciPy (pip install numpy scipy)")
+        
+        inicio_tempo = time.perf_counter()
+        grade = GradeLabirinto.de(labirinto)
+        self.grade = grade
+        self.impressao = grade.impressao_digital()
+        self.ponderado = grade.ponderada()
+        
+        celulas = np.frombuffer(grade.celulas, dtype=np.uint8)
+        # nó -> índice da grade e índice da grade -> nó (-1 nas paredes)
+        self.indices_grade = np.flatnonzero(celulas)
+        self.nos = np.full(len(celulas), -1, dtype=np.int32)
+        self.nos[self.indices_grade] = np.arange(self.indices_grade.size, dtype=np.int32)
+        
+        # A borda da grade é parede, então vizinho + deslocamento nunca sai do vetor
+        origens, destinos, custos = [], [], []
+        for d in grade.deslocamentos:
+            vizinhos = self.indices_grade + d
+            livres = celulas[vizinhos] != 0
+            vizinhos = vizinhos[livres]
+            origens.append(np.flatnonzero(livres))
+            destinos.append(self.nos[vizinhos])
+            custos.append(celulas[vizinhos])
+        
+        total = self.indices_grade.size
+        self.matriz = csr_matrix(
+            (np.concatenate(custos).astype(np.float64), (np.concatenate(origens), np.concatenate(destinos))),
+            shape=(total, total)
+        )
+        self.tempo_construcao = time.perf_counter() - inicio_tempo
+    
+    @property
+    def total_nos(self):
+        return self.indices_grade.size
+    
+    @property
+    def total_arestas(self):
+        return self.matriz.nnz
+    
+    def no(self, posicao):
+        """Nó da célula (x, y), ou -1 se for parede ou estiver fora do labirinto"""
+        if not self.grade.livre_xy(*posicao):
+            return -1
+        return int(self.nos[self.grade.indice(*posicao)])
+    
+    def posicoes(self, nos):
+        """Converte nós em uma lista de (x, y), o formato de caminho do projeto"""
+        y, x = np.divmod(self.indices_grade[nos], self.grade.largura_total)
+        return list(zip((x - 1).tolist(), (y - 1).tolist()))
+    
+    def _nos_de(self, posicoes):
+        """Nós das posições, recusando paredes e posições fora do labirinto"""
+        nos = np.array([self.no(posicao) for posicao in posicoes], dtype=np.int32)
+        if (nos < 0).any():
+            invalida = posicoes[int(np.flatnonzero(nos < 0)[0])]
+            raise ValueError(f"Posição {tuple(invalida)} é parede ou está fora do labirinto")
+        return nos
+    
+    def _dijkstra(self, origens, predecessores=False):
+        """csgraph.dijkstra a partir dos nós; em grades sem terreno o csgraph ignora os pesos"""
+        return dijkstra(self.matriz, directed=True, indices=origens,
+                        return_predecessors=predecessores, unweighted=not self.ponderado)
+    
+    @staticmethod
+    def _inteiros(distancias):
+        """Distâncias float (inf = inalcançável) como int32 (-1 = inalcançável)"""
+        resultado = np.full(distancias.shape, -1, dtype=np.int32)
+        finitas = np.isfinite(distancias)
+        resultado[finitas] = distancias[finitas]
+        return resultado
+    
+    def _matriz_distancias(self, nos_origem, nos_destino=None):
+        """Linhas de distâncias das origens, em blocos que respeitam BYTES_POR_BLOCO"""
+        colunas = self.total_nos if nos_destino is None else nos_destino.size
+        resultado = np.empty((nos_origem.size, colunas), dtype=np.int32)
+        bloco = max(1, self.BYTES_POR_BLOCO // (8 * max(1, self.total_nos)))
+        
+        for i in range(0, nos_origem.size, bloco):
+            parcial = self._dijkstra(nos_origem[i:i + bloco])
+            if nos_destino is not None:
+                parcial = parcial[:, nos_destino]
+            resultado[i:i + bloco] = self._inteiros(parcial)
+        return resultado
+    
+    def distancias(self, origens, destinos=None):
+        """
+        Distâncias de cada origem a cada destino.
+        
+        Args:
+            origens: Posições (x, y) livres
+            destinos: Posições (x, y) livres, ou None para todos os nós (colunas
+                na ordem dos nós; `posicoes(range(total_nos))` as nomeia)
+        
+        Returns:
+            numpy.ndarray: int32 (origens x destinos), -1 = inalcançável
+        """
+        nos_destino = None if destinos is None else self._nos_de(destinos)
+        return self._matriz_distancias(self._nos_de(origens), nos_destino)
+    
+    def campo(self, origem):
+        """
+        Campo de distâncias a partir de origem, no formato de
+        estatisticas['campo_distancias'] do BFS vetorizado.
+        
+        Returns:
+            numpy.ndarray: int32 (altura x largura), -1 = parede ou inalcançável
+        """
+        campo = np.full(len(self.grade.celulas), -1, dtype=np.int32)
+        campo[self.indices_grade] = self._matriz_distancias(self._nos_de([origem]))[0]
+        return campo.reshape(self.grade.altura + 2, self.grade.largura_total)[1:-1, 1:-1]
+    
+    def juncoes(self):
+        """Posições das células livres com grau diferente de 2 (junções e becos, como em GrafoJuncoes)"""
+        return self.posicoes(self._nos_juncoes())
+    
+    def _nos_juncoes(self):
+        livres = np.frombuffer(self.grade.celulas, dtype=np.uint8) != 0
+        grau = np.zeros(self.total_nos, dtype=np.int8)
+        for d in self.grade.deslocamentos:
+            grau += livres[self.indices_grade + d]
+        return np.flatnonzero(grau != 2)
+    
+    def matriz_juncoes(self):
+        """
+        Distâncias entre todos os pares de junções.
+        
+        Returns:
+            tuple: (posicoes, matriz), com matriz[i, j] a distância de
+            posicoes[i] a posicoes[j] (int32, -1 = inalcançável)
+        """
+        nos = self._nos_juncoes()
+        return self.posicoes(nos), self._matriz_distancias(nos, nos)
+    
+    def caminhos(self, origem, destinos):
+        """
+        Menores caminhos de uma origem a vários destinos, com uma única busca.
+        
+        Returns:
+            list: Um caminho [(x, y), ...] por destino ([] se inalcançável)
+        """
+        no_origem = self._nos_de([origem])[0]
+        distancias, predecessores = self._dijkstra(no_origem, predecessores=True)
+        return [self._caminho(predecessores, no) if np.isfinite(distancias[no]) else []
+                for no in self._nos_de(destinos)]
+    
+    def _caminho(self, predecessores, no_destino):
+        """Caminho até no_destino seguindo os predecessores do csgraph (-9999 na origem)"""
+        nos = []
+        no = int(no_destino)
+        while no >= 0:
+            nos.append(no)
+            no = int(predecessores[no])
+        nos.reverse()
+        return self.posicoes(nos)
+    
+    def buscar(self, inicio, fim, registrar_exploracao=True):
+        """
+        Menor caminho de inicio a fim pelo csgraph.
+        
+        O csgraph não expõe a ordem de expansão: o traço lista, em ordem de
+        distância, os nós que um Dijkstra fecharia antes de chegar ao destino.
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), com o custo
+            total em estatisticas['custo_caminho'] quando há caminho
+        """
+        inicio_tempo = time.perf_counter()
+        caminhos_explorados = TracoExploracao.para(self.grade, registrar_exploracao)
+        no_inicio, no_fim = self.no(inicio), self.no(fim)
+        estatisticas = {
+            'algoritmo': 'Dijkstra (SciPy csgraph)',
+            'backend': 'scipy',
+            'nos_grafo': self.total_nos,
+            'tempo_construcao_grafo': self.tempo_construcao
+        }
+        if no_inicio < 0 or no_fim < 0:
+            estatisticas.update(tempo_execucao=time.perf_counter() - inicio_tempo,
+                                nos_visitados=0, caminho_encontrado=False)
+            return [], caminhos_explorados, estatisticas
+        
+        distancias, predecessores = self._dijkstra(no_inicio, predecessores=True)
+        custo = distancias[no_fim]
+        encontrado = bool(np.isfinite(custo))
+        
+        fechados = np.flatnonzero(distancias < custo if encontrado else np.isfinite(distancias))
+        fechados = fechados[np.argsort(distancias[fechados], kind='stable')]
+        if encontrado:
+            fechados = np.append(fechados, no_fim)
+        if registrar_exploracao:
+            caminhos_explorados.registrar_lote(self.indices_grade[fechados].astype(np.uint32).tobytes())
+        
+        caminho = self._caminho(predecessores, no_fim) if encontrado else []
+        estatisticas.update(tempo_execucao=time.perf_counter() - inicio_tempo,
+                            nos_visitados=int(fechados.size), caminho_encontrado=encontrado)
+        if encontrado:
+            estatisticas['custo_caminho'] = int(custo)
+        return caminho, caminhos_explorados, estatisticas
+
+def main(argv=None):
+    """Linha de comando: matriz de distâncias entre junções (ou campo a partir do rato) em .npy"""
+    parser = argparse.ArgumentParser(description="Distâncias em massa com scipy.sparse.csgraph")
+    parser.add_argument("labirinto", help="Arquivo do labirinto")
+    parser.add_argument("saida", help="Arquivo .npy de saída")
+    parser.add_argument("--campo", action="store_true",
+                        help="Salva o campo de distâncias a partir do rato em vez da matriz de junções")
+    args = parser.parse_args(argv)
+    
+    if not GrafoCSR.disponivel():
+        print("❌ NumPy e SciPy são necessários: pip install numpy scipy")
+        return 1
+    
+    grade = GerenciadorLabirinto.criar_labirinto(args.labirinto)
+    grafo = GrafoCSR(grade)
+    print(f"Grafo CSR: {grafo.total_nos} nós, {grafo.total_arestas} arestas "
+          f"({grafo.tempo_construcao:.3f}s)")
+    
+    inicio_tempo = time.perf_counter()
+    if args.campo:
+        resultado = grafo.campo(grade.inicio)
+        descricao = f"campo {resultado.shape[0]}x{resultado.shape[1]} a partir de {grade.inicio}"
+    else:
+        posicoes, resultado = grafo.matriz_juncoes()
+        np.save(args.saida.rsplit(".", 1)[0] + "_posicoes.npy", np.array(posicoes, dtype=np.int32))
+        descricao = f"matriz {len(posicoes)}x{len(posicoes)} entre junções"
+    np.save(args.saida, resultado)
+    print(f"✓ {descricao} em {time.perf_counter() - inicio_tempo:.3f}s -> {args.saida}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
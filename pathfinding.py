@@ -1,64 +1,333 @@
 """
 Algoritmos de pathfinding - BFS, A* e otimizações
 """
+import os
+import sys
 import time
 import heapq
-from collections import deque
-from labirinto import GerenciadorLabirinto
+import threading
+import multiprocessing
+import multiprocessing.connection
+from array import array
+from collections import OrderedDict, deque
+from labirinto import GerenciadorLabirinto, GradeLabirinto, TracoExploracao
+from instrumentacao import Instrumentacao
+from busca_hierarquica import AbstracaoHierarquica
+from grafo_juncoes import GrafoJuncoes
+from busca_incremental import PlanejadorIncremental
+from registro_algoritmos import RegistroAlgoritmos
 
-class AlgoritmoBFS:
-    """Implementa o algoritmo BFS básico para busca de caminhos"""
+def concluir_passos(gerador):
+    """Esgota um gerador de busca em passos e retorna o resultado da busca"""
+    while True:
+        try:
+            next(gerador)
+        except StopIteration as fim:
+            return fim.value
+
+class AlgoritmoBFSPredecessores:
+    """
+    Motor BFS com vetor de predecessores.
+    
+    Em vez de enfileirar uma cópia do caminho para cada nó, guarda apenas o
+    índice do predecessor de cada célula em um array plano e reconstrói o
+    caminho uma única vez ao atingir o destino. Memória O(células) e tempo
+    O(células), independente do comprimento do caminho.
+    """
+    
+    DIRECOES_PADRAO = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # cima, baixo, esquerda, direita
     
     @staticmethod
-    def bfs_menor_caminho(labirinto, inicio, fim):
-        """BFS básico - mantido para compatibilidade"""
+    def reconstruir_caminho(predecessores, indice_fim, grade):
+        """Reconstrói o caminho (lista de (x, y)) seguindo os predecessores"""
+        caminho = []
+        atual = indice_fim
+        while True:
+            caminho.append(grade.coordenada(atual))
+            anterior = predecessores[atual]
+            if anterior == atual:
+                break
+            atual = anterior
+        caminho.reverse()
+        return caminho
+    
+    @staticmethod
+    def busca(labirinto, inicio, fim, direcoes=None, nome='BFS', registrar_exploracao=True):
+        """
+        Executa a BFS a partir de inicio até fim.
+        
+        Args:
+            labirinto: Matriz do labirinto
+            inicio: Posição inicial (x, y)
+            fim: Posição final (x, y)
+            direcoes: Ordem de expansão dos vizinhos (None usa cima, baixo, esquerda, direita)
+            nome: Nome do algoritmo reportado nas estatísticas
+            registrar_exploracao: False devolve um traço vazio (só o caminho interessa)
+            
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas)
+        """
+        return concluir_passos(AlgoritmoBFSPredecessores.passos(
+            labirinto, inicio, fim, direcoes, nome, registrar_exploracao
+        ))
+    
+    @staticmethod
+    def passos(labirinto, inicio, fim, direcoes=None, nome='BFS', registrar_exploracao=True,
+               tamanho_lote=0, caminhos_explorados=None):
+        """
+        BFS retomável: gerador que pausa a cada tamanho_lote expansões,
+        produzindo o total de nós visitados até ali, e termina devolvendo o
+        mesmo resultado de busca (em StopIteration.value).
+        
+        Args:
+            tamanho_lote: Expansões entre pausas (0 nunca pausa)
+            caminhos_explorados: TracoExploracao a preencher (None cria um novo)
+        """
         if not labirinto or not inicio or not fim:
             return [], [], {'erro': 'Parâmetros inválidos'}
         
-        inicio_tempo = time.time()
-        queue = deque([(inicio, [inicio])])
-        visitados = set()
-        caminhos_explorados = []
-        nos_visitados = 0
-        
-        while queue:
-            (x, y), caminho = queue.popleft()
-            nos_visitados += 1
+        inicio_tempo = time.perf_counter()
+        medicao = Instrumentacao.iniciar()
+        try:
+            grade = GradeLabirinto.de(labirinto)
+            celulas = grade.celulas
+            deslocamentos = grade.deslocamentos_para(direcoes or AlgoritmoBFSPredecessores.DIRECOES_PADRAO)
             
-            if (x, y) in visitados:
-                continue
-            
-            visitados.add((x, y))
-            caminhos_explorados.append((x, y))
+            # -1 = não descoberto; o início aponta para si mesmo
+            predecessores = array('i', [-1]) * len(celulas)
+            indice_inicio = grade.indice(*inicio)
+            indice_fim = grade.indice(*fim)
+            predecessores[indice_inicio] = indice_inicio
             
-            # Verificar se chegou ao destino
-            if (x, y) == fim:
-                fim_tempo = time.time()
-                return caminho, caminhos_explorados, {
-                    'tempo_execucao': fim_tempo - inicio_tempo,
-                    'nos_visitados': nos_visitados,
-                    'algoritmo': 'BFS',
-                    'caminho_encontrado': True
-                }
+            queue = deque([indice_inicio])
+            if caminhos_explorados is None:
+                caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+            registrar = caminhos_explorados.registrar
+            if medicao is not None:
+                registrar = medicao.amostrar_fronteira(registrar, queue)
+            nos_visitados = 0
+            proxima_pausa = tamanho_lote or -1
+            encontrado = False
             
-            # Explorar vizinhos (direções: cima, baixo, esquerda, direita)
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                nx, ny = x + dx, y + dy
+            while queue:
+                atual = queue.popleft()
+                nos_visitados += 1
+                registrar(atual)
+                
+                if nos_visitados == proxima_pausa:
+                    yield nos_visitados
+                    proxima_pausa += tamanho_lote
                 
-                if (nx, ny) not in visitados and GerenciadorLabirinto.eh_posicao_valida(nx, ny, labirinto):
-                    queue.append(((nx, ny), caminho + [(nx, ny)]))
+                # Verificar se chegou ao destino
+                if atual == indice_fim:
+                    encontrado = True
+                    break
+                
+                # A borda de paredes da grade dispensa a checagem de limites
+                for d in deslocamentos:
+                    vizinho = atual + d
+                    if predecessores[vizinho] == -1 and celulas[vizinho]:
+                        predecessores[vizinho] = atual
+                        queue.append(vizinho)
+            
+            caminho = []
+            if encontrado:
+                caminho = AlgoritmoBFSPredecessores.reconstruir_caminho(predecessores, indice_fim, grade)
+            
+            fim_tempo = time.perf_counter()
+            estatisticas = {
+                'tempo_execucao': fim_tempo - inicio_tempo,
+                'nos_visitados': nos_visitados,
+                'algoritmo': nome,
+                'caminho_encontrado': encontrado
+            }
+            if medicao is not None:
+                # Cada nó removido foi inserido uma vez; o destino não verifica vizinhos
+                medicao.concluir(
+                    estatisticas,
+                    insercoes_fila=nos_visitados + len(queue),
+                    remocoes_fila=nos_visitados,
+                    remocoes_descartadas=0,
+                    vizinhos_verificados=len(deslocamentos) * (nos_visitados - encontrado)
+                )
+            return caminho, caminhos_explorados, estatisticas
+        finally:
+            if medicao is not None:
+                medicao.encerrar()
+
+class CampoDistancias:
+    """
+    Campo de distâncias BFS a partir de uma origem fixa (normalmente a saída).
+    
+    Calculado uma vez por labirinto; depois disso o menor caminho de qualquer
+    célula até a origem sai por descida gulosa no campo, em tempo proporcional
+    ao comprimento do caminho.
+    """
+    
+    def __init__(self, grade, origem):
+        self.grade = grade
+        self.origem = origem
+        self.impressao = grade.impressao_digital()
         
-        fim_tempo = time.time()
-        return [], caminhos_explorados, {
-            'tempo_execucao': fim_tempo - inicio_tempo,
-            'nos_visitados': nos_visitados,
-            'algoritmo': 'BFS',
-            'caminho_encontrado': False
-        }
+        inicio_tempo = time.perf_counter()
+        self.distancias = CampoDistancias.calcular(grade, grade.indice(*origem))
+        self.tempo_construcao = time.perf_counter() - inicio_tempo
+    
+    @staticmethod
+    def calcular(grade, indice_origem):
+        """BFS completo sem destino; retorna as distâncias (-1 = inalcançável)"""
+        celulas = grade.celulas
+        deslocamentos = grade.deslocamentos
+        distancias = array('i', [-1]) * len(celulas)
+        distancias[indice_origem] = 0
+        queue = deque([indice_origem])
+        
+        while queue:
+            atual = queue.popleft()
+            proxima = distancias[atual] + 1
+            for d in deslocamentos:
+                vizinho = atual + d
+                if distancias[vizinho] == -1 and celulas[vizinho]:
+                    distancias[vizinho] = proxima
+                    queue.append(vizinho)
+        
+        return distancias
+    
+    def distancia(self, posicao):
+        """Distância de uma posição até a origem (-1 = inalcançável)"""
+        return self.distancias[self.grade.indice(*posicao)]
+    
+    def caminho_de(self, inicio):
+        """Menor caminho de inicio até a origem por descida gulosa (vazio se inalcançável)"""
+        grade = self.grade
+        distancias = self.distancias
+        atual = grade.indice(*inicio)
+        distancia = distancias[atual]
+        if distancia == -1:
+            return []
+        
+        caminho = [inicio]
+        while distancia > 0:
+            distancia -= 1
+            for d in grade.deslocamentos:
+                if distancias[atual + d] == distancia:
+                    atual += d
+                    break
+            caminho.append(grade.coordenada(atual))
+        
+        return caminho
+
+class AlgoritmoBFS:
+    """Implementa o algoritmo BFS básico para busca de caminhos"""
+    
+    @staticmethod
+    def bfs_menor_caminho(labirinto, inicio, fim, registrar_exploracao=True):
+        """BFS básico - mantido para compatibilidade"""
+        return AlgoritmoBFSPredecessores.busca(
+            labirinto, inicio, fim, nome='BFS', registrar_exploracao=registrar_exploracao
+        )
+
+class HeapBinario:
+    """
+    Lista aberta em heap binário (heapq).
+    
+    Empates em f vão para o maior g (menor h, mais perto do destino) e, em
+    seguida, para a entrada mais recente, por um contador monotônico: os
+    itens nunca chegam a ser comparados.
+    """
+    
+    def __init__(self):
+        self.heap = []
+        self.contador = 0
+    
+    def inserir(self, f, g, item):
+        self.contador += 1
+        heapq.heappush(self.heap, (f, -g, -self.contador, item))
+    
+    def extrair(self):
+        return heapq.heappop(self.heap)[3]
+    
+    def __len__(self):
+        return len(self.heap)
+
+class HeapRadix:
+    """
+    Lista aberta em radix heap, para chaves inteiras monotônicas.
+    
+    Serve ao A* com heurística consistente e inteira (Manhattan em grade de
+    custo unitário), em que o f extraído nunca diminui. Cada item vai para o
+    balde do bit mais alto em que sua chave difere da última extraída; só o
+    primeiro balde não vazio é redistribuído quando o balde 0 se esgota.
+    Dentro do balde 0 (todas as chaves iguais) a extração é LIFO, o que
+    favorece os nós inseridos por último, os mais profundos do platô.
+    """
+    
+    def __init__(self):
+        self.ultimo = 0
+        self.baldes = [[] for _ in range(34)]
+        self.tamanho = 0
+    
+    def inserir(self, f, g, item):
+        self.baldes[(f ^ self.ultimo).bit_length()].append((f, item))
+        self.tamanho += 1
+    
+    def extrair(self):
+        baldes = self.baldes
+        if not baldes[0]:
+            i = 1
+            while not baldes[i]:
+                i += 1
+            balde = baldes[i]
+            baldes[i] = []
+            self.ultimo = ultimo = min(chave for chave, _ in balde)
+            for entrada in balde:
+                baldes[(entrada[0] ^ ultimo).bit_length()].append(entrada)
+        self.tamanho -= 1
+        return baldes[0].pop()[1]
+    
+    def __len__(self):
+        return self.tamanho
+
+class FilaBaldes:
+    """
+    Fila de baldes circular (algoritmo de Dial), para chaves inteiras monotônicas.
+    
+    Com custos de célula entre 1 e C, as chaves pendentes nunca se afastam
+    mais que C da menor (Dijkstra) ou 2C (A* com heurística consistente), e
+    BALDES > 2C baldes indexados por chave % BALDES bastam: inserir é um
+    append e extrair avança o cursor até o próximo balde não vazio, sem
+    nenhuma comparação entre chaves.
+    """
+    
+    BALDES = 32  # Potência de 2 acima de 2 * GradeLabirinto.CUSTO_MAXIMO
+    
+    def __init__(self):
+        self.baldes = [[] for _ in range(self.BALDES)]
+        self.cursor = 0
+        self.tamanho = 0
+    
+    def inserir(self, f, g, item):
+        self.baldes[f & (self.BALDES - 1)].append(item)
+        self.tamanho += 1
+    
+    def extrair(self):
+        baldes = self.baldes
+        mascara = self.BALDES - 1
+        cursor = self.cursor
+        while not baldes[cursor & mascara]:
+            cursor += 1
+        self.cursor = cursor
+        self.tamanho -= 1
+        return baldes[cursor & mascara].pop()
+    
+    def __len__(self):
+        return self.tamanho
 
 class AlgoritmoAStar:
     """Implementa o algoritmo A* - muito mais eficiente que BFS"""
     
+    INFINITO = 2 ** 31 - 1
+    
     @staticmethod
     def heuristica_manhattan(pos1, pos2):
         """Distância de Manhattan entre duas posições"""
@@ -79,158 +348,1666 @@ class AlgoritmoAStar:
         return caminho[::-1]
     
     @staticmethod
-    def a_star_busca(labirinto, inicio, fim, heuristica="manhattan"):
+    def a_star_busca(labirinto, inicio, fim, heuristica="manhattan", fila=None, registrar_exploracao=True):
         """
         Implementação do algoritmo A*
         
+        Nós são índices da grade; g e predecessores ficam em arrays planos e
+        não há decrease-key: uma célula melhorada é reinserida e a entrada
+        antiga é descartada ao sair da fila, se a célula já estiver fechada.
+        
+        Entrar em uma célula custa o seu byte na grade (1, ou 2 a 9 em
+        terreno); a heurística é multiplicada pelo menor custo presente, o que
+        a mantém admissível e consistente em labirintos com terreno.
+        
         Args:
             labirinto: Matriz do labirinto
             inicio: Posição inicial (x, y)
             fim: Posição final (x, y)
             heuristica: "manhattan" ou "euclidiana"
+            fila: Classe da lista aberta (HeapBinario ou HeapRadix). None usa
+                  HeapRadix com Manhattan; a euclidiana, que não é inteira,
+                  sempre usa HeapBinario
+            registrar_exploracao: False devolve um traço vazio
+        """
+        return concluir_passos(AlgoritmoAStar.a_star_passos(
+            labirinto, inicio, fim, heuristica, fila, registrar_exploracao
+        ))
+    
+    @staticmethod
+    def a_star_passos(labirinto, inicio, fim, heuristica="manhattan", fila=None, registrar_exploracao=True,
+                      tamanho_lote=0, caminhos_explorados=None):
+        """
+        A* retomável: gerador que pausa a cada tamanho_lote expansões (ver
+        AlgoritmoBFSPredecessores.passos) e devolve o resultado de a_star_busca.
+        """
+        inicio_tempo = time.perf_counter()
+        medicao = Instrumentacao.iniciar()
+        try:
+            
+            euclidiana = heuristica == "euclidiana"
+            if euclidiana:
+                fila = HeapBinario
+            elif fila is None:
+                fila = HeapRadix
+            
+            grade = GradeLabirinto.de(labirinto)
+            celulas = grade.celulas
+            deslocamentos = grade.deslocamentos
+            largura_total = grade.largura_total
+            indice_inicio = grade.indice(*inicio)
+            indice_fim = grade.indice(*fim)
+            # Coordenadas do destino no sistema com borda (evita o -1 por vizinho)
+            fy, fx = divmod(indice_fim, largura_total)
+            escala = grade.faixa_custos()[0]
+            
+            g = array('i', [AlgoritmoAStar.INFINITO]) * len(celulas)
+            predecessores = array('i', [-1]) * len(celulas)
+            fechados = bytearray(len(celulas))
+            g[indice_inicio] = 0
+            predecessores[indice_inicio] = indice_inicio
+            
+            aberta = fila()
+            y0, x0 = divmod(indice_inicio, largura_total)
+            if euclidiana:
+                aberta.inserir(((x0 - fx) ** 2 + (y0 - fy) ** 2) ** 0.5 * escala, 0, indice_inicio)
+            else:
+                aberta.inserir((abs(x0 - fx) + abs(y0 - fy)) * escala, 0, indice_inicio)
+            inseridos = 1
+            extraidos = 0
+            
+            if caminhos_explorados is None:
+                caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+            registrar = caminhos_explorados.registrar
+            if medicao is not None:
+                registrar = medicao.amostrar_fronteira(registrar, aberta)
+            nos_visitados = 0
+            proxima_pausa = tamanho_lote or -1
+            encontrado = False
+            
+            while len(aberta):
+                atual = aberta.extrair()
+                extraidos += 1
+                if fechados[atual]:
+                    continue
+                
+                fechados[atual] = 1
+                nos_visitados += 1
+                registrar(atual)
+                
+                if nos_visitados == proxima_pausa:
+                    yield nos_visitados
+                    proxima_pausa += tamanho_lote
+                
+                # Verificar se chegou ao destino
+                if atual == indice_fim:
+                    encontrado = True
+                    break
+                
+                # Explorar vizinhos (o byte da célula é o custo de entrar nela)
+                g_atual = g[atual]
+                for d in deslocamentos:
+                    vizinho = atual + d
+                    custo = celulas[vizinho]
+                    if not custo or g_atual + custo >= g[vizinho]:
+                        continue
+                    
+                    g_vizinho = g_atual + custo
+                    g[vizinho] = g_vizinho
+                    predecessores[vizinho] = atual
+                    vy, vx = divmod(vizinho, largura_total)
+                    if euclidiana:
+                        h = ((vx - fx) ** 2 + (vy - fy) ** 2) ** 0.5 * escala
+                    else:
+                        h = (abs(vx - fx) + abs(vy - fy)) * escala
+                    aberta.inserir(g_vizinho + h, g_vizinho, vizinho)
+                    inseridos += 1
+            
+            caminho = []
+            if encontrado:
+                caminho = AlgoritmoBFSPredecessores.reconstruir_caminho(predecessores, indice_fim, grade)
+            
+            fim_tempo = time.perf_counter()
+            estatisticas = {
+                'tempo_execucao': fim_tempo - inicio_tempo,
+                'nos_visitados': nos_visitados,
+                'algoritmo': f'A* ({heuristica})',
+                'caminho_encontrado': encontrado,
+                'operacoes_heap': inseridos + extraidos,
+                'entradas_descartadas': extraidos - nos_visitados,
+                'lista_aberta': fila.__name__
+            }
+            if encontrado:
+                estatisticas['custo_caminho'] = g[indice_fim]
+            if medicao is not None:
+                medicao.concluir(
+                    estatisticas,
+                    insercoes_fila=inseridos,
+                    remocoes_fila=extraidos,
+                    remocoes_descartadas=extraidos - nos_visitados,
+                    vizinhos_verificados=len(deslocamentos) * (nos_visitados - encontrado)
+                )
+            return caminho, caminhos_explorados, estatisticas
+        finally:
+            if medicao is not None:
+                medicao.encerrar()
+
+class AlgoritmoDijkstra:
+    """
+    Dijkstra com fila de baldes (algoritmo de Dial) para labirintos com terreno.
+    
+    Os custos de célula são inteiros pequenos (1 a 9), então a fila de
+    prioridade vira uma FilaBaldes: cada inserção e remoção é O(1) amortizado
+    e a busca toda fica em O(células + maior distância), sem o log do heap.
+    Sem heurística, expande por ordem de custo acumulado a partir do início.
+    """
+    
+    @staticmethod
+    def dial_busca(labirinto, inicio, fim, registrar_exploracao=True):
         """
-        inicio_tempo = time.time()
+        Caminho de menor custo de inicio a fim.
         
-        # Escolher função heurística
-        if heuristica == "euclidiana":
-            h_func = AlgoritmoAStar.heuristica_euclidiana
-        else:
-            h_func = AlgoritmoAStar.heuristica_manhattan
+        Args:
+            labirinto: Matriz do labirinto
+            inicio: Posição inicial (x, y)
+            fim: Posição final (x, y)
+            registrar_exploracao: False devolve um traço vazio
+            
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), com o custo
+            total em estatisticas['custo_caminho'] quando há caminho
+        """
+        return concluir_passos(AlgoritmoDijkstra.dial_passos(
+            labirinto, inicio, fim, registrar_exploracao
+        ))
+    
+    @staticmethod
+    def dial_passos(labirinto, inicio, fim, registrar_exploracao=True, tamanho_lote=0, caminhos_explorados=None):
+        """
+        Dijkstra retomável: gerador que pausa a cada tamanho_lote expansões
+        (ver AlgoritmoBFSPredecessores.passos) e devolve o resultado de dial_busca.
+        """
+        if not labirinto or not inicio or not fim:
+            return [], [], {'erro': 'Parâmetros inválidos'}
         
-        # Inicialização
-        open_set = []
-        heapq.heappush(open_set, (0, inicio))
-        came_from = {}
+        inicio_tempo = time.perf_counter()
+        medicao = Instrumentacao.iniciar()
+        try:
+            grade = GradeLabirinto.de(labirinto)
+            celulas = grade.celulas
+            deslocamentos = grade.deslocamentos
+            indice_inicio = grade.indice(*inicio)
+            indice_fim = grade.indice(*fim)
+            
+            distancias = array('i', [AlgoritmoAStar.INFINITO]) * len(celulas)
+            predecessores = array('i', [-1]) * len(celulas)
+            fechados = bytearray(len(celulas))
+            distancias[indice_inicio] = 0
+            predecessores[indice_inicio] = indice_inicio
+            
+            fila = FilaBaldes()
+            fila.inserir(0, 0, indice_inicio)
+            inseridos = 1
+            extraidos = 0
+            
+            if caminhos_explorados is None:
+                caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+            registrar = caminhos_explorados.registrar
+            if medicao is not None:
+                registrar = medicao.amostrar_fronteira(registrar, fila)
+            nos_visitados = 0
+            proxima_pausa = tamanho_lote or -1
+            encontrado = False
+            
+            while len(fila):
+                atual = fila.extrair()
+                extraidos += 1
+                if fechados[atual]:
+                    continue
+                
+                fechados[atual] = 1
+                nos_visitados += 1
+                registrar(atual)
+                
+                if nos_visitados == proxima_pausa:
+                    yield nos_visitados
+                    proxima_pausa += tamanho_lote
+                
+                if atual == indice_fim:
+                    encontrado = True
+                    break
+                
+                distancia_atual = distancias[atual]
+                for d in deslocamentos:
+                    vizinho = atual + d
+                    custo = celulas[vizinho]
+                    if not custo or distancia_atual + custo >= distancias[vizinho]:
+                        continue
+                    
+                    distancias[vizinho] = distancia_atual + custo
+                    predecessores[vizinho] = atual
+                    fila.inserir(distancia_atual + custo, 0, vizinho)
+                    inseridos += 1
+            
+            caminho = []
+            if encontrado:
+                caminho = AlgoritmoBFSPredecessores.reconstruir_caminho(predecessores, indice_fim, grade)
+            
+            fim_tempo = time.perf_counter()
+            estatisticas = {
+                'tempo_execucao': fim_tempo - inicio_tempo,
+                'nos_visitados': nos_visitados,
+                'algoritmo': 'Dijkstra (Dial)',
+                'caminho_encontrado': encontrado,
+                'operacoes_heap': inseridos + extraidos,
+                'entradas_descartadas': extraidos - nos_visitados,
+                'lista_aberta': FilaBaldes.__name__
+            }
+            if encontrado:
+                estatisticas['custo_caminho'] = distancias[indice_fim]
+            if medicao is not None:
+                medicao.concluir(
+                    estatisticas,
+                    insercoes_fila=inseridos,
+                    remocoes_fila=extraidos,
+                    remocoes_descartadas=extraidos - nos_visitados,
+                    vizinhos_verificados=len(deslocamentos) * (nos_visitados - encontrado)
+                )
+            return caminho, caminhos_explorados, estatisticas
+        finally:
+            if medicao is not None:
+                medicao.encerrar()
+
+class TabelaMarcos:
+    """
+    Marcos (landmarks) e suas tabelas de distância BFS, para a heurística ALT.
+    
+    Os marcos são escolhidos por ponto mais distante: o primeiro é a célula
+    mais longe de uma célula livre qualquer, e cada seguinte é a célula mais
+    longe de todos os já escolhidos (células ainda não alcançadas, de outras
+    componentes, vêm antes). Pela desigualdade triangular,
+    |d(L, alvo) - d(L, n)| nunca supera a distância real de n ao alvo.
+    
+    As tabelas usam array('H') quando as distâncias cabem em 16 bits, e
+    array('i') caso contrário; `SEM_DISTANCIA` marca células inalcançáveis.
+    """
+    
+    def __init__(self, grade, quantidade=8):
+        inicio_tempo = time.perf_counter()
+        self.grade = grade
+        self.impressao = grade.impressao_digital()
+        celulas = grade.celulas
         
-        g_score = {inicio: 0}
-        f_score = {inicio: h_func(inicio, fim)}
+        livres = [indice for indice in range(len(celulas)) if celulas[indice]]
+        self.tipo = 'H' if len(livres) < 0xFFFF else 'i'
+        self.SEM_DISTANCIA = 0xFFFF if self.tipo == 'H' else AlgoritmoAStar.INFINITO
         
-        visitados = set()
-        caminhos_explorados = []
-        nos_visitados = 0
+        self.marcos = []
+        self.tabelas = []
+        if livres:
+            # Distância ao marco mais próximo (INFINITO = ainda não alcançada)
+            menor = array('i', [AlgoritmoAStar.INFINITO]) * len(celulas)
+            inicial = CampoDistancias.calcular(grade, livres[0])
+            candidato = max(livres, key=inicial.__getitem__)
+            
+            while len(self.marcos) < quantidade:
+                tabela = self._tabela(candidato)
+                self.marcos.append(candidato)
+                self.tabelas.append(tabela)
+                
+                sem = self.SEM_DISTANCIA
+                for indice in livres:
+                    distancia = tabela[indice]
+                    if distancia != sem and distancia < menor[indice]:
+                        menor[indice] = distancia
+                candidato = max(livres, key=menor.__getitem__)
+                if menor[candidato] == 0:
+                    break  # Todas as células livres já são marcos
         
-        while open_set:
-            _, atual = heapq.heappop(open_set)
-            nos_visitados += 1
+        self.tempo_construcao = time.perf_counter() - inicio_tempo
+    
+    def _tabela(self, origem):
+        """Distâncias BFS a partir de um marco, no array compacto"""
+        distancias = CampoDistancias.calcular(self.grade, origem)
+        sem = self.SEM_DISTANCIA
+        return array(self.tipo, [sem if d == -1 else d for d in distancias])
+    
+    @property
+    def bytes_tabelas(self):
+        return sum(tabela.itemsize * len(tabela) for tabela in self.tabelas)
+
+class AlgoritmoALT:
+    """
+    A* com heurística ALT (A*, Landmarks, Triangle inequality).
+    
+    A heurística de cada célula é o maior entre Manhattan e os limites
+    |d(L, alvo) - d(L, n)| de todos os marcos; como máximo de heurísticas
+    consistentes, continua consistente, e é inteira, então a lista aberta é
+    a mesma radix heap do A*. Células que um marco alcança e o alvo não (ou
+    vice-versa) estão em outra componente e nem entram na fila.
+    """
+    
+    @staticmethod
+    def busca(labirinto, inicio, fim, marcos, fila=None, registrar_exploracao=True):
+        """
+        Args:
+            labirinto: Matriz do labirinto
+            inicio: Posição inicial (x, y)
+            fim: Posição final (x, y)
+            marcos: TabelaMarcos do labirinto
+            fila: Classe da lista aberta (None usa HeapRadix)
+            registrar_exploracao: False devolve um traço vazio
             
-            if atual in visitados:
-                continue
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas)
+        """
+        inicio_tempo = time.perf_counter()
+        medicao = Instrumentacao.iniciar()
+        try:
+            grade = GradeLabirinto.de(labirinto)
+            celulas = grade.celulas
+            deslocamentos = grade.deslocamentos
+            largura_total = grade.largura_total
+            indice_inicio = grade.indice(*inicio)
+            indice_fim = grade.indice(*fim)
+            fy, fx = divmod(indice_fim, largura_total)
+            sem = marcos.SEM_DISTANCIA
+            pares = [(tabela, tabela[indice_fim]) for tabela in marcos.tabelas]
             
-            visitados.add(atual)
-            caminhos_explorados.append(atual)
+            g = array('i', [AlgoritmoAStar.INFINITO]) * len(celulas)
+            predecessores = array('i', [-1]) * len(celulas)
+            fechados = bytearray(len(celulas))
+            g[indice_inicio] = 0
+            predecessores[indice_inicio] = indice_inicio
             
-            # Verificar se chegou ao destino
-            if atual == fim:
-                caminho = AlgoritmoAStar.reconstruir_caminho(came_from, atual)
-                fim_tempo = time.time()
-                return caminho, caminhos_explorados, {
-                    'tempo_execucao': fim_tempo - inicio_tempo,
-                    'nos_visitados': nos_visitados,
-                    'algoritmo': f'A* ({heuristica})',
-                    'caminho_encontrado': True
-                }
+            def heuristica(indice):
+                """Limite ALT (ou -1 se a célula não alcança o alvo)"""
+                y, x = divmod(indice, largura_total)
+                h = abs(x - fx) + abs(y - fy)
+                for tabela, distancia_fim in pares:
+                    distancia = tabela[indice]
+                    if (distancia == sem) != (distancia_fim == sem):
+                        return -1
+                    if distancia_fim != sem:
+                        diferenca = distancia_fim - distancia if distancia_fim > distancia else distancia - distancia_fim
+                        if diferenca > h:
+                            h = diferenca
+                return h
+            
+            aberta = (fila or HeapRadix)()
+            caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+            registrar = caminhos_explorados.registrar
+            if medicao is not None:
+                registrar = medicao.amostrar_fronteira(registrar, aberta)
+            nos_visitados = 0
+            descartadas = 0
+            encontrado = False
+            
+            h_inicio = heuristica(indice_inicio) if celulas[indice_fim] else -1
+            if h_inicio >= 0:
+                aberta.inserir(h_inicio, 0, indice_inicio)
+            
+            while len(aberta):
+                atual = aberta.extrair()
+                if fechados[atual]:
+                    descartadas += 1
+                    continue
+                
+                fechados[atual] = 1
+                nos_visitados += 1
+                registrar(atual)
+                
+                if atual == indice_fim:
+                    encontrado = True
+                    break
+                
+                g_vizinho = g[atual] + 1
+                for d in deslocamentos:
+                    vizinho = atual + d
+                    if not celulas[vizinho] or g_vizinho >= g[vizinho]:
+                        continue
+                    h = heuristica(vizinho)
+                    if h < 0:
+                        continue
+                    g[vizinho] = g_vizinho
+                    predecessores[vizinho] = atual
+                    aberta.inserir(g_vizinho + h, g_vizinho, vizinho)
+            
+            caminho = []
+            if encontrado:
+                caminho = AlgoritmoBFSPredecessores.reconstruir_caminho(predecessores, indice_fim, grade)
+            
+            estatisticas = {
+                'tempo_execucao': time.perf_counter() - inicio_tempo,
+                'nos_visitados': nos_visitados,
+                'algoritmo': f'A* ALT ({len(marcos.marcos)} marcos)',
+                'caminho_encontrado': encontrado,
+                'marcos': len(marcos.marcos),
+                'tempo_construcao': marcos.tempo_construcao
+            }
+            if medicao is not None:
+                # Toda entrada inserida foi removida ou ainda está na fila
+                remocoes = nos_visitados + descartadas
+                medicao.concluir(
+                    estatisticas,
+                    insercoes_fila=remocoes + len(aberta),
+                    remocoes_fila=remocoes,
+                    remocoes_descartadas=descartadas,
+                    vizinhos_verificados=len(deslocamentos) * (nos_visitados - encontrado)
+                )
+            return caminho, caminhos_explorados, estatisticas
+        finally:
+            if medicao is not None:
+                medicao.encerrar()
+
+class AlgoritmoIDAStar:
+    """
+    IDA* (A* com aprofundamento iterativo) para ambientes com pouca memória.
+    
+    Cada iteração é uma busca em profundidade limitada por f = g + h; o
+    limite seguinte é o menor f que excedeu o atual. Só o caminho corrente
+    fica em memória (pilha de células e de próxima direção, mais um conjunto
+    com as células do caminho para evitar ciclos), então a memória cresce
+    com a profundidade e não com o número de nós explorados.
+    
+    Sem memória extra, a mesma célula é reexpandida por cada caminho que a
+    alcança, o que explode em áreas abertas. Uma tabela de transposição de
+    tamanho fixo (menor g com que a célula foi alcançada na iteração) corta
+    esses ramos repetidos; ao encher, simplesmente para de crescer. O limite
+    de expansões garante o término nos casos restantes.
+    """
+    
+    LIMITE_EXPANSOES = 1_000_000
+    TAMANHO_TRANSPOSICAO = 1 << 16
+    
+    @staticmethod
+    def ida_star_busca(labirinto, inicio, fim, limite_expansoes=None, registrar_exploracao=True,
+                       tamanho_transposicao=None):
+        """
+        Args:
+            labirinto: Matriz do labirinto
+            inicio: Posição inicial (x, y)
+            fim: Posição final (x, y)
+            limite_expansoes: Interrompe a busca após tantas expansões
+                              (None usa LIMITE_EXPANSOES)
+            registrar_exploracao: Guarda as expansões da última iteração em
+                                  caminhos_explorados (False mantém a
+                                  memória proporcional só à profundidade)
+            tamanho_transposicao: Entradas da tabela de transposição (0
+                                  desativa; None usa TAMANHO_TRANSPOSICAO)
             
-            # Explorar vizinhos
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                vizinho = (atual[0] + dx, atual[1] + dy)
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), com
+            'iteracoes', 'profundidade_maxima' e 'memoria_pico' (bytes das
+            estruturas vivas da busca no pico, sem contar o registro)
+        """
+        inicio_tempo = time.perf_counter()
+        if limite_expansoes is None:
+            limite_expansoes = AlgoritmoIDAStar.LIMITE_EXPANSOES
+        if tamanho_transposicao is None:
+            tamanho_transposicao = AlgoritmoIDAStar.TAMANHO_TRANSPOSICAO
+        
+        grade = GradeLabirinto.de(labirinto)
+        celulas = grade.celulas
+        deslocamentos = grade.deslocamentos
+        largura_total = grade.largura_total
+        indice_inicio = grade.indice(*inicio)
+        indice_fim = grade.indice(*fim)
+        fy, fx = divmod(indice_fim, largura_total)
+        y0, x0 = divmod(indice_inicio, largura_total)
+        
+        limite = abs(x0 - fx) + abs(y0 - fy)
+        iteracoes = 0
+        expansoes = 0
+        profundidade_maxima = 0
+        memoria_pico = memoria_caminho = 0
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+        caminho = []
+        interrompida = False
+        
+        while celulas[indice_fim] and not caminho and not interrompida:
+            iteracoes += 1
+            if registrar_exploracao:
+                caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+            registrar = caminhos_explorados.registrar
+            proximo_limite = AlgoritmoAStar.INFINITO
+            
+            pilha = array('i', [indice_inicio])
+            direcoes = array('b', [0])
+            no_caminho = {indice_inicio}
+            transposicao = {indice_inicio: 0}
+            
+            while pilha:
+                atual = pilha[-1]
+                k = direcoes[-1]
+                
+                if k == 0:
+                    expansoes += 1
+                    registrar(atual)
+                    if atual == indice_fim:
+                        caminho = [grade.coordenada(indice) for indice in pilha]
+                        break
+                    if expansoes >= limite_expansoes:
+                        interrompida = True
+                        break
                 
-                if not GerenciadorLabirinto.eh_posicao_valida(vizinho[0], vizinho[1], labirinto):
+                if k == 4:
+                    pilha.pop()
+                    direcoes.pop()
+                    no_caminho.discard(atual)
                     continue
                 
-                tentative_g_score = g_score[atual] + 1
+                direcoes[-1] = k + 1
+                vizinho = atual + deslocamentos[k]
+                if not celulas[vizinho] or vizinho in no_caminho:
+                    continue
                 
-                if vizinho not in g_score or tentative_g_score < g_score[vizinho]:
-                    came_from[vizinho] = atual
-                    g_score[vizinho] = tentative_g_score
-                    f_score[vizinho] = tentative_g_score + h_func(vizinho, fim)
-                    
-                    # Adicionar à fila se não estiver lá
-                    if vizinho not in visitados:
-                        heapq.heappush(open_set, (f_score[vizinho], vizinho))
+                g_vizinho = len(pilha)
+                if transposicao.get(vizinho, AlgoritmoAStar.INFINITO) <= g_vizinho:
+                    continue
+                
+                vy, vx = divmod(vizinho, largura_total)
+                f = g_vizinho + abs(vx - fx) + abs(vy - fy)
+                if f > limite:
+                    if f < proximo_limite:
+                        proximo_limite = f
+                    continue
+                
+                if vizinho in transposicao or len(transposicao) < tamanho_transposicao:
+                    transposicao[vizinho] = g_vizinho
+                pilha.append(vizinho)
+                direcoes.append(0)
+                no_caminho.add(vizinho)
+                if len(pilha) > profundidade_maxima:
+                    profundidade_maxima = len(pilha)
+                    memoria_caminho = sys.getsizeof(pilha) + sys.getsizeof(direcoes) + sys.getsizeof(no_caminho)
+            
+            # A tabela só cresce durante a iteração: o tamanho final é o pico
+            memoria_pico = max(memoria_pico, memoria_caminho + sys.getsizeof(transposicao))
+            if proximo_limite == AlgoritmoAStar.INFINITO:
+                break  # Nenhum ramo foi cortado: o destino é inalcançável
+            limite = proximo_limite
         
-        fim_tempo = time.time()
-        return [], caminhos_explorados, {
-            'tempo_execucao': fim_tempo - inicio_tempo,
-            'nos_visitados': nos_visitados,
-            'algoritmo': f'A* ({heuristica})',
-            'caminho_encontrado': False
+        return caminho, caminhos_explorados, {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': expansoes,
+            'algoritmo': 'IDA*',
+            'caminho_encontrado': len(caminho) > 0,
+            'iteracoes': iteracoes,
+            'profundidade_maxima': profundidade_maxima,
+            'memoria_pico': memoria_pico,
+            'limite_atingido': interrompida
         }
 
-class AlgoritmoBFSOtimizado:
-    """BFS com otimizações de direção e early stopping"""
+class AlgoritmoJPS:
+    """
+    Jump Point Search para grades uniformes 4-conectadas.
+    
+    Em vez de colocar cada vizinho na fila, a busca "salta" em linha reta até
+    encontrar um ponto de salto: a saída, uma célula com vizinho forçado (uma
+    abertura lateral que não existia na célula anterior) ou, em saltos
+    verticais, uma célula de onde um salto horizontal encontra outro ponto de
+    salto. Apenas os pontos de salto entram no heap, o que reduz drasticamente
+    as operações de heap em salas abertas, mantendo o comprimento ótimo do A*.
+    """
     
     @staticmethod
-    def bfs_otimizado(labirinto, inicio, fim):
-        """BFS otimizado com heurística de direção"""
-        inicio_tempo = time.time()
+    def _saltar(celulas, atual, direcao, largura_total, indice_fim):
+        """Salta a partir de atual na direção dada; retorna o ponto de salto ou -1"""
+        horizontal = direcao == 1 or direcao == -1
+        lateral = largura_total if horizontal else 1
         
-        # Priorizar direções baseadas na posição do objetivo
-        dx_objetivo = fim[0] - inicio[0]
-        dy_objetivo = fim[1] - inicio[1]
+        while True:
+            anterior = atual
+            atual += direcao
+            if not celulas[atual]:
+                return -1
+            if atual == indice_fim:
+                return atual
+            
+            # Vizinho forçado: abertura lateral que estava bloqueada na célula anterior
+            if ((celulas[atual - lateral] and not celulas[anterior - lateral]) or
+                    (celulas[atual + lateral] and not celulas[anterior + lateral])):
+                return atual
+            
+            # Saltos verticais param onde um salto horizontal encontra algo
+            if not horizontal and (
+                    AlgoritmoJPS._saltar(celulas, atual, 1, largura_total, indice_fim) != -1 or
+                    AlgoritmoJPS._saltar(celulas, atual, -1, largura_total, indice_fim) != -1):
+                return atual
+    
+    @staticmethod
+    def _direcoes_podadas(atual, pai, largura_total):
+        """Direções a explorar a partir de um ponto de salto, dado de onde se chegou"""
+        if pai == -1:
+            return (-largura_total, largura_total, -1, 1)
         
-        # Ordenar direções baseado na proximidade ao objetivo
-        direcoes = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # cima, baixo, esquerda, direita
-        direcoes_priorizadas = sorted(direcoes, key=lambda d: 
-            abs(d[0] - (1 if dx_objetivo > 0 else -1 if dx_objetivo < 0 else 0)) +
-            abs(d[1] - (1 if dy_objetivo > 0 else -1 if dy_objetivo < 0 else 0))
-        )
+        delta = atual - pai
+        if abs(delta) < largura_total:
+            direcao = 1 if delta > 0 else -1
+            return (-largura_total, largura_total, direcao)
+        
+        direcao = largura_total if delta > 0 else -largura_total
+        return (-1, 1, direcao)
+    
+    @staticmethod
+    def _expandir_caminho(pontos, grade):
+        """Preenche as células entre pontos de salto consecutivos (trechos retos)"""
+        largura_total = grade.largura_total
+        caminho = [grade.coordenada(pontos[0])]
+        
+        for origem, destino in zip(pontos, pontos[1:]):
+            delta = destino - origem
+            if abs(delta) < largura_total:
+                passo = 1 if delta > 0 else -1
+            else:
+                passo = largura_total if delta > 0 else -largura_total
+            
+            atual = origem
+            while atual != destino:
+                atual += passo
+                caminho.append(grade.coordenada(atual))
+        
+        return caminho
+    
+    @staticmethod
+    def jps_busca(labirinto, inicio, fim, registrar_exploracao=True):
+        """
+        Executa a Jump Point Search.
         
-        queue = deque([(inicio, [inicio])])
-        visitados = set()
-        caminhos_explorados = []
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas), onde
+            caminhos_explorados contém os pontos de salto expandidos
+        """
+        if not labirinto or not inicio or not fim:
+            return [], [], {'erro': 'Parâmetros inválidos'}
+        
+        inicio_tempo = time.perf_counter()
+        grade = GradeLabirinto.de(labirinto)
+        celulas = grade.celulas
+        largura_total = grade.largura_total
+        indice_inicio = grade.indice(*inicio)
+        indice_fim = grade.indice(*fim)
+        fx, fy = fim
+        
+        open_set = [(AlgoritmoAStar.heuristica_manhattan(inicio, fim), indice_inicio)]
+        came_from = {indice_inicio: -1}
+        g_score = {indice_inicio: 0}
+        fechados = set()
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
         nos_visitados = 0
+        operacoes_heap = 1
         
-        while queue:
-            (x, y), caminho = queue.popleft()
-            nos_visitados += 1
+        while open_set:
+            _, atual = heapq.heappop(open_set)
+            operacoes_heap += 1
             
-            if (x, y) in visitados:
+            if atual in fechados:
                 continue
+            fechados.add(atual)
+            nos_visitados += 1
+            caminhos_explorados.registrar(atual)
             
-            visitados.add((x, y))
-            caminhos_explorados.append((x, y))
-            
-            # Verificar se chegou ao destino
-            if (x, y) == fim:
-                fim_tempo = time.time()
+            if atual == indice_fim:
+                pontos = []
+                while atual != -1:
+                    pontos.append(atual)
+                    atual = came_from[atual]
+                pontos.reverse()
+                
+                caminho = AlgoritmoJPS._expandir_caminho(pontos, grade)
                 return caminho, caminhos_explorados, {
-                    'tempo_execucao': fim_tempo - inicio_tempo,
+                    'tempo_execucao': time.perf_counter() - inicio_tempo,
                     'nos_visitados': nos_visitados,
-                    'algoritmo': 'BFS Otimizado',
-                    'caminho_encontrado': True
+                    'algoritmo': 'JPS',
+                    'caminho_encontrado': True,
+                    'operacoes_heap': operacoes_heap,
+                    'pontos_de_salto': len(g_score)
                 }
             
-            # Explorar vizinhos com direções priorizadas
-            for dx, dy in direcoes_priorizadas:
-                nx, ny = x + dx, y + dy
+            g_atual = g_score[atual]
+            for direcao in AlgoritmoJPS._direcoes_podadas(atual, came_from[atual], largura_total):
+                ponto = AlgoritmoJPS._saltar(celulas, atual, direcao, largura_total, indice_fim)
+                if ponto == -1 or ponto in fechados:
+                    continue
                 
-                if (nx, ny) not in visitados and GerenciadorLabirinto.eh_posicao_valida(nx, ny, labirinto):
-                    queue.append(((nx, ny), caminho + [(nx, ny)]))
+                distancia = ponto - atual
+                if abs(distancia) >= largura_total:
+                    distancia //= largura_total
+                g_ponto = g_atual + abs(distancia)
+                
+                if ponto not in g_score or g_ponto < g_score[ponto]:
+                    g_score[ponto] = g_ponto
+                    came_from[ponto] = atual
+                    py, px = divmod(ponto, largura_total)
+                    h = abs(px - 1 - fx) + abs(py - 1 - fy)
+                    heapq.heappush(open_set, (g_ponto + h, ponto))
+                    operacoes_heap += 1
         
-        fim_tempo = time.time()
         return [], caminhos_explorados, {
-            'tempo_execucao': fim_tempo - inicio_tempo,
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
             'nos_visitados': nos_visitados,
-            'algoritmo': 'BFS Otimizado',
-            'caminho_encontrado': False
+            'algoritmo': 'JPS',
+            'caminho_encontrado': False,
+            'operacoes_heap': operacoes_heap,
+            'pontos_de_salto': len(g_score)
         }
 
-class GerenciadorPathfinding:
-    """Gerencia diferentes algoritmos de pathfinding otimizados"""
-    
-    def __init__(self):
-        self.algoritmo_atual = "a_star"  # Usar A* como padrão
-        self.algoritmos = {
-            "bfs": AlgoritmoBFS(),
-            "bfs_otimizado": AlgoritmoBFSOtimizado(),
-            "a_star": AlgoritmoAStar()
-        }
+class AlgoritmoBFSOtimizado:
+    """BFS com otimizações de direção e early stopping"""
     
-    def encontrar_caminho(self, labirinto, inicio, fim, algoritmo=None):
-        """
-        Encontra um caminho usando o algoritmo especificado
-        
-        Args:
+    @staticmethod
+    def direcoes_priorizadas(inicio, fim):
+        """Direções ordenadas pela proximidade ao objetivo"""
+        dx_objetivo = fim[0] - inicio[0]
+        dy_objetivo = fim[1] - inicio[1]
+        
+        direcoes = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # cima, baixo, esquerda, direita
+        return sorted(direcoes, key=lambda d: 
+            abs(d[0] - (1 if dx_objetivo > 0 else -1 if dx_objetivo < 0 else 0)) +
+            abs(d[1] - (1 if dy_objetivo > 0 else -1 if dy_objetivo < 0 else 0))
+        )
+    
+    @staticmethod
+    def bfs_otimizado(labirinto, inicio, fim, registrar_exploracao=True):
+        """BFS otimizado com heurística de direção"""
+        return AlgoritmoBFSPredecessores.busca(
+            labirinto, inicio, fim, AlgoritmoBFSOtimizado.direcoes_priorizadas(inicio, fim),
+            nome='BFS Otimizado', registrar_exploracao=registrar_exploracao
+        )
+    
+    @staticmethod
+    def passos(labirinto, inicio, fim, registrar_exploracao=True, tamanho_lote=0, caminhos_explorados=None):
+        """BFS otimizado retomável (ver AlgoritmoBFSPredecessores.passos)"""
+        return AlgoritmoBFSPredecessores.passos(
+            labirinto, inicio, fim, AlgoritmoBFSOtimizado.direcoes_priorizadas(inicio, fim),
+            'BFS Otimizado', registrar_exploracao, tamanho_lote, caminhos_explorados
+        )
+
+class AlgoritmoBidirecional:
+    """
+    Buscas bidirecionais: uma frente parte do início e outra da saída, e o
+    caminho é montado onde elas se encontram. Em labirintos longos cada lado
+    explora aproximadamente a metade da profundidade, reduzindo muito o número
+    de nós expandidos em relação à busca unidirecional.
+    """
+    
+    INFINITO = 2 ** 31 - 1
+    
+    @staticmethod
+    def _montar_caminho(pred_inicio, pred_fim, u, v, grade):
+        """
+        Junta a cadeia início→u com a cadeia v→saída (u e v são vizinhos ou
+        o mesmo nó de encontro)
+        """
+        caminho = AlgoritmoBFSPredecessores.reconstruir_caminho(pred_inicio, u, grade)
+        atual = v
+        if v != u:
+            caminho.append(grade.coordenada(v))
+        while pred_fim[atual] != atual:
+            atual = pred_fim[atual]
+            caminho.append(grade.coordenada(atual))
+        return caminho
+    
+    @staticmethod
+    def _estatisticas(nome, inicio_tempo, visitados_inicio, visitados_fim, encontrado):
+        """Monta o dicionário de estatísticas com os nós expandidos de cada lado"""
+        return {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': visitados_inicio + visitados_fim,
+            'nos_visitados_inicio': visitados_inicio,
+            'nos_visitados_fim': visitados_fim,
+            'algoritmo': nome,
+            'caminho_encontrado': encontrado
+        }
+    
+    @staticmethod
+    def bfs_bidirecional(labirinto, inicio, fim, registrar_exploracao=True):
+        """
+        BFS bidirecional por camadas.
+        
+        A cada rodada expande a camada inteira do lado com a menor fronteira.
+        Quando as frentes se tocam, a camada corrente é terminada e o menor
+        d_inicio(u) + 1 + d_fim(v) entre as arestas de encontro é escolhido,
+        o que garante o menor caminho.
+        """
+        if not labirinto or not inicio or not fim:
+            return [], [], {'erro': 'Parâmetros inválidos'}
+        
+        inicio_tempo = time.perf_counter()
+        grade = GradeLabirinto.de(labirinto)
+        celulas = grade.celulas
+        deslocamentos = grade.deslocamentos
+        indice_inicio = grade.indice(*inicio)
+        indice_fim = grade.indice(*fim)
+        
+        # Por lado: predecessores, distâncias, fronteira e nós expandidos
+        pred = [array('i', [-1]) * len(celulas), array('i', [-1]) * len(celulas)]
+        dist = [array('i', [-1]) * len(celulas), array('i', [-1]) * len(celulas)]
+        fronteiras = [[indice_inicio], [indice_fim]]
+        visitados = [0, 0]
+        pred[0][indice_inicio] = indice_inicio
+        pred[1][indice_fim] = indice_fim
+        dist[0][indice_inicio] = 0
+        dist[1][indice_fim] = 0
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+        
+        melhor = AlgoritmoBidirecional.INFINITO
+        encontro = None
+        if indice_inicio == indice_fim:
+            melhor, encontro = 0, (indice_inicio, indice_fim)
+        
+        while encontro is None and fronteiras[0] and fronteiras[1]:
+            lado = 0 if len(fronteiras[0]) <= len(fronteiras[1]) else 1
+            pred_lado, dist_lado, dist_outro = pred[lado], dist[lado], dist[1 - lado]
+            proxima = []
+            
+            for atual in fronteiras[lado]:
+                visitados[lado] += 1
+                caminhos_explorados.registrar(atual)
+                d_atual = dist_lado[atual] + 1
+                
+                for d in deslocamentos:
+                    vizinho = atual + d
+                    if not celulas[vizinho]:
+                        continue
+                    
+                    if dist_outro[vizinho] != -1 and d_atual + dist_outro[vizinho] < melhor:
+                        melhor = d_atual + dist_outro[vizinho]
+                        encontro = (atual, vizinho) if lado == 0 else (vizinho, atual)
+                    
+                    if dist_lado[vizinho] == -1:
+                        dist_lado[vizinho] = d_atual
+                        pred_lado[vizinho] = atual
+                        proxima.append(vizinho)
+            
+            fronteiras[lado] = proxima
+        
+        if encontro is None:
+            return [], caminhos_explorados, AlgoritmoBidirecional._estatisticas(
+                'BFS Bidirecional', inicio_tempo, visitados[0], visitados[1], False
+            )
+        
+        # Aresta de encontro: u no lado do início, v no lado da saída
+        u, v = encontro
+        caminho = AlgoritmoBidirecional._montar_caminho(pred[0], pred[1], u, v, grade)
+        return caminho, caminhos_explorados, AlgoritmoBidirecional._estatisticas(
+            'BFS Bidirecional', inicio_tempo, visitados[0], visitados[1], True
+        )
+    
+    @staticmethod
+    def a_star_bidirecional(labirinto, inicio, fim, heuristica="manhattan", registrar_exploracao=True):
+        """
+        A* bidirecional.
+        
+        Cada lado usa a heurística em direção à extremidade oposta. Sempre que
+        um nó alcançado por um lado já tem custo conhecido no outro, o custo
+        total atualiza o melhor caminho conhecido (mu). Com heurística
+        consistente, o f mínimo de qualquer fila é um limite inferior para
+        caminhos ainda não descobertos, então a busca para quando esse mínimo
+        alcança mu, mantendo o caminho ótimo.
+        """
+        if not labirinto or not inicio or not fim:
+            return [], [], {'erro': 'Parâmetros inválidos'}
+        
+        inicio_tempo = time.perf_counter()
+        nome = f'A* Bidirecional ({heuristica})'
+        
+        if heuristica == "euclidiana":
+            h_func = AlgoritmoAStar.heuristica_euclidiana
+        else:
+            h_func = AlgoritmoAStar.heuristica_manhattan
+        
+        grade = GradeLabirinto.de(labirinto)
+        celulas = grade.celulas
+        deslocamentos = grade.deslocamentos
+        origens = (inicio, fim)
+        alvos = (fim, inicio)
+        indices = (grade.indice(*inicio), grade.indice(*fim))
+        infinito = AlgoritmoBidirecional.INFINITO
+        
+        pred = [array('i', [-1]) * len(celulas), array('i', [-1]) * len(celulas)]
+        g = [array('i', [infinito]) * len(celulas), array('i', [infinito]) * len(celulas)]
+        fechados = [bytearray(len(celulas)), bytearray(len(celulas))]
+        filas = [[], []]
+        visitados = [0, 0]
+        caminhos_explorados = TracoExploracao.para(grade, registrar_exploracao)
+        
+        for lado in (0, 1):
+            pred[lado][indices[lado]] = indices[lado]
+            g[lado][indices[lado]] = 0
+            heapq.heappush(filas[lado], (h_func(origens[lado], alvos[lado]), indices[lado]))
+        
+        melhor = infinito
+        encontro = None
+        if indices[0] == indices[1]:
+            melhor, encontro = 0, indices[0]
+        
+        while filas[0] and filas[1]:
+            # Critério de parada: nenhum caminho não descoberto é menor que mu
+            if max(filas[0][0][0], filas[1][0][0]) >= melhor:
+                break
+            
+            lado = 0 if len(filas[0]) <= len(filas[1]) else 1
+            _, atual = heapq.heappop(filas[lado])
+            
+            fechados_lado = fechados[lado]
+            if fechados_lado[atual]:
+                continue
+            fechados_lado[atual] = 1
+            visitados[lado] += 1
+            caminhos_explorados.registrar(atual)
+            
+            g_lado, g_outro, pred_lado = g[lado], g[1 - lado], pred[lado]
+            alvo = alvos[lado]
+            g_vizinho = g_lado[atual] + 1
+            
+            for d in deslocamentos:
+                vizinho = atual + d
+                if not celulas[vizinho]:
+                    continue
+                
+                if g_vizinho < g_lado[vizinho]:
+                    g_lado[vizinho] = g_vizinho
+                    pred_lado[vizinho] = atual
+                    if not fechados_lado[vizinho]:
+                        heapq.heappush(
+                            filas[lado], (g_vizinho + h_func(grade.coordenada(vizinho), alvo), vizinho)
+                        )
+                
+                if g_outro[vizinho] != infinito and g_lado[vizinho] + g_outro[vizinho] < melhor:
+                    melhor = g_lado[vizinho] + g_outro[vizinho]
+                    encontro = vizinho
+        
+        if encontro is None:
+            return [], caminhos_explorados, AlgoritmoBidirecional._estatisticas(
+                nome, inicio_tempo, visitados[0], visitados[1], False
+            )
+        
+        caminho = AlgoritmoBidirecional._montar_caminho(pred[0], pred[1], encontro, encontro, grade)
+        return caminho, caminhos_explorados, AlgoritmoBidirecional._estatisticas(
+            nome, inicio_tempo, visitados[0], visitados[1], True
+        )
+
+class BuscaEmPassos:
+    """
+    Busca executada aos poucos, dentro de um orçamento de tempo por avanço.
+    
+    Envolve o gerador de um algoritmo (que pausa a cada lote de expansões) e
+    o avança até o orçamento acabar, para que o loop do jogo continue
+    desenhando enquanto a busca progride. caminhos_explorados cresce a cada
+    avanço; caminho e estatisticas só são preenchidos ao concluir, e
+    estatisticas['tempo_execucao'] conta apenas o tempo gasto nos avanços.
+    """
+    
+    TAMANHO_LOTE = 256  # Expansões entre consultas ao relógio
+    
+    def __init__(self, gerador, caminhos_explorados, ao_concluir=None):
+        self._gerador = gerador
+        self._ao_concluir = ao_concluir
+        self.caminhos_explorados = caminhos_explorados
+        self.caminho = []
+        self.estatisticas = {}
+        self.concluida = False
+        self.nos_visitados = 0
+        self.avancos = 0
+        self.tempo_ativo = 0.0
+    
+    @classmethod
+    def concluida_com(cls, resultado):
+        """Busca já concluída com um resultado pronto (ex.: vindo do cache)"""
+        busca = cls(None, resultado[1])
+        busca._finalizar(resultado)
+        return busca
+    
+    @staticmethod
+    def em_um_lote(executar):
+        """Gerador para algoritmos sem versão em passos: a busca inteira roda no primeiro avanço"""
+        yield from ()
+        return executar()
+    
+    @property
+    def resultado(self):
+        return self.caminho, self.caminhos_explorados, self.estatisticas
+    
+    def avancar(self, orcamento=0.004):
+        """
+        Avança a busca por cerca de orcamento segundos (o último lote pode
+        ultrapassá-lo).
+        
+        Returns:
+            bool: True se a busca terminou
+        """
+        if self.concluida:
+            return True
+        
+        inicio_tempo = time.perf_counter()
+        limite = inicio_tempo + orcamento
+        self.avancos += 1
+        try:
+            while True:
+                self.nos_visitados = next(self._gerador)
+                if time.perf_counter() >= limite:
+                    break
+        except StopIteration as fim:
+            self.tempo_ativo += time.perf_counter() - inicio_tempo
+            self._finalizar(fim.value)
+            return True
+        
+        self.tempo_ativo += time.perf_counter() - inicio_tempo
+        return False
+    
+    def concluir(self):
+        """Executa o restante da busca de uma vez e retorna o resultado"""
+        self.avancar(float('inf'))
+        return self.resultado
+    
+    def cancelar(self):
+        """
+        Abandona a busca: fecha o gerador, o que encerra a medição da
+        instrumentação (e o tracemalloc) que ele tiver aberto.
+        """
+        if self._gerador is not None:
+            self._gerador.close()
+            self._gerador = None
+    
+    def _finalizar(self, resultado):
+        caminho, caminhos_explorados, estatisticas = resultado
+        if self._gerador is not None and 'erro' not in estatisticas:
+            estatisticas['tempo_execucao'] = self.tempo_ativo
+            estatisticas['avancos'] = self.avancos
+            medicao = estatisticas.get('instrumentacao')
+            if medicao is not None and self.tempo_ativo > 0:
+                # O tempo medido pelo motor inclui as pausas entre avanços
+                medicao['tempo_ns'] = int(self.tempo_ativo * 1_000_000_000)
+                medicao['nos_por_segundo'] = estatisticas['nos_visitados'] / self.tempo_ativo
+        self.caminho = caminho
+        self.caminhos_explorados = caminhos_explorados
+        self.estatisticas = estatisticas
+        self.nos_visitados = estatisticas.get('nos_visitados', self.nos_visitados)
+        self.concluida = True
+        self._gerador = None
+        if self._ao_concluir is not None:
+            self._ao_concluir(resultado)
+
+class BuscaEmSegundoPlano:
+    """
+    Executa uma BuscaEmPassos em uma thread de trabalho.
+    
+    O cancelamento é cooperativo: cancelar() sinaliza um threading.Event
+    verificado entre lotes de expansões, e o resultado de uma busca cancelada
+    é descartado. Algoritmos sem versão em passos só param ao fim do único
+    lote. nos_visitados acompanha o progresso enquanto a busca roda; o
+    resultado só é exposto, de uma vez, depois que a thread termina.
+    """
+    
+    def __init__(self, busca):
+        self.busca = busca
+        self.erro = None
+        self._cancelada = threading.Event()
+        self._terminada = threading.Event()
+        self._thread = threading.Thread(target=self._executar, name="busca-em-segundo-plano", daemon=True)
+        self._thread.start()
+    
+    def _executar(self):
+        try:
+            # Orçamento zero: um lote por avanço, checando o cancelamento entre eles
+            while not self._cancelada.is_set():
+                if self.busca.avancar(0):
+                    break
+        except Exception as e:
+            self.erro = e
+        finally:
+            # O gerador é fechado na própria thread que o executa
+            if not self.busca.concluida:
+                self.busca.cancelar()
+            self._terminada.set()
+    
+    @property
+    def nos_visitados(self):
+        return self.busca.nos_visitados
+    
+    @property
+    def terminada(self):
+        """True quando a thread terminou (concluída, cancelada ou com erro)"""
+        return self._terminada.is_set()
+    
+    @property
+    def cancelada(self):
+        return self._cancelada.is_set()
+    
+    @property
+    def resultado(self):
+        """(caminho, caminhos_explorados, estatisticas) ou None se não concluiu"""
+        if not self.terminada or self.cancelada or self.erro is not None:
+            return None
+        return self.busca.resultado
+    
+    def cancelar(self):
+        """Pede o cancelamento; a thread para ao fim do lote atual"""
+        self._cancelada.set()
+    
+    def aguardar(self, tempo_limite=None):
+        """Espera a thread terminar; retorna True se terminou dentro do tempo"""
+        return self._terminada.wait(tempo_limite)
+
+# Algoritmos embutidos, na ordem de GerenciadorPathfinding.ALGORITMOS. Os motores
+# NumPy e SciPy ficam em outros módulos, importados só quando são executados
+RegistroAlgoritmos.registrar(
+    "bfs", AlgoritmoBFS.bfs_menor_caminho, passos=AlgoritmoBFSPredecessores.passos
+)
+RegistroAlgoritmos.registrar(
+    "bfs_otimizado", AlgoritmoBFSOtimizado.bfs_otimizado, passos=AlgoritmoBFSOtimizado.passos
+)
+RegistroAlgoritmos.registrar(
+    "bfs_numpy", "motor_numpy:AlgoritmoBFSNumpy.bfs_vetorizado", apelidos=["bfs_vetorizado"], numpy=True
+)
+RegistroAlgoritmos.registrar("bfs_bidirecional", AlgoritmoBidirecional.bfs_bidirecional)
+RegistroAlgoritmos.registrar(
+    "a_star", AlgoritmoAStar.a_star_busca, apelidos=["astar"], opcoes={'heuristica': "manhattan"},
+    passos=AlgoritmoAStar.a_star_passos, ponderado=True
+)
+RegistroAlgoritmos.registrar(
+    "a_star_euclidiano", AlgoritmoAStar.a_star_busca, apelidos=["a_star_euclidiana"],
+    opcoes={'heuristica': "euclidiana"}, passos=AlgoritmoAStar.a_star_passos, ponderado=True
+)
+RegistroAlgoritmos.registrar(
+    "a_star_bidirecional", AlgoritmoBidirecional.a_star_bidirecional, apelidos=["astar_bidirecional"],
+    opcoes={'heuristica': "manhattan"}
+)
+RegistroAlgoritmos.registrar(
+    "dijkstra", AlgoritmoDijkstra.dial_busca, apelidos=["dial"], passos=AlgoritmoDijkstra.dial_passos,
+    ponderado=True
+)
+RegistroAlgoritmos.registrar("jps", AlgoritmoJPS.jps_busca, apelidos=["jump_point"])
+RegistroAlgoritmos.registrar("campo_saida", metodo="caminho_ate_saida", apelidos=["campo_distancias"])
+RegistroAlgoritmos.registrar("hpa", metodo="encontrar_caminho_hierarquico")
+RegistroAlgoritmos.registrar("hpa_otimo", metodo="encontrar_caminho_hierarquico", opcoes={'otimo': True})
+RegistroAlgoritmos.registrar("juncoes", metodo="encontrar_caminho_juncoes", apelidos=["grafo_juncoes"])
+RegistroAlgoritmos.registrar(
+    "lpa", PlanejadorIncremental.buscar, apelidos=["lpa_star"], incremental=True
+)
+RegistroAlgoritmos.registrar("alt", metodo="encontrar_caminho_alt", apelidos=["a_star_alt"])
+RegistroAlgoritmos.registrar("ida", metodo="encontrar_caminho_ida", apelidos=["ida_star"])
+RegistroAlgoritmos.registrar(
+    "csgraph", metodo="encontrar_caminho_csgraph", apelidos=["scipy"], ponderado=True, numpy=True
+)
+
+class GerenciadorPathfinding:
+    """Gerencia diferentes algoritmos de pathfinding otimizados"""
+    
+    MAX_ESTRUTURAS_CACHE = 8  # Estruturas pré-computadas mantidas por tipo
+    
+    # Nomes canônicos dos algoritmos embutidos (encontrar_caminho também aceita
+    # os apelidos e os algoritmos registrados depois, ver RegistroAlgoritmos)
+    ALGORITMOS = RegistroAlgoritmos.nomes()
+    
+    def __init__(self):
+        self.algoritmo_atual = "a_star"  # Usar A* como padrão
+        self.algoritmos = {
+            "bfs": AlgoritmoBFS(),
+            "bfs_otimizado": AlgoritmoBFSOtimizado(),
+            "a_star": AlgoritmoAStar()
+        }
+        # (impressão digital do labirinto, saída) -> CampoDistancias
+        self._campos_saida = {}
+        
+        # HPA*: configuração e abstrações por (impressão digital, cluster, ótimo)
+        self.hpa_tamanho_cluster = 16
+        self.hpa_otimo = False
+        self._abstracoes = {}
+        
+        # Grafos de junções (corredores contraídos) por impressão digital
+        self._grafos_juncoes = {}
+        
+        # Grafos CSR do SciPy (motor_scipy, importado só quando usado) por impressão digital
+        self._grafos_csr = {}
+        
+        # ALT: número de marcos, tabelas por (impressão digital, marcos) e se a
+        # economia de expansões é medida contra o A* Manhattan (uma busca extra)
+        self.alt_num_marcos = 8
+        self.alt_medir_economia = True
+        self._marcos = {}
+        
+        # IDA*: teto de expansões e tamanho fixo da tabela de transposição
+        self.ida_limite_expansoes = AlgoritmoIDAStar.LIMITE_EXPANSOES
+        self.ida_tamanho_transposicao = AlgoritmoIDAStar.TAMANHO_TRANSPOSICAO
+        
+        # Traço de exploração: False devolve traços vazios (só o caminho
+        # interessa); um inteiro N guarda só as N primeiras células (memória constante)
+        self.registrar_exploracao = True
+        
+        # Consultas entre componentes conexas diferentes são respondidas sem busca
+        self.recusar_sem_caminho = True
+        
+        # Cache LRU de resultados:
+        # (impressão, início, fim, algoritmo, variante, traço, instrumentação) -> resultado
+        self._cache_resultados = OrderedDict()
+        self._trava_cache = threading.RLock()  # Buscas em segundo plano também usam os caches
+        self._bytes_cache = 0
+        self.cache_max_entradas = 128
+        self.cache_max_bytes = 64 * 1024 * 1024
+        self.cache_acertos = 0
+        self.cache_falhas = 0
+        
+        # Comparação em processos: limite de processos, tempo por algoritmo (s)
+        # e tamanho mínimo de labirinto para compensar o custo de criar o pool
+        self.max_processos = min(4, os.cpu_count() or 1)
+        self.tempo_limite_algoritmo = 30.0
+        self.min_celulas_paralelo = 40_000
+    
+    def configurar_paralelismo(self, max_processos=None, tempo_limite=None, min_celulas=None):
+        """
+        Ajusta a execução paralela de `comparar_algoritmos`.
+        
+        Args:
+            max_processos: Número máximo de processos (1 desativa o paralelismo)
+            tempo_limite: Segundos que cada algoritmo pode rodar antes de ser abandonado
+            min_celulas: Labirintos menores que isso são comparados no processo atual
+        """
+        if max_processos is not None:
+            self.max_processos = max(1, max_processos)
+        if tempo_limite is not None:
+            self.tempo_limite_algoritmo = tempo_limite
+        if min_celulas is not None:
+            self.min_celulas_paralelo = min_celulas
+    
+    def configurar_cache(self, max_entradas=None, max_bytes=None):
+        """
+        Ajusta os limites do cache de resultados (0 entradas desativa o cache).
+        
+        Args:
+            max_entradas: Número máximo de resultados guardados
+            max_bytes: Memória aproximada máxima ocupada pelos resultados
+        """
+        if max_entradas is not None:
+            self.cache_max_entradas = max_entradas
+        if max_bytes is not None:
+            self.cache_max_bytes = max_bytes
+        with self._trava_cache:
+            self._aplicar_limites_cache()
+    
+    def limpar_cache(self):
+        """Descarta todos os resultados em cache e zera os contadores"""
+        with self._trava_cache:
+            self._cache_resultados.clear()
+            self._bytes_cache = 0
+            self.cache_acertos = 0
+            self.cache_falhas = 0
+    
+    def estatisticas_cache(self):
+        """Retorna contadores e ocupação do cache de resultados"""
+        consultas = self.cache_acertos + self.cache_falhas
+        return {
+            'acertos': self.cache_acertos,
+            'falhas': self.cache_falhas,
+            'taxa_acerto': self.cache_acertos / consultas if consultas else 0.0,
+            'entradas': len(self._cache_resultados),
+            'bytes_aproximados': self._bytes_cache
+        }
+    
+    @staticmethod
+    def _estimar_bytes(resultado):
+        """Estimativa barata da memória ocupada por um resultado"""
+        caminho, caminhos_explorados, estatisticas = resultado
+        # Cada posição (x, y) em lista custa ~72 bytes: tupla, dois inteiros e o ponteiro
+        total = 72 * len(caminho) + sys.getsizeof(estatisticas)
+        total += getattr(caminhos_explorados, 'nbytes', 72 * len(caminhos_explorados))
+        for valor in estatisticas.values():
+            total += getattr(valor, 'nbytes', 0)
+        return total
+    
+    def _aplicar_limites_cache(self):
+        """Remove as entradas menos usadas até respeitar os limites"""
+        cache = self._cache_resultados
+        while cache and (len(cache) > self.cache_max_entradas or
+                         self._bytes_cache > self.cache_max_bytes):
+            _, (_, tamanho) = cache.popitem(last=False)
+            self._bytes_cache -= tamanho
+    
+    def _chave_resultado(self, grade, inicio, fim, algoritmo):
+        """Chave do cache de resultados (conteúdo do labirinto, extremos e nome canônico do algoritmo)"""
+        variante = None
+        if algoritmo.startswith("hpa"):
+            variante = (self.hpa_tamanho_cluster, self.hpa_otimo)
+        elif algoritmo == "alt":
+            variante = (self.alt_num_marcos, self.alt_medir_economia)
+        elif algoritmo == "ida":
+            variante = (self.ida_limite_expansoes, self.ida_tamanho_transposicao)
+        return (grade.impressao_digital(), tuple(inicio), tuple(fim), algoritmo, variante,
+                self.registrar_exploracao, Instrumentacao.estado())
+    
+    def _guardar_resultado(self, chave, resultado):
+        """Guarda uma cópia do resultado no cache LRU, respeitando os limites"""
+        caminho, caminhos_explorados, estatisticas = resultado
+        if 'erro' in estatisticas or self.cache_max_entradas <= 0:
+            return
+        resultado = (list(caminho), caminhos_explorados, dict(estatisticas))
+        tamanho = self._estimar_bytes(resultado)
+        with self._trava_cache:
+            self._cache_resultados[chave] = (resultado, tamanho)
+            self._bytes_cache += tamanho
+            self._aplicar_limites_cache()
+    
+    def _obter_em_cache(self, cache, chave, construir):
+        """Retorna a estrutura em cache ou a constrói (descartando a mais antiga se cheio)"""
+        estrutura = cache.get(chave)
+        if estrutura is None:
+            estrutura = construir()
+            with self._trava_cache:
+                if len(cache) >= self.MAX_ESTRUTURAS_CACHE:
+                    del cache[next(iter(cache))]
+                cache[chave] = estrutura
+        return estrutura
+    
+    def precomputar_campo_saida(self, labirinto, saida=None):
+        """
+        Calcula (ou reaproveita) o campo de distâncias a partir da saída.
+        
+        O cache é indexado pela impressão digital do conteúdo do labirinto,
+        então qualquer alteração de célula gera um novo campo automaticamente.
+        
+        Returns:
+            CampoDistancias: campo reutilizável para qualquer posição inicial
+        """
+        grade = GradeLabirinto.de(labirinto)
+        saida = saida or grade.saida
+        return self._obter_em_cache(
+            self._campos_saida, (grade.impressao_digital(), saida),
+            lambda: CampoDistancias(grade, saida)
+        )
+    
+    def invalidar_campos_saida(self):
+        """Descarta todos os campos de distância em cache"""
+        self._campos_saida.clear()
+    
+    def caminho_ate_saida(self, labirinto, inicio, saida=None):
+        """
+        Menor caminho de inicio até a saída usando o campo de distâncias em
+        cache (construído na primeira chamada para o labirinto).
+        
+        Returns:
+            tuple: (caminho, caminhos_explorados, estatisticas)
+        """
+        inicio_tempo = time.perf_counter()
+        grade = GradeLabirinto.de(labirinto)
+        saida = saida or grade.saida
+        reaproveitado = (grade.impressao_digital(), saida) in self._campos_saida
+        campo = self.precomputar_campo_saida(grade, saida)
+        caminho = campo.caminho_de(inicio)
+        
+        # A descida só toca as células do próprio caminho
+        caminhos_explorados = TracoExploracao.para(grade, self.registrar_exploracao)
+        for posicao in caminho:
+            caminhos_explorados.append(posicao)
+        
+        return caminho, caminhos_explorados, {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': len(caminho),
+            'algoritmo': 'Campo de Distâncias (saída)',
+            'caminho_encontrado': len(caminho) > 0,
+            'campo_reaproveitado': reaproveitado,
+            'tempo_construcao_campo': campo.tempo_construcao
+        }
+    
+    def obter_abstracao(self, labirinto, tamanho_cluster=None, otimo=None):
+        """
+        Retorna a abstração HPA* do labirinto, construída uma vez e reutilizada
+        enquanto o conteúdo do labirinto não mudar.
+        """
+        grade = GradeLabirinto.de(labirinto)
+        tamanho_cluster = tamanho_cluster or self.hpa_tamanho_cluster
+        otimo = self.hpa_otimo if otimo is None else otimo
+        return self._obter_em_cache(
+            self._abstracoes, (grade.impressao_digital(), tamanho_cluster, otimo),
+            lambda: AbstracaoHierarquica(grade, tamanho_cluster, otimo)
+        )
+    
+    def encontrar_caminho_hierarquico(self, labirinto, inicio, fim, tamanho_cluster=None, otimo=None):
+        """
+        Busca HPA*: grafo abstrato primeiro, refinamento só nos clusters escolhidos.
+        
+        Args:
+            tamanho_cluster: Lado dos clusters (None usa hpa_tamanho_cluster)
+            otimo: True exige caminho exatamente ótimo; False aceita quase ótimo
+                   (None usa hpa_otimo)
+        """
+        abstracao = self.obter_abstracao(labirinto, tamanho_cluster, otimo)
+        return abstracao.buscar(inicio, fim, self.registrar_exploracao)
+    
+    def obter_grafo_juncoes(self, labirinto):
+        """Retorna o grafo de junções do labirinto, construído uma vez por conteúdo"""
+        grade = GradeLabirinto.de(labirinto)
+        return self._obter_em_cache(
+            self._grafos_juncoes, grade.impressao_digital(), lambda: GrafoJuncoes(grade)
+        )
+    
+    def encontrar_caminho_juncoes(self, labirinto, inicio, fim):
+        """A* no grafo de junções em cache do labirinto"""
+        return self.obter_grafo_juncoes(labirinto).buscar(inicio, fim, self.registrar_exploracao)
+    
+    def obter_grafo_csr(self, labirinto):
+        """
+        Retorna o grafo CSR do scipy.sparse.csgraph (ver motor_scipy.GrafoCSR),
+        construído uma vez por conteúdo; para consultas em massa, como
+        `distancias`, `campo` e `matriz_juncoes`. Requer NumPy e SciPy.
+        """
+        from motor_scipy import GrafoCSR
+        grade = GradeLabirinto.de(labirinto)
+        return self._obter_em_cache(
+            self._grafos_csr, grade.impressao_digital(), lambda: GrafoCSR(grade)
+        )
+    
+    def encontrar_caminho_csgraph(self, labirinto, inicio, fim):
+        """Dijkstra do csgraph sobre o grafo CSR em cache; sem SciPy, usa o Dijkstra (Dial) em Python"""
+        from motor_scipy import GrafoCSR
+        if not labirinto or not inicio or not fim:
+            return [], [], {'erro': 'Parâmetros inválidos'}
+        if not GrafoCSR.disponivel():
+            caminho, caminhos_explorados, estatisticas = AlgoritmoDijkstra.dial_busca(
+                labirinto, inicio, fim, self.registrar_exploracao
+            )
+            estatisticas['backend'] = 'python'
+            return caminho, caminhos_explorados, estatisticas
+        return self.obter_grafo_csr(labirinto).buscar(inicio, fim, self.registrar_exploracao)
+    
+    def obter_marcos(self, labirinto, quantidade=None):
+        """Retorna as tabelas de marcos ALT do labirinto, construídas uma vez por conteúdo"""
+        grade = GradeLabirinto.de(labirinto)
+        quantidade = quantidade or self.alt_num_marcos
+        return self._obter_em_cache(
+            self._marcos, (grade.impressao_digital(), quantidade),
+            lambda: TabelaMarcos(grade, quantidade)
+        )
+    
+    def encontrar_caminho_alt(self, labirinto, inicio, fim, quantidade=None, medir_economia=None):
+        """
+        A* com heurística ALT sobre as tabelas de marcos em cache.
+        
+        Com medir_economia (padrão: alt_medir_economia) roda também o A*
+        Manhattan e reporta em estatisticas['expansoes_economizadas'] quantas
+        expansões os marcos evitaram.
+        """
+        marcos = self.obter_marcos(labirinto, quantidade)
+        caminho, caminhos_explorados, estatisticas = AlgoritmoALT.busca(
+            labirinto, inicio, fim, marcos, registrar_exploracao=self.registrar_exploracao
+        )
+        estatisticas['bytes_tabelas'] = marcos.bytes_tabelas
+        
+        if self.alt_medir_economia if medir_economia is None else medir_economia:
+            _, _, manhattan = AlgoritmoAStar.a_star_busca(
+                labirinto, inicio, fim, "manhattan", registrar_exploracao=False
+            )
+            estatisticas['expansoes_manhattan'] = manhattan['nos_visitados']
+            estatisticas['expansoes_economizadas'] = manhattan['nos_visitados'] - estatisticas['nos_visitados']
+        
+        return caminho, caminhos_explorados, estatisticas
+    
+    def encontrar_caminho_ida(self, labirinto, inicio, fim):
+        """IDA* com o limite de expansões e a tabela de transposição configurados"""
+        return AlgoritmoIDAStar.ida_star_busca(
+            labirinto, inicio, fim, self.ida_limite_expansoes,
+            self.registrar_exploracao, self.ida_tamanho_transposicao
+        )
+    
+    def criar_planejador_incremental(self, labirinto, inicio, fim):
+        """
+        Cria um planejador LPA* que mantém o estado da busca entre chamadas.
+        
+        Use `planejar()` para o primeiro caminho e `alterar_celulas(...)` a
+        cada mudança no labirinto: só a parte afetada é reexpandida.
+        """
+        return PlanejadorIncremental(labirinto, inicio, fim, self.registrar_exploracao)
+
+    @staticmethod
+    def _agrupar_consultas(consultas):
+        """
+        Escolhe, para cada consulta, a célula cujo campo de distâncias a responde.
+        
+        Cada consulta fica com a ponta (início ou fim) mais compartilhada no
+        lote. Consultas que ficam sozinhas no grupo recebem None: para elas uma
+        BFS com parada antecipada sai mais barata que um campo completo.
+        """
+        frequencia = {}
+        for inicio, fim in consultas:
+            frequencia[inicio] = frequencia.get(inicio, 0) + 1
+            frequencia[fim] = frequencia.get(fim, 0) + 1
+        
+        chaves = [fim if frequencia[fim] >= frequencia[inicio] else inicio
+                  for inicio, fim in consultas]
+        tamanhos = {}
+        for chave in chaves:
+            tamanhos[chave] = tamanhos.get(chave, 0) + 1
+        
+        return [chave if tamanhos[chave] > 1 else None for chave in chaves], tamanhos
+    
+    def iterar_lote(self, labirinto, consultas):
+        """
+        Resolve várias consultas (inicio, fim) no mesmo labirinto, entregando
+        os resultados um a um, na ordem de entrada.
+        
+        Consultas que compartilham início ou fim são respondidas por um único
+        campo de distâncias (BFS completo a partir da ponta comum), do qual
+        cada caminho sai por descida gulosa. O campo é construído quando a
+        primeira consulta do grupo é entregue e liberado após a última.
+        estatisticas['tempo_amortizado'] soma a descida à fração da construção
+        do campo que cabe à consulta. Só o campo da saída do labirinto fica
+        no cache de campos (`precomputar_campo_saida`); os das outras pontas
+        são descartados ao fim do grupo.
+        
+        Args:
+            labirinto: Matriz do labirinto
+            consultas: Sequência de pares (inicio, fim)
+        
+        Yields:
+            tuple: (caminho, caminhos_explorados, estatisticas) de cada consulta
+        """
+        consultas = [(tuple(inicio), tuple(fim)) for inicio, fim in consultas]
+        chaves, tamanhos = self._agrupar_consultas(consultas)
+        return self._iterar_grupos(GradeLabirinto.de(labirinto), consultas, chaves, tamanhos)
+    
+    def _iterar_grupos(self, grade, consultas, chaves, tamanhos):
+        """Gerador de `iterar_lote` sobre consultas já agrupadas por `_agrupar_consultas`"""
+        restantes = dict(tamanhos)
+        campos = {}
+        
+        for (inicio, fim), chave in zip(consultas, chaves):
+            if not grade.livre_xy(*inicio) or not grade.livre_xy(*fim):
+                yield [], [], {
+                    'tempo_execucao': 0.0,
+                    'tempo_amortizado': 0.0,
+                    'nos_visitados': 0,
+                    'algoritmo': 'Lote (posição inválida)',
+                    'caminho_encontrado': False
+                }
+                continue
+            
+            if chave is None:
+                caminho, explorados, estatisticas = AlgoritmoBFSPredecessores.busca(
+                    grade, inicio, fim, nome='Lote (BFS individual)',
+                    registrar_exploracao=self.registrar_exploracao
+                )
+                estatisticas['tempo_amortizado'] = estatisticas['tempo_execucao']
+                estatisticas['consultas_no_grupo'] = 1
+                yield caminho, explorados, estatisticas
+                continue
+            
+            if chave not in campos:
+                # Só o campo da saída do labirinto entra no cache: os demais
+                # vivem apenas enquanto o grupo é entregue
+                campo = self._campos_saida.get((grade.impressao_digital(), chave))
+                reaproveitado = campo is not None
+                if chave == grade.saida:
+                    campo = self.precomputar_campo_saida(grade, chave)
+                elif campo is None:
+                    campo = CampoDistancias(grade, chave)
+                campos[chave] = (campo, reaproveitado)
+            campo, reaproveitado = campos[chave]
+            
+            inicio_tempo = time.perf_counter()
+            if chave == fim:
+                caminho = campo.caminho_de(inicio)
+            else:
+                caminho = campo.caminho_de(fim)[::-1]
+            tempo_descida = time.perf_counter() - inicio_tempo
+            
+            explorados = TracoExploracao.para(grade, self.registrar_exploracao)
+            for posicao in caminho:
+                explorados.append(posicao)
+            
+            construcao = 0.0 if reaproveitado else campo.tempo_construcao
+            yield caminho, explorados, {
+                'tempo_execucao': tempo_descida,
+                'tempo_amortizado': tempo_descida + construcao / tamanhos[chave],
+                'nos_visitados': len(caminho),
+                'algoritmo': 'Lote (campo de distâncias)',
+                'caminho_encontrado': len(caminho) > 0,
+                'consultas_no_grupo': tamanhos[chave],
+                'campo_reaproveitado': reaproveitado,
+                'tempo_construcao_campo': campo.tempo_construcao
+            }
+            
+            restantes[chave] -= 1
+            if restantes[chave] == 0:
+                del campos[chave]
+    
+    def resolver_lote(self, labirinto, consultas):
+        """
+        Versão em lista de `iterar_lote`, com um resumo do lote.
+        
+        Returns:
+            tuple: (resultados, resumo), com os resultados na ordem das
+            consultas e o resumo trazendo total de consultas, campos
+            construídos e tempo médio por consulta
+        """
+        inicio_tempo = time.perf_counter()
+        consultas = [(tuple(inicio), tuple(fim)) for inicio, fim in consultas]
+        chaves, tamanhos = self._agrupar_consultas(consultas)
+        resultados = list(self._iterar_grupos(GradeLabirinto.de(labirinto), consultas, chaves, tamanhos))
+        tempo_total = time.perf_counter() - inicio_tempo
+        
+        campos = {chave for chave in chaves if chave is not None}
+        return resultados, {
+            'consultas': len(consultas),
+            'campos_distancia': len(campos),
+            'buscas_individuais': chaves.count(None),
+            'caminhos_encontrados': sum(1 for _, _, stats in resultados if stats['caminho_encontrado']),
+            'tempo_total': tempo_total,
+            'tempo_por_consulta': tempo_total / len(consultas) if consultas else 0.0
+        }
+    
+    def encontrar_caminho(self, labirinto, inicio, fim, algoritmo=None):
+        """
+        Encontra um caminho usando o algoritmo especificado
+        
+        Resultados repetidos (mesmo conteúdo de labirinto, extremos e
+        algoritmo) são servidos do cache LRU; estatisticas['servido_do_cache']
+        indica a origem. Listas retornadas do cache são compartilhadas e devem
+        ser tratadas como somente leitura. Início e fim livres em componentes
+        conexas diferentes são recusados em O(1), sem busca (ver
+        `recusar_sem_caminho`).
+        
+        Args:
             labirinto: Matriz do labirinto
             inicio: Posição inicial (x, y)
             fim: Posição final (x, y)
@@ -242,43 +2019,369 @@ class GerenciadorPathfinding:
         if algoritmo is None:
             algoritmo = self.algoritmo_atual
         
-        algoritmo = algoritmo.lower()
+        algoritmo = self._nome_canonico(algoritmo)
         
-        if algoritmo == "bfs":
-            return AlgoritmoBFS.bfs_menor_caminho(labirinto, inicio, fim)
-        elif algoritmo == "bfs_otimizado":
-            return AlgoritmoBFSOtimizado.bfs_otimizado(labirinto, inicio, fim)
-        elif algoritmo in ["a_star", "astar"]:
-            return AlgoritmoAStar.a_star_busca(labirinto, inicio, fim, "manhattan")
-        elif algoritmo in ["a_star_euclidiano", "a_star_euclidiana"]:
-            return AlgoritmoAStar.a_star_busca(labirinto, inicio, fim, "euclidiana")
-        else:
+        if not labirinto or not inicio or not fim:
+            return self._executar_algoritmo(labirinto, inicio, fim, algoritmo)
+        
+        grade = GradeLabirinto.de(labirinto)
+        recusado = self._recusar_sem_caminho(grade, inicio, fim, algoritmo)
+        if recusado is not None:
+            return recusado
+        
+        if self.cache_max_entradas <= 0:
+            return self._executar_algoritmo(grade, inicio, fim, algoritmo)
+        
+        chave = self._chave_resultado(grade, inicio, fim, algoritmo)
+        
+        resultado = self._consultar_cache(chave)
+        if resultado is not None:
+            return resultado
+        
+        caminho, caminhos_explorados, estatisticas = self._executar_algoritmo(grade, inicio, fim, algoritmo)
+        estatisticas['servido_do_cache'] = False
+        self._guardar_resultado(chave, (caminho, caminhos_explorados, estatisticas))
+        
+        return caminho, caminhos_explorados, estatisticas
+    
+    def _recusar_sem_caminho(self, grade, inicio, fim, algoritmo):
+        """
+        Resultado vazio, sem busca, se início e fim são livres mas estão em
+        componentes conexas diferentes; None se a busca deve rodar.
+        
+        O índice de componentes é calculado uma vez por grade (e mantido por
+        definir_celula), então a consulta custa O(1).
+        """
+        if not self.recusar_sem_caminho or not grade.livre_xy(*inicio) or not grade.livre_xy(*fim):
+            return None
+        
+        inicio_tempo = time.perf_counter()
+        if grade.conectadas(inicio, fim):
+            return None
+        
+        return [], TracoExploracao.para(grade, self.registrar_exploracao), {
+            'tempo_execucao': time.perf_counter() - inicio_tempo,
+            'nos_visitados': 0,
+            'algoritmo': algoritmo,
+            'caminho_encontrado': False,
+            'sem_caminho_por_componentes': True
+        }
+    
+    def _consultar_cache(self, chave):
+        """Cópia do resultado em cache (marcado como servido do cache) ou None, contando acertos e falhas"""
+        with self._trava_cache:
+            entrada = self._cache_resultados.get(chave)
+            if entrada is None:
+                self.cache_falhas += 1
+                return None
+            
+            self._cache_resultados.move_to_end(chave)
+            self.cache_acertos += 1
+        caminho, caminhos_explorados, estatisticas = entrada[0]
+        return list(caminho), caminhos_explorados, dict(estatisticas, servido_do_cache=True)
+    
+    def iniciar_busca_em_passos(self, labirinto, inicio, fim, algoritmo=None, tamanho_lote=None):
+        """
+        Inicia uma busca que avança aos poucos, por BuscaEmPassos.avancar.
+        
+        BFS, BFS otimizado e A* expandem em lotes de tamanho_lote nós e
+        preenchem o traço de exploração enquanto avançam; os demais algoritmos
+        rodam inteiros no primeiro avanço. Resultados em cache retornam uma
+        busca já concluída, e buscas concluídas entram no cache.
+        
+        Returns:
+            BuscaEmPassos
+        """
+        if algoritmo is None:
+            algoritmo = self.algoritmo_atual
+        
+        algoritmo = self._nome_canonico(algoritmo)
+        tamanho_lote = tamanho_lote or BuscaEmPassos.TAMANHO_LOTE
+        
+        if not labirinto or not inicio or not fim:
+            return BuscaEmPassos.concluida_com(self._executar_algoritmo(labirinto, inicio, fim, algoritmo))
+        
+        grade = GradeLabirinto.de(labirinto)
+        recusado = self._recusar_sem_caminho(grade, inicio, fim, algoritmo)
+        if recusado is not None:
+            return BuscaEmPassos.concluida_com(recusado)
+        
+        ao_concluir = None
+        if self.cache_max_entradas > 0:
+            chave = self._chave_resultado(grade, inicio, fim, algoritmo)
+            resultado = self._consultar_cache(chave)
+            if resultado is not None:
+                return BuscaEmPassos.concluida_com(resultado)
+            
+            def ao_concluir(resultado):
+                resultado[2]['servido_do_cache'] = False
+                self._guardar_resultado(chave, resultado)
+        
+        caminhos_explorados = TracoExploracao.para(grade, self.registrar_exploracao)
+        gerador = self._passos_algoritmo(grade, inicio, fim, algoritmo, tamanho_lote, caminhos_explorados)
+        return BuscaEmPassos(gerador, caminhos_explorados, ao_concluir)
+    
+    def iniciar_busca_em_segundo_plano(self, labirinto, inicio, fim, algoritmo=None, tamanho_lote=None):
+        """
+        Inicia uma busca em passos rodando em uma thread de trabalho.
+        
+        Returns:
+            BuscaEmSegundoPlano (cancelável; o resultado fica disponível
+            quando `terminada` for True)
+        """
+        return BuscaEmSegundoPlano(
+            self.iniciar_busca_em_passos(labirinto, inicio, fim, algoritmo, tamanho_lote)
+        )
+    
+    def _passos_algoritmo(self, grade, inicio, fim, algoritmo, tamanho_lote, caminhos_explorados):
+        """Gerador da busca em passos para o algoritmo"""
+        entrada = RegistroAlgoritmos.obter(algoritmo)
+        if entrada is not None and entrada.em_passos:
+            return entrada.passos(
+                grade, inicio, fim, registrar_exploracao=self.registrar_exploracao, tamanho_lote=tamanho_lote,
+                caminhos_explorados=caminhos_explorados, **entrada.opcoes
+            )
+        return BuscaEmPassos.em_um_lote(
+            lambda: self._executar_algoritmo(grade, inicio, fim, algoritmo)
+        )
+    
+    def configurar_instrumentacao(self, ativa=None, medir_memoria=None):
+        """
+        Liga/desliga a instrumentação das buscas (ver Instrumentacao).
+        
+        A chave é global ao processo; resultados instrumentados e não
+        instrumentados ficam separados no cache.
+        """
+        Instrumentacao.configurar(ativa, medir_memoria)
+    
+    def _executar_algoritmo(self, labirinto, inicio, fim, algoritmo):
+        """
+        Executa o algoritmo; com a instrumentação ligada, algoritmos sem
+        contadores próprios recebem ao menos tempo, nós por segundo e memória
+        """
+        medicao = Instrumentacao.iniciar()
+        try:
+            resultado = self._despachar_algoritmo(labirinto, inicio, fim, algoritmo)
+            estatisticas = resultado[2]
+            if medicao is not None and 'instrumentacao' not in estatisticas and 'erro' not in estatisticas:
+                medicao.concluir(estatisticas)
+            return resultado
+        finally:
+            if medicao is not None:
+                medicao.encerrar()
+    
+    @staticmethod
+    def _nome_canonico(algoritmo):
+        """
+        Nome canônico do algoritmo registrado; nomes desconhecidos caem no A*
+        (com aviso), para que apelidos e erros de digitação não criem
+        entradas de cache próprias.
+        """
+        entrada = RegistroAlgoritmos.obter(algoritmo)
+        if entrada is None:
             print(f"⚠️ Algoritmo '{algoritmo}' não reconhecido, usando A*")
-            return AlgoritmoAStar.a_star_busca(labirinto, inicio, fim, "manhattan")
+            return "a_star"
+        return entrada.nome
+    
+    def _despachar_algoritmo(self, labirinto, inicio, fim, algoritmo):
+        """Despacha a busca para a implementação registrada do algoritmo"""
+        entrada = RegistroAlgoritmos.obter(self._nome_canonico(algoritmo))
+        
+        if entrada.metodo is not None:
+            return getattr(self, entrada.metodo)(labirinto, inicio, fim, **entrada.opcoes)
+        return entrada.funcao(labirinto, inicio, fim, registrar_exploracao=self.registrar_exploracao,
+                              **entrada.opcoes)
     
     def definir_algoritmo(self, algoritmo):
-        """Define qual algoritmo usar como padrão"""
+        """Define qual algoritmo usar como padrão (nome ou apelido registrado)"""
         algoritmo = algoritmo.lower()
-        if algoritmo in ["bfs", "bfs_otimizado", "a_star", "a_star_euclidiano", "a_star_euclidiana"]:
+        if RegistroAlgoritmos.obter(algoritmo) is not None:
             self.algoritmo_atual = algoritmo
             print(f"Algoritmo alterado para: {algoritmo}")
         else:
             print(f"Algoritmo '{algoritmo}' não suportado")
     
-    def comparar_algoritmos(self, labirinto, inicio, fim):
-        """Compara a performance de todos os algoritmos"""
+    def comparar_algoritmos(self, labirinto, inicio, fim, paralelo=None):
+        """
+        Compara a performance de todos os algoritmos.
+        
+        Em labirintos grandes os algoritmos rodam em paralelo em um pool de
+        até `max_processos` processos; a grade segue uma única vez para cada
+        processo, já compactada. Um algoritmo que passe de
+        `tempo_limite_algoritmo` segundos rodando é abandonado e aparece com
+        {'erro': ...}. Resultados já em cache não são recalculados.
+        
+        Args:
+            paralelo: True/False força o modo; None decide pelo tamanho do labirinto
+            
+        Returns:
+            dict: algoritmo -> {'caminho', 'explorados', 'estatisticas'} ou {'erro'}
+        """
+        algoritmos_teste = ["bfs", "bfs_otimizado", "bfs_bidirecional",
+                            "a_star", "a_star_euclidiano", "a_star_bidirecional", "dijkstra", "jps"]
+        
+        if paralelo is None:
+            paralelo = (bool(labirinto) and self.max_processos > 1 and
+                        len(GradeLabirinto.de(labirinto).celulas) >= self.min_celulas_paralelo)
+        
+        if paralelo and labirinto and inicio and fim:
+            grade = GradeLabirinto.de(labirinto)
+            pendentes = [alg for alg in algoritmos_teste
+                         if self._chave_resultado(grade, inicio, fim, alg) not in self._cache_resultados]
+            # Sem caminho, cada algoritmo é recusado na hora: não vale criar o pool
+            if self._recusar_sem_caminho(grade, inicio, fim, None) is not None:
+                pendentes = []
+            if len(pendentes) > 1:
+                try:
+                    calculados = self._comparar_em_processos(grade, inicio, fim, pendentes)
+                except (OSError, NotImplementedError) as e:
+                    print(f"⚠️ Pool de processos indisponível ({e}), comparando sequencialmente")
+                else:
+                    return {alg: calculados.get(alg) or self._resultado_comparacao(grade, inicio, fim, alg)
+                            for alg in algoritmos_teste}
+        
+        return {alg: self._resultado_comparacao(labirinto, inicio, fim, alg)
+                for alg in algoritmos_teste}
+    
+    def _resultado_comparacao(self, labirinto, inicio, fim, algoritmo):
+        """Executa um algoritmo no processo atual, no formato de `comparar_algoritmos`"""
+        try:
+            caminho, explorados, stats = self.encontrar_caminho(labirinto, inicio, fim, algoritmo)
+            return {
+                'caminho': caminho,
+                'explorados': explorados,
+                'estatisticas': stats
+            }
+        except Exception as e:
+            return {'erro': str(e)}
+    
+    def _comparar_em_processos(self, grade, inicio, fim, algoritmos):
+        """
+        Roda os algoritmos em até `max_processos` processos de trabalho e
+        guarda os resultados no cache.
+        
+        Cada processo recebe a grade uma vez e uma tarefa por vez, então nada
+        fica esperando em fila dentro dele: o tempo limite conta a partir do
+        aviso de início que o próprio processo envia. Um processo que estoure
+        o limite é encerrado com Process.terminate e substituído, se ainda
+        houver algoritmos pendentes.
+        """
         resultados = {}
-        algoritmos_teste = ["bfs", "bfs_otimizado", "a_star", "a_star_euclidiano"]
-        
-        for alg in algoritmos_teste:
-            try:
-                caminho, explorados, stats = self.encontrar_caminho(labirinto, inicio, fim, alg)
-                resultados[alg] = {
-                    'caminho': caminho,
-                    'explorados': explorados,
-                    'estatisticas': stats
-                }
-            except Exception as e:
-                resultados[alg] = {'erro': str(e)}
+        pendentes = deque(algoritmos)
+        contexto = multiprocessing.get_context()
+        # conexão -> [processo, algoritmo em execução, instante do aviso de início]
+        trabalhadores = {}
+        
+        def iniciar_trabalhador():
+            conexao, conexao_filho = contexto.Pipe()
+            processo = contexto.Process(
+                target=_trabalhar_em_processo,
+                args=(conexao_filho, grade, Instrumentacao.estado(), self.registrar_exploracao),
+                daemon=True
+            )
+            processo.start()
+            conexao_filho.close()
+            trabalhadores[conexao] = [processo, None, None]
+        
+        def encerrar_trabalhador(conexao, erro):
+            processo, alg, _ = trabalhadores.pop(conexao)
+            processo.terminate()
+            processo.join()
+            conexao.close()
+            if alg is not None:
+                resultados[alg] = {'erro': erro}
+            if pendentes:
+                iniciar_trabalhador()
+        
+        try:
+            for _ in range(min(self.max_processos, len(pendentes))):
+                iniciar_trabalhador()
+            
+            while pendentes or any(estado[1] for estado in trabalhadores.values()):
+                for conexao, estado in trabalhadores.items():
+                    if estado[1] is None and pendentes:
+                        estado[1], estado[2] = pendentes.popleft(), None
+                        conexao.send((tuple(inicio), tuple(fim), estado[1]))
+                
+                for conexao in multiprocessing.connection.wait(list(trabalhadores), timeout=0.05):
+                    estado = trabalhadores[conexao]
+                    try:
+                        tipo, conteudo = conexao.recv()
+                    except EOFError:
+                        encerrar_trabalhador(conexao, "Processo de trabalho terminou inesperadamente")
+                        continue
+                    
+                    if tipo == 'iniciado':
+                        estado[2] = time.perf_counter()
+                        continue
+                    
+                    alg, estado[1] = estado[1], None
+                    if tipo == 'erro':
+                        resultados[alg] = {'erro': conteudo}
+                        continue
+                    caminho, explorados, stats = conteudo
+                    stats['servido_do_cache'] = False
+                    with self._trava_cache:
+                        self.cache_falhas += 1
+                        self._guardar_resultado(self._chave_resultado(grade, inicio, fim, alg),
+                                                (caminho, explorados, stats))
+                    resultados[alg] = {'caminho': caminho, 'explorados': explorados, 'estatisticas': stats}
+                
+                agora = time.perf_counter()
+                for conexao, (_, alg, iniciado_em) in list(trabalhadores.items()):
+                    if iniciado_em is not None and agora - iniciado_em > self.tempo_limite_algoritmo:
+                        encerrar_trabalhador(conexao, f"Tempo limite de {self.tempo_limite_algoritmo:g}s excedido")
+        finally:
+            for conexao, (processo, _, _) in trabalhadores.items():
+                try:
+                    conexao.send(None)
+                except OSError:
+                    pass
+                processo.join(timeout=1.0)
+                if processo.is_alive():
+                    processo.terminate()
+                    processo.join()
+                conexao.close()
         
         return resultados
+
+# Estado dos processos de trabalho da comparação: a grade chega uma vez por processo
+_grade_processo = None
+
+def _inicializar_processo(grade, instrumentacao):
+    global _grade_processo
+    _grade_processo = grade
+    Instrumentacao.configurar(*instrumentacao)
+
+def _trabalhar_em_processo(conexao, grade, instrumentacao, registrar_exploracao):
+    """
+    Laço de um processo de trabalho da comparação: recebe (inicio, fim,
+    algoritmo), avisa que começou e devolve o resultado; None encerra.
+    """
+    _inicializar_processo(grade, instrumentacao)
+    while True:
+        tarefa = conexao.recv()
+        if tarefa is None:
+            break
+        inicio, fim, algoritmo = tarefa
+        conexao.send(('iniciado', algoritmo))
+        try:
+            resultado = _executar_em_processo(inicio, fim, algoritmo, registrar_exploracao)
+        except Exception as e:
+            conexao.send(('erro', str(e)))
+        else:
+            conexao.send(('resultado', resultado))
+    conexao.close()
+
+def _executar_em_processo(inicio, fim, algoritmo, registrar_exploracao):
+    """Executa um algoritmo sobre a grade do processo (sem cache, que não voltaria ao principal)"""
+    pathfinder = GerenciadorPathfinding()
+    pathfinder.registrar_exploracao = registrar_exploracao
+    return pathfinder._executar_algoritmo(_grade_processo, inicio, fim, algoritmo)
+
+def __getattr__(nome):
+    """Compatibilidade: AlgoritmoBFSNumpy mudou para motor_numpy, importado sob demanda"""
+    if nome == "AlgoritmoBFSNumpy":
+        from motor_numpy import AlgoritmoBFSNumpy
+        return AlgoritmoBFSNumpy
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
@@ -1,4 +1,4 @@
-from labirinto import GerenciadorLabirinto
+from labirinto import GerenciadorLabirinto, GradeLabirinto, TracoExploracao
 from pathfinding import GerenciadorPathfinding
 
 # Instância global do gerenciador de pathfinding
@@ -38,5 +38,7 @@ __all__ = [
     'eh_posicao_valida',
     'validar_labirinto',
     'GerenciadorLabirinto',
+    'GradeLabirinto',
+    'TracoExploracao',
     'GerenciadorPathfinding'
 ]
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Registro dos algoritmos de pathfinding: nomes, apelidos, capacidades e carga preguiçosa
+"""
+import importlib
+
+class AlgoritmoRegistrado:
+    """
+    Entrada do registro de algoritmos.
+    
+    A implementação é dada de uma de duas formas:
+    
+    - `funcao`: chamada como funcao(labirinto, inicio, fim,
+      registrar_exploracao=..., **opcoes). Pode ser o próprio objeto ou um
+      caminho "modulo:Classe.metodo", importado só na primeira busca — assim
+      motores pesados (NumPy, SciPy) não entram na inicialização;
+    - `metodo`: nome de um método do GerenciadorPathfinding, chamado como
+      metodo(labirinto, inicio, fim, **opcoes), para algoritmos que dependem
+      de estruturas em cache ou da configuração do gerenciador.
+    
+    `passos` (mesmas formas que `funcao`) é o gerador da busca em passos,
+    chamado com tamanho_lote e caminhos_explorados além dos argumentos acima.
+    """
+    
+    CAPACIDADES = ("ponderado", "incremental", "em_passos", "numpy")
+    
+    def __init__(self, nome, funcao=None, metodo=None, apelidos=(), opcoes=None, passos=None,
+                 ponderado=False, incremental=False, numpy=False, descricao=""):
+        if (funcao is None) == (metodo is None):
+            raise ValueError(f"Algoritmo '{nome}': informe exatamente um entre funcao e metodo")
+        self.nome = nome
+        self.apelidos = tuple(apelidos)
+        self.metodo = metodo
+        self.opcoes = dict(opcoes or {})
+        self.ponderado = ponderado
+        self.incremental = incremental
+        self.numpy = numpy
+        self.descricao = descricao
+        self._funcao = funcao
+        self._passos = passos
+    
+    @property
+    def em_passos(self):
+        """Se a busca avança em lotes (streaming) em vez de rodar inteira"""
+        return self._passos is not None
+    
+    @property
+    def capacidades(self):
+        """Conjunto com os nomes das capacidades declaradas"""
+        return frozenset(c for c in self.CAPACIDADES if getattr(self, c))
+    
+    @property
+    def carregado(self):
+        """Se a implementação já foi importada (sempre True para métodos do gerenciador)"""
+        return not isinstance(self._funcao, str)
+    
+    @property
+    def funcao(self):
+        """Função da busca, importada na primeira consulta"""
+        if isinstance(self._funcao, str):
+            self._funcao = _resolver(self._funcao)
+        return self._funcao
+    
+    @property
+    def passos(self):
+        """Gerador da busca em passos (None se o algoritmo não avança em lotes)"""
+        if isinstance(self._passos, str):
+            self._passos = _resolver(self._passos)
+        return self._passos
+    
+    def __repr__(self):
+        return f"AlgoritmoRegistrado({self.nome!r}, capacidades={sorted(self.capacidades)})"
+
+def _resolver(caminho):
+    """Importa "modulo:Classe.metodo" e retorna o objeto"""
+    modulo, _, atributos = caminho.partition(":")
+    objeto = importlib.import_module(modulo)
+    for atributo in atributos.split("."):
+        objeto = getattr(objeto, atributo)
+    return objeto
+
+class RegistroAlgoritmos:
+    """
+    Registro global dos algoritmos, consultado pelo GerenciadorPathfinding.
+    
+    Nomes e apelidos apontam para a mesma entrada, então escolher o algoritmo
+    é uma consulta a dicionário. A ordem de registro é a ordem de `nomes()`.
+    """
+    
+    _algoritmos = {}  # nome canônico -> AlgoritmoRegistrado
+    _indice = {}      # nome ou apelido -> AlgoritmoRegistrado
+    
+    @classmethod
+    def registrar(cls, nome, funcao=None, metodo=None, **parametros):
+        """
+        Registra (ou substitui) um algoritmo.
+        
+        Args:
+            nome: Nome canônico
+            funcao / metodo: Implementação (ver AlgoritmoRegistrado)
+            **parametros: apelidos, opcoes, passos, descricao e as capacidades
+                ponderado, incremental e numpy
+        
+        Returns:
+            AlgoritmoRegistrado
+        """
+        entrada = AlgoritmoRegistrado(nome, funcao, metodo, **parametros)
+        for chave in (nome,) + entrada.apelidos:
+            existente = cls._indice.get(chave)
+            if existente is not None and existente.nome != nome:
+                raise ValueError(f"'{chave}' já está registrado para o algoritmo '{existente.nome}'")
+        
+        anterior = cls._algoritmos.get(nome)
+        if anterior is not None:
+            for chave in anterior.apelidos:
+                del cls._indice[chave]
+        cls._algoritmos[nome] = entrada
+        for chave in (nome,) + entrada.apelidos:
+            cls._indice[chave] = entrada
+        return entrada
+    
+    @classmethod
+    def obter(cls, nome):
+        """Entrada do algoritmo pelo nome ou apelido (sem diferenciar maiúsculas), ou None"""
+        return cls._indice.get(nome.lower())
+    
+    @classmethod
+    def nomes(cls):
+        """Nomes canônicos, na ordem de registro"""
+        return list(cls._algoritmos)
+    
+    @classmethod
+    def com_capacidade(cls, capacidade):
+        """Nomes canônicos dos algoritmos que declaram a capacidade"""
+        if capacidade not in AlgoritmoRegistrado.CAPACIDADES:
+            raise ValueError(f"Capacidade desconhecida: {capacidade} "
+                             f"(disponíveis: {', '.join(AlgoritmoRegistrado.CAPACIDADES)})")
+        return [nome for nome, entrada in cls._algoritmos.items() if getattr(entrada, capacidade)]
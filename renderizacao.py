@@ -41,6 +41,18 @@ class GerenciadorRenderizacao:
         )
         
         self.jogo.tela.blit(imagem_redimensionada, (x_pixel, y_pixel))
+        
+        # Terreno (custo 2 a 9): chão coberto por uma camada mais opaca quanto maior o custo
+        if isinstance(tipo_celula, int) and tipo_celula > 1:
+            self._desenhar_overlay_terreno(tipo_celula, x_pixel, y_pixel)
+    
+    def _desenhar_overlay_terreno(self, custo, x, y):
+        """Desenha a camada de terreno sobre o chão"""
+        superficie = pygame.Surface((self.jogo.tamanho_celula, self.jogo.tamanho_celula))
+        superficie.set_alpha(40 + 20 * custo)
+        superficie.fill(self.jogo.config.COR_TERRENO)
+        
+        self.jogo.tela.blit(superficie, (x, y))
     
     def _obter_imagem_celula(self, tipo_celula):
         """Retorna a imagem correspondente ao tipo de célula"""
@@ -54,8 +66,8 @@ class GerenciadorRenderizacao:
     
     def desenhar_caminhos_explorados(self):
         """Desenha os caminhos explorados com transparência"""
-        for i in range(min(self.jogo.indice_exploracao, len(self.jogo.caminhos_explorados))):
-            x, y = self.jogo.caminhos_explorados[i]
+        # Fatia + iteração decodificam o traço compacto uma única vez por frame
+        for x, y in self.jogo.caminhos_explorados[:self.jogo.indice_exploracao]:
             x_pixel = self.jogo.offset_x + (x * self.jogo.tamanho_celula)
             y_pixel = self.jogo.offset_y + (y * self.jogo.tamanho_celula)
             self._desenhar_overlay_exploracao(x_pixel, y_pixel)
@@ -65,7 +77,8 @@ class GerenciadorRenderizacao:
         superficie = pygame.Surface((self.jogo.tamanho_celula, self.jogo.tamanho_celula))
         superficie.set_alpha(128)  # 50% transparente
         
-        cor = (self.jogo.config.COR_EXPLORACAO if self.jogo.caminho_encontrado 
+        cor = (self.jogo.config.COR_EXPLORACAO
+               if self.jogo.caminho_encontrado or self.jogo.busca_em_andamento is not None
                else (255, 180, 180))
         superficie.fill(cor)
         